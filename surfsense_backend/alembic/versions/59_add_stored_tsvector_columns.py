@@ -0,0 +1,70 @@
+"""59_add_stored_tsvector_columns
+
+Revision ID: 59
+Revises: 58
+Create Date: 2026-10-18
+
+Adds generated, stored content_tsv columns to chunks and documents so keyword
+search ranks against a precomputed tsvector instead of re-tokenizing content
+on every query. Adding a STORED generated column backfills existing rows.
+The expression GIN indexes on to_tsvector('english', content) are replaced by
+GIN indexes on the new columns.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import inspect
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "59"
+down_revision: str | None = "58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, new column index, old expression index)
+TSVECTOR_TABLES = [
+    ("chunks", "chunks_content_tsv_index", "chucks_search_index"),
+    ("documents", "document_content_tsv_index", "document_search_index"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add stored tsvector columns with GIN indexes."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    for table, new_index, old_index in TSVECTOR_TABLES:
+        columns = [col["name"] for col in inspector.get_columns(table)]
+
+        if "content_tsv" not in columns:
+            op.execute(
+                f"""
+                ALTER TABLE {table}
+                ADD COLUMN content_tsv tsvector
+                GENERATED ALWAYS AS (to_tsvector('english', content)) STORED
+                """
+            )
+
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {new_index} ON {table} USING gin (content_tsv)"
+        )
+        op.execute(f"DROP INDEX IF EXISTS {old_index}")
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore expression GIN indexes and drop tsvector columns."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    for table, new_index, old_index in TSVECTOR_TABLES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {old_index} ON {table} "
+            "USING gin (to_tsvector('english', content))"
+        )
+        op.execute(f"DROP INDEX IF EXISTS {new_index}")
+
+        columns = [col["name"] for col in inspector.get_columns(table)]
+        if "content_tsv" in columns:
+            op.drop_column(table, "content_tsv")
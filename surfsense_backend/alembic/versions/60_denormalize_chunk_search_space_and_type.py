@@ -0,0 +1,107 @@
+"""60_denormalize_chunk_search_space_and_type
+
+Revision ID: 60
+Revises: 59
+Create Date: 2026-10-18
+
+Adds search_space_id and document_type to chunks, copied from the parent
+document, so vector search can filter chunks by tenant and type directly
+instead of joining documents after the HNSW scan. Existing rows are
+backfilled, triggers keep the columns in sync, and composite
+(search_space_id, document_type) indexes are added to chunks and documents.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from app.db import (
+    CHUNK_DOCUMENT_FIELDS_FUNCTION_SQL,
+    CHUNK_DOCUMENT_FIELDS_TRIGGER_SQL,
+    DOCUMENT_CHUNK_FIELDS_FUNCTION_SQL,
+    DOCUMENT_CHUNK_FIELDS_TRIGGER_SQL,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "60"
+down_revision: str | None = "59"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Denormalize search space and document type onto chunks."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    if "search_space_id" not in columns:
+        op.add_column(
+            "chunks", sa.Column("search_space_id", sa.Integer(), nullable=True)
+        )
+
+    if "document_type" not in columns:
+        op.add_column(
+            "chunks",
+            sa.Column(
+                "document_type",
+                postgresql.ENUM(name="documenttype", create_type=False),
+                nullable=True,
+            ),
+        )
+
+    # Backfill from the parent documents
+    op.execute(
+        """
+        UPDATE chunks
+        SET search_space_id = documents.search_space_id,
+            document_type = documents.document_type
+        FROM documents
+        WHERE chunks.document_id = documents.id
+          AND (
+              chunks.search_space_id IS DISTINCT FROM documents.search_space_id
+              OR chunks.document_type IS DISTINCT FROM documents.document_type
+          )
+        """
+    )
+
+    # Populate the columns for new chunks, and propagate document moves/type
+    # changes to their chunks. The SQL is shared with app startup (setup_indexes)
+    op.execute(CHUNK_DOCUMENT_FIELDS_FUNCTION_SQL)
+    op.execute(CHUNK_DOCUMENT_FIELDS_TRIGGER_SQL)
+    op.execute(DOCUMENT_CHUNK_FIELDS_FUNCTION_SQL)
+    op.execute(DOCUMENT_CHUNK_FIELDS_TRIGGER_SQL)
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_chunks_search_space_id_document_type "
+        "ON chunks (search_space_id, document_type)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_documents_search_space_id_document_type "
+        "ON documents (search_space_id, document_type)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove denormalized chunk columns, triggers and indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_documents_search_space_id_document_type")
+    op.execute("DROP INDEX IF EXISTS ix_chunks_search_space_id_document_type")
+
+    op.execute(
+        "DROP TRIGGER IF EXISTS documents_propagate_chunk_fields_trigger ON documents"
+    )
+    op.execute("DROP FUNCTION IF EXISTS documents_propagate_chunk_fields()")
+    op.execute("DROP TRIGGER IF EXISTS chunks_set_document_fields_trigger ON chunks")
+    op.execute("DROP FUNCTION IF EXISTS chunks_set_document_fields()")
+
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    columns = [col["name"] for col in inspector.get_columns("chunks")]
+
+    if "document_type" in columns:
+        op.drop_column("chunks", "document_type")
+    if "search_space_id" in columns:
+        op.drop_column("chunks", "search_space_id")
@@ -0,0 +1,54 @@
+"""61_add_embedding_cache_table
+
+Revision ID: 61
+Revises: 60
+Create Date: 2026-10-18
+
+Adds embedding_cache, a content-addressed store of text embeddings keyed by
+(embedding model, sha256 of the text). Indexing looks texts up here before
+calling the embedding model, so identical chunks and summaries across
+documents and search spaces are embedded once. The embedding column is an
+untyped vector so models of different dimensions can share the table.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import inspect
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "61"
+down_revision: str | None = "60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add the embedding cache table."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+
+    if "embedding_cache" not in inspector.get_table_names():
+        op.create_table(
+            "embedding_cache",
+            sa.Column("model", sa.String(), nullable=False),
+            sa.Column("text_hash", sa.String(length=64), nullable=False),
+            sa.Column("embedding", Vector(), nullable=False),
+            sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+            sa.Column("last_used_at", sa.TIMESTAMP(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("model", "text_hash"),
+        )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used_at "
+        "ON embedding_cache (last_used_at)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the embedding cache table."""
+    op.execute("DROP INDEX IF EXISTS ix_embedding_cache_last_used_at")
+    op.execute("DROP TABLE IF EXISTS embedding_cache")
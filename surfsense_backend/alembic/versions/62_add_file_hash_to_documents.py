@@ -0,0 +1,53 @@
+"""62_add_file_hash_to_documents
+
+Revision ID: 62
+Revises: 61
+Create Date: 2026-10-18
+
+Adds file_hash to documents: the sha256 of the raw bytes of the uploaded file
+a document was created from. Uploads are looked up by (search_space_id,
+file_hash) before they are sent to an ETL service, so re-uploading the same
+file is detected without converting it again.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "62"
+down_revision: str | None = "61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add the raw file hash to documents."""
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    columns = [col["name"] for col in inspector.get_columns("documents")]
+
+    if "file_hash" not in columns:
+        op.add_column(
+            "documents", sa.Column("file_hash", sa.String(length=64), nullable=True)
+        )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_documents_search_space_id_file_hash "
+        "ON documents (search_space_id, file_hash) WHERE file_hash IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove the raw file hash from documents."""
+    op.execute("DROP INDEX IF EXISTS ix_documents_search_space_id_file_hash")
+
+    connection = op.get_bind()
+    inspector = inspect(connection)
+    columns = [col["name"] for col in inspector.get_columns("documents")]
+
+    if "file_hash" in columns:
+        op.drop_column("documents", "file_hash")
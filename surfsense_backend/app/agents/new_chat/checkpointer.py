@@ -3,15 +3,23 @@ PostgreSQL-based checkpointer for LangGraph agents.
 
 This module provides a persistent checkpointer using AsyncPostgresSaver
 that stores conversation state in the PostgreSQL database.
+
+The checkpointer is backed by a psycopg AsyncConnectionPool, so checkpoint
+reads and writes of concurrent chat streams run on separate connections
+instead of serializing on a single one. Connections are health-checked when
+they are handed out, and idle connections above the minimum pool size are
+closed after CHECKPOINTER_POOL_MAX_IDLE_SECONDS.
 """
 
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 from app.config import config
 
 # Global checkpointer instance (initialized lazily)
 _checkpointer: AsyncPostgresSaver | None = None
-_checkpointer_context = None  # Store the context manager for cleanup
+_checkpointer_pool: AsyncConnectionPool | None = None
 _checkpointer_initialized: bool = False
 
 
@@ -38,6 +46,35 @@ def get_postgres_connection_string() -> str:
     return db_url
 
 
+def create_checkpointer_pool(
+    min_size: int | None = None, max_size: int | None = None
+) -> AsyncConnectionPool:
+    """
+    Create an unopened connection pool configured for AsyncPostgresSaver.
+
+    Args:
+        min_size: Connections kept open, defaults to CHECKPOINTER_POOL_MIN_SIZE
+        max_size: Maximum connections, defaults to CHECKPOINTER_POOL_MAX_SIZE
+
+    Returns:
+        AsyncConnectionPool: The pool; open it with `await pool.open()`
+    """
+    min_size = min_size if min_size is not None else config.CHECKPOINTER_POOL_MIN_SIZE
+    max_size = max_size if max_size is not None else config.CHECKPOINTER_POOL_MAX_SIZE
+    return AsyncConnectionPool(
+        get_postgres_connection_string(),
+        min_size=max(1, min_size),
+        max_size=max(1, min_size, max_size),
+        max_idle=config.CHECKPOINTER_POOL_MAX_IDLE_SECONDS,
+        # Same connection settings AsyncPostgresSaver.from_conn_string uses
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        # Hand out only connections that still answer, replacing dropped ones
+        check=AsyncConnectionPool.check_connection,
+        open=False,
+        name="langgraph-checkpointer",
+    )
+
+
 async def get_checkpointer() -> AsyncPostgresSaver:
     """
     Get or create the global AsyncPostgresSaver instance.
@@ -50,14 +87,12 @@ async def get_checkpointer() -> AsyncPostgresSaver:
     Returns:
         AsyncPostgresSaver: The configured checkpointer instance
     """
-    global _checkpointer, _checkpointer_context, _checkpointer_initialized
+    global _checkpointer, _checkpointer_pool, _checkpointer_initialized
 
     if _checkpointer is None:
-        conn_string = get_postgres_connection_string()
-        # from_conn_string returns an async context manager
-        # We need to enter the context to get the actual checkpointer
-        _checkpointer_context = AsyncPostgresSaver.from_conn_string(conn_string)
-        _checkpointer = await _checkpointer_context.__aenter__()
+        _checkpointer_pool = create_checkpointer_pool()
+        await _checkpointer_pool.open(wait=True)
+        _checkpointer = AsyncPostgresSaver(_checkpointer_pool)
 
     # Setup tables on first call (idempotent)
     if not _checkpointer_initialized:
@@ -80,15 +115,15 @@ async def setup_checkpointer_tables() -> None:
 
 async def close_checkpointer() -> None:
     """
-    Close the checkpointer connection.
+    Close the checkpointer connection pool.
 
     This should be called during application shutdown.
     """
-    global _checkpointer, _checkpointer_context, _checkpointer_initialized
+    global _checkpointer, _checkpointer_pool, _checkpointer_initialized
 
-    if _checkpointer_context is not None:
-        await _checkpointer_context.__aexit__(None, None, None)
+    if _checkpointer_pool is not None:
+        await _checkpointer_pool.close()
         _checkpointer = None
-        _checkpointer_context = None
+        _checkpointer_pool = None
         _checkpointer_initialized = False
-        print("[Checkpointer] PostgreSQL connection closed")
+        print("[Checkpointer] PostgreSQL connection pool closed")
@@ -8,14 +8,20 @@ This module provides:
 - Tool factory for creating search_knowledge_base tools
 """
 
+import asyncio
 import json
+import logging
 from datetime import datetime
 from typing import Any
 
 from langchain_core.tools import tool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import config
 from app.services.connector_service import ConnectorService
+from app.services.reranker_service import RerankerService
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Connector Constants and Normalization
@@ -50,6 +56,14 @@ _ALL_CONNECTORS: list[str] = [
     "CIRCLEBACK",
 ]
 
+# Connectors backed by live external search APIs rather than indexed documents
+_LIVE_SEARCH_CONNECTORS: set[str] = {
+    "TAVILY_API",
+    "SEARXNG_API",
+    "LINKUP_API",
+    "BAIDU_SEARCH_API",
+}
+
 
 def _normalize_connectors(connectors_to_search: list[str] | None) -> list[str]:
     """
@@ -222,6 +236,276 @@ def format_documents_for_context(documents: list[dict[str, Any]]) -> str:
 # =============================================================================
 
 
+async def _search_connector(
+    connector_service: ConnectorService,
+    connector: str,
+    query: str,
+    search_space_id: int,
+    top_k: int,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> list[dict[str, Any]]:
+    """
+    Search a single connector and return its document-grouped results.
+
+    Args:
+        connector_service: Initialized connector service
+        connector: Canonical connector type to search
+        query: The search query
+        search_space_id: The user's search space ID
+        top_k: Number of results to retrieve
+        start_date: Start datetime (UTC) for filtering documents
+        end_date: End datetime (UTC) for filtering documents
+
+    Returns:
+        List of results for the connector (empty for unknown connectors)
+    """
+    if connector == "YOUTUBE_VIDEO":
+        _, chunks = await connector_service.search_youtube(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "EXTENSION":
+        _, chunks = await connector_service.search_extension(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "CRAWLED_URL":
+        _, chunks = await connector_service.search_crawled_urls(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "FILE":
+        _, chunks = await connector_service.search_files(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "SLACK_CONNECTOR":
+        _, chunks = await connector_service.search_slack(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "NOTION_CONNECTOR":
+        _, chunks = await connector_service.search_notion(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "GITHUB_CONNECTOR":
+        _, chunks = await connector_service.search_github(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "LINEAR_CONNECTOR":
+        _, chunks = await connector_service.search_linear(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "TAVILY_API":
+        _, chunks = await connector_service.search_tavily(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+        )
+        return chunks
+
+    elif connector == "SEARXNG_API":
+        _, chunks = await connector_service.search_searxng(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+        )
+        return chunks
+
+    elif connector == "LINKUP_API":
+        # Keep behavior aligned with researcher: default "standard"
+        _, chunks = await connector_service.search_linkup(
+            user_query=query,
+            search_space_id=search_space_id,
+            mode="standard",
+        )
+        return chunks
+
+    elif connector == "BAIDU_SEARCH_API":
+        _, chunks = await connector_service.search_baidu(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+        )
+        return chunks
+
+    elif connector == "DISCORD_CONNECTOR":
+        _, chunks = await connector_service.search_discord(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "JIRA_CONNECTOR":
+        _, chunks = await connector_service.search_jira(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "GOOGLE_CALENDAR_CONNECTOR":
+        _, chunks = await connector_service.search_google_calendar(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "AIRTABLE_CONNECTOR":
+        _, chunks = await connector_service.search_airtable(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "GOOGLE_GMAIL_CONNECTOR":
+        _, chunks = await connector_service.search_google_gmail(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "GOOGLE_DRIVE_FILE":
+        _, chunks = await connector_service.search_google_drive(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "CONFLUENCE_CONNECTOR":
+        _, chunks = await connector_service.search_confluence(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "CLICKUP_CONNECTOR":
+        _, chunks = await connector_service.search_clickup(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "LUMA_CONNECTOR":
+        _, chunks = await connector_service.search_luma(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "ELASTICSEARCH_CONNECTOR":
+        _, chunks = await connector_service.search_elasticsearch(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "NOTE":
+        _, chunks = await connector_service.search_notes(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "BOOKSTACK_CONNECTOR":
+        _, chunks = await connector_service.search_bookstack(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    elif connector == "CIRCLEBACK":
+        _, chunks = await connector_service.search_circleback(
+            user_query=query,
+            search_space_id=search_space_id,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return chunks
+
+    return []
+
+
 async def search_knowledge_base_async(
     query: str,
     search_space_id: int,
@@ -262,254 +546,78 @@ async def search_knowledge_base_async(
 
     connectors = _normalize_connectors(connectors_to_search)
 
-    for connector in connectors:
-        try:
-            if connector == "YOUTUBE_VIDEO":
-                _, chunks = await connector_service.search_youtube(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "EXTENSION":
-                _, chunks = await connector_service.search_extension(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CRAWLED_URL":
-                _, chunks = await connector_service.search_crawled_urls(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "FILE":
-                _, chunks = await connector_service.search_files(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "SLACK_CONNECTOR":
-                _, chunks = await connector_service.search_slack(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "NOTION_CONNECTOR":
-                _, chunks = await connector_service.search_notion(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GITHUB_CONNECTOR":
-                _, chunks = await connector_service.search_github(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
+    # Search connectors concurrently when the connector service opens its own
+    # short-lived sessions; a shared session only allows one search at a time.
+    concurrency = (
+        max(1, config.KNOWLEDGE_BASE_SEARCH_CONCURRENCY)
+        if connector_service.session_factory is not None
+        else 1
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    timeout = config.KNOWLEDGE_BASE_SEARCH_TIMEOUT_SECONDS
+
+    async def _run_search(connector: str) -> list[dict[str, Any]]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    _search_connector(
+                        connector_service,
+                        connector,
+                        query,
+                        search_space_id,
+                        top_k,
+                        resolved_start_date,
+                        resolved_end_date,
+                    ),
+                    timeout=timeout,
                 )
-                all_documents.extend(chunks)
-
-            elif connector == "LINEAR_CONNECTOR":
-                _, chunks = await connector_service.search_linear(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
+            except TimeoutError:
+                logger.warning(
+                    f"Timed out searching connector {connector} after {timeout}s"
                 )
-                all_documents.extend(chunks)
-
-            elif connector == "TAVILY_API":
-                _, chunks = await connector_service.search_tavily(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
+                return []
+            except Exception as e:
+                logger.error(f"Error searching connector {connector}: {e}")
+                return []
+
+    # Start live web searches first so they overlap with the database searches
+    search_tasks: dict[str, asyncio.Task] = {
+        connector: asyncio.create_task(_run_search(connector))
+        for connector in connectors
+        if connector in _LIVE_SEARCH_CONNECTORS
+    }
+
+    # Search all indexed document types with one chunk-level and one document-level
+    # query; the per-connector calls below are then served from these results.
+    indexed_document_types = [c for c in connectors if c not in _LIVE_SEARCH_CONNECTORS]
+    if len(indexed_document_types) > 1:
+        async with semaphore:
+            try:
+                await asyncio.wait_for(
+                    connector_service.prefetch_combined_rrf_search(
+                        query_text=query,
+                        search_space_id=search_space_id,
+                        document_types=indexed_document_types,
+                        top_k=top_k,
+                        start_date=resolved_start_date,
+                        end_date=resolved_end_date,
+                    ),
+                    timeout=timeout,
                 )
-                all_documents.extend(chunks)
+            except Exception as e:
+                # Fall back to per-connector searches
+                logger.warning(f"Error prefetching knowledge base search: {e!r}")
 
-            elif connector == "SEARXNG_API":
-                _, chunks = await connector_service.search_searxng(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "LINKUP_API":
-                # Keep behavior aligned with researcher: default "standard"
-                _, chunks = await connector_service.search_linkup(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    mode="standard",
-                )
-                all_documents.extend(chunks)
+    for connector in indexed_document_types:
+        search_tasks[connector] = asyncio.create_task(_run_search(connector))
 
-            elif connector == "BAIDU_SEARCH_API":
-                _, chunks = await connector_service.search_baidu(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "DISCORD_CONNECTOR":
-                _, chunks = await connector_service.search_discord(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "JIRA_CONNECTOR":
-                _, chunks = await connector_service.search_jira(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_CALENDAR_CONNECTOR":
-                _, chunks = await connector_service.search_google_calendar(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "AIRTABLE_CONNECTOR":
-                _, chunks = await connector_service.search_airtable(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_GMAIL_CONNECTOR":
-                _, chunks = await connector_service.search_google_gmail(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "GOOGLE_DRIVE_FILE":
-                _, chunks = await connector_service.search_google_drive(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CONFLUENCE_CONNECTOR":
-                _, chunks = await connector_service.search_confluence(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CLICKUP_CONNECTOR":
-                _, chunks = await connector_service.search_clickup(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "LUMA_CONNECTOR":
-                _, chunks = await connector_service.search_luma(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "ELASTICSEARCH_CONNECTOR":
-                _, chunks = await connector_service.search_elasticsearch(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "NOTE":
-                _, chunks = await connector_service.search_notes(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "BOOKSTACK_CONNECTOR":
-                _, chunks = await connector_service.search_bookstack(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
-
-            elif connector == "CIRCLEBACK":
-                _, chunks = await connector_service.search_circleback(
-                    user_query=query,
-                    search_space_id=search_space_id,
-                    top_k=top_k,
-                    start_date=resolved_start_date,
-                    end_date=resolved_end_date,
-                )
-                all_documents.extend(chunks)
+    # Collect results in connector order so deduplication stays deterministic
+    for connector in connectors:
+        all_documents.extend(await search_tasks[connector])
 
-        except Exception as e:
-            print(f"Error searching connector {connector}: {e}")
-            continue
+    logger.debug(
+        f"Query embedding cache stats: {connector_service.query_embeddings.stats()}"
+    )
 
     # Deduplicate by content hash
     seen_doc_ids: set[Any] = set()
@@ -528,6 +636,11 @@ async def search_knowledge_base_async(
         seen_hashes.add(content_hash)
         deduplicated.append(doc)
 
+    # Rerank the merged results of all connectors when a reranker is configured
+    reranker = RerankerService.get_reranker_instance()
+    if reranker is not None and deduplicated:
+        deduplicated = await reranker.arerank_documents(query, deduplicated)
+
     return format_documents_for_context(deduplicated)
 
 
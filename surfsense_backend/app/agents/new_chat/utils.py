@@ -47,6 +47,10 @@ def resolve_date_range(
     Resolve a date range, defaulting to the last 2 years if not provided.
     Ensures start_date <= end_date.
 
+    A missing end date resolves to the start of the next hour rather than the
+    current instant, so repeated searches with the default range use the same
+    range (and retrieval cache key) for an hour. No document is updated later.
+
     Args:
         start_date: Optional start datetime (UTC)
         end_date: Optional end datetime (UTC)
@@ -54,7 +58,10 @@ def resolve_date_range(
     Returns:
         Tuple of (resolved_start_date, resolved_end_date) in UTC
     """
-    resolved_end = end_date or datetime.now(UTC)
+    resolved_end = end_date or (
+        datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        + timedelta(hours=1)
+    )
     resolved_start = start_date or (resolved_end - timedelta(days=730))
 
     if resolved_start > resolved_end:
@@ -13,6 +13,9 @@ from app.config import config
 from app.db import User, create_db_and_tables, get_async_session
 from app.routes import router as crud_router
 from app.schemas import UserCreate, UserRead, UserUpdate
+from app.services.browser_pool_service import close_browser_pool
+from app.services.docling_service import shutdown_docling_workers
+from app.services.stt_service import shutdown_stt_workers
 from app.users import SECRET, auth_backend, current_active_user, fastapi_users
 
 
@@ -23,8 +26,11 @@ async def lifespan(app: FastAPI):
     # Setup LangGraph checkpointer tables for conversation persistence
     await setup_checkpointer_tables()
     yield
-    # Cleanup: close checkpointer connection on shutdown
+    # Cleanup: close checkpointer connection, shared browser, Docling and STT workers
     await close_checkpointer()
+    await close_browser_pool()
+    shutdown_docling_workers()
+    shutdown_stt_workers()
 
 
 def registration_allowed():
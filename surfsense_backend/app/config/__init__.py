@@ -63,6 +63,13 @@ class Config:
 
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # LangGraph checkpointer connection pool | Connections kept open, maximum
+    # connections, and seconds before idle connections above the minimum close
+    CHECKPOINTER_POOL_MIN_SIZE = int(os.getenv("CHECKPOINTER_POOL_MIN_SIZE", "2"))
+    CHECKPOINTER_POOL_MAX_SIZE = int(os.getenv("CHECKPOINTER_POOL_MAX_SIZE", "20"))
+    CHECKPOINTER_POOL_MAX_IDLE_SECONDS = float(
+        os.getenv("CHECKPOINTER_POOL_MAX_IDLE_SECONDS", "300")
+    )
 
     NEXT_FRONTEND_URL = os.getenv("NEXT_FRONTEND_URL")
     # Backend URL to override the http to https in the OAuth redirect URI
@@ -154,6 +161,64 @@ class Config:
         chunk_size=getattr(embedding_model_instance, "max_seq_length", 512)
     )
 
+    # Embedding batching | Chunks are sent to the embedding model in batches of at
+    # most EMBEDDING_BATCH_SIZE texts and EMBEDDING_BATCH_MAX_CHARS characters
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    EMBEDDING_BATCH_MAX_CHARS = int(os.getenv("EMBEDDING_BATCH_MAX_CHARS", "200000"))
+
+    # Query embedding cache | Process-wide LRU of query embeddings keyed by
+    # (embedding model, query text)
+    QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS = float(
+        os.getenv("QUERY_EMBEDDING_CACHE_TTL_SECONDS", "3600")
+    )
+
+    # Document embedding cache | Embeddings of indexed text stored in Postgres,
+    # keyed by (embedding model, sha256 of text), with least recently used
+    # entries evicted beyond EMBEDDING_CACHE_MAX_ENTRIES
+    EMBEDDING_CACHE_ENABLED = (
+        os.getenv("EMBEDDING_CACHE_ENABLED", "TRUE").upper() == "TRUE"
+    )
+    EMBEDDING_CACHE_MAX_ENTRIES = int(
+        os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "1000000")
+    )
+    # New entries written between two eviction passes, per process
+    EMBEDDING_CACHE_EVICTION_INTERVAL = int(
+        os.getenv("EMBEDDING_CACHE_EVICTION_INTERVAL", "1000")
+    )
+
+    # Vector search | HNSW iterative index scans (pgvector >= 0.8) keep scanning until
+    # enough rows pass the search space filter: "strict_order", "relaxed_order" or "off"
+    VECTOR_ITERATIVE_SCAN = os.getenv("VECTOR_ITERATIVE_SCAN", "strict_order")
+    VECTOR_MAX_SCAN_TUPLES = int(os.getenv("VECTOR_MAX_SCAN_TUPLES", "20000"))
+
+    # Knowledge base search fan-out | Max connector searches running at once and
+    # per-source timeout so one slow search cannot stall the whole tool call
+    KNOWLEDGE_BASE_SEARCH_CONCURRENCY = int(
+        os.getenv("KNOWLEDGE_BASE_SEARCH_CONCURRENCY", "4")
+    )
+    KNOWLEDGE_BASE_SEARCH_TIMEOUT_SECONDS = float(
+        os.getenv("KNOWLEDGE_BASE_SEARCH_TIMEOUT_SECONDS", "30")
+    )
+
+    # Retrieval result cache | Invalidated per search space whenever its documents
+    # change. Uses Redis (defaults to the Celery broker); disabled without Redis
+    RETRIEVAL_CACHE_ENABLED = (
+        os.getenv("RETRIEVAL_CACHE_ENABLED", "TRUE").upper() == "TRUE"
+    )
+    RETRIEVAL_CACHE_REDIS_URL = os.getenv(
+        "RETRIEVAL_CACHE_REDIS_URL", os.getenv("CELERY_BROKER_URL")
+    )
+    RETRIEVAL_CACHE_TTL_SECONDS = int(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "600"))
+
+    # Chunks returned per retrieved document | "window" keeps the matched chunks plus
+    # neighbours within a token budget, "full" returns every chunk of the document
+    RETRIEVAL_CONTEXT_MODE = os.getenv("RETRIEVAL_CONTEXT_MODE", "window").lower()
+    RETRIEVAL_CONTEXT_NEIGHBOURS = int(os.getenv("RETRIEVAL_CONTEXT_NEIGHBOURS", "2"))
+    RETRIEVAL_CONTEXT_MAX_TOKENS_PER_DOCUMENT = int(
+        os.getenv("RETRIEVAL_CONTEXT_MAX_TOKENS_PER_DOCUMENT", "4000")
+    )
+
     # Reranker's Configuration | Pinecode, Cohere etc. Read more at https://github.com/AnswerDotAI/rerankers?tab=readme-ov-file#usage
     RERANKERS_ENABLED = os.getenv("RERANKERS_ENABLED", "FALSE").upper() == "TRUE"
     if RERANKERS_ENABLED:
@@ -165,6 +230,49 @@ class Config:
         )
     else:
         reranker_instance = None
+    # Candidates are truncated to the model's max input length (falls back to this
+    # many tokens) and ranked in batches on a dedicated thread pool
+    RERANKERS_MAX_INPUT_TOKENS = int(os.getenv("RERANKERS_MAX_INPUT_TOKENS", "512"))
+    RERANKERS_BATCH_SIZE = int(os.getenv("RERANKERS_BATCH_SIZE", "32"))
+    RERANKERS_MAX_WORKERS = int(os.getenv("RERANKERS_MAX_WORKERS", "1"))
+
+    # Shared headless Chromium for crawling, webpage scraping and link previews
+    BROWSER_POOL_MAX_PAGES = int(os.getenv("BROWSER_POOL_MAX_PAGES", "4"))
+    BROWSER_POOL_RECYCLE_AFTER = int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "200"))
+
+    # Webcrawler indexing pipeline | Concurrent page fetches (with per-domain
+    # politeness limits), content extraction threads, concurrent summarization /
+    # embedding, and documents written per commit
+    WEBCRAWLER_FETCH_CONCURRENCY = int(os.getenv("WEBCRAWLER_FETCH_CONCURRENCY", "8"))
+    WEBCRAWLER_PER_DOMAIN_CONCURRENCY = int(
+        os.getenv("WEBCRAWLER_PER_DOMAIN_CONCURRENCY", "2")
+    )
+    WEBCRAWLER_DOMAIN_DELAY_SECONDS = float(
+        os.getenv("WEBCRAWLER_DOMAIN_DELAY_SECONDS", "1.0")
+    )
+    WEBCRAWLER_EXTRACT_CONCURRENCY = int(
+        os.getenv("WEBCRAWLER_EXTRACT_CONCURRENCY", "4")
+    )
+    WEBCRAWLER_PROCESS_CONCURRENCY = int(
+        os.getenv("WEBCRAWLER_PROCESS_CONCURRENCY", "4")
+    )
+    WEBCRAWLER_COMMIT_BATCH_SIZE = int(os.getenv("WEBCRAWLER_COMMIT_BATCH_SIZE", "10"))
+
+    # GitHub file contents downloaded concurrently while indexing
+    GITHUB_BLOB_FETCH_CONCURRENCY = int(os.getenv("GITHUB_BLOB_FETCH_CONCURRENCY", "8"))
+
+    # Notion indexing | Notion allows an average of 3 requests per second per
+    # integration; pages are fetched concurrently within that limit
+    NOTION_REQUESTS_PER_SECOND = float(os.getenv("NOTION_REQUESTS_PER_SECOND", "3"))
+    NOTION_MAX_CONCURRENT_REQUESTS = int(
+        os.getenv("NOTION_MAX_CONCURRENT_REQUESTS", "3")
+    )
+    NOTION_PAGE_CONCURRENCY = int(os.getenv("NOTION_PAGE_CONCURRENCY", "4"))
+
+    # Bulk document writes | New documents and their chunks are buffered and
+    # written with multi-row inserts once either limit is reached
+    BULK_WRITE_FLUSH_SIZE = int(os.getenv("BULK_WRITE_FLUSH_SIZE", "50"))
+    BULK_WRITE_MAX_BUFFER_MB = int(os.getenv("BULK_WRITE_MAX_BUFFER_MB", "64"))
 
     # OAuth JWT
     SECRET_KEY = os.getenv("SECRET_KEY")
@@ -183,6 +291,28 @@ class Config:
         # LlamaCloud API Key
         LLAMA_CLOUD_API_KEY = os.getenv("LLAMA_CLOUD_API_KEY")
 
+    # Docling large document summarization | Chunk summaries run concurrently with
+    # retries and are kept in Redis (defaults to the Celery broker) so a retried
+    # task resumes instead of starting over
+    DOCLING_SUMMARY_CONCURRENCY = int(os.getenv("DOCLING_SUMMARY_CONCURRENCY", "4"))
+    DOCLING_SUMMARY_MAX_RETRIES = int(os.getenv("DOCLING_SUMMARY_MAX_RETRIES", "3"))
+    DOCLING_SUMMARY_CACHE_REDIS_URL = os.getenv(
+        "DOCLING_SUMMARY_CACHE_REDIS_URL", os.getenv("CELERY_BROKER_URL")
+    )
+    DOCLING_SUMMARY_CACHE_TTL_SECONDS = int(
+        os.getenv("DOCLING_SUMMARY_CACHE_TTL_SECONDS", "604800")
+    )
+    # Docling conversion | Worker processes that each load the Docling models once,
+    # and the number of conversions that may run or wait for a worker at once
+    DOCLING_CONVERSION_WORKERS = int(os.getenv("DOCLING_CONVERSION_WORKERS", "2"))
+    DOCLING_CONVERSION_QUEUE_SIZE = int(os.getenv("DOCLING_CONVERSION_QUEUE_SIZE", "8"))
+    # Page-streaming ETL | PDFs with at least this many pages (0 disables streaming)
+    # are converted, chunked and embedded this many pages at a time
+    ETL_STREAMING_PAGE_THRESHOLD = int(os.getenv("ETL_STREAMING_PAGE_THRESHOLD", "200"))
+    ETL_STREAMING_PAGES_PER_SLICE = int(
+        os.getenv("ETL_STREAMING_PAGES_PER_SLICE", "25")
+    )
+
     # Litellm TTS Configuration
     TTS_SERVICE = os.getenv("TTS_SERVICE")
     TTS_SERVICE_API_BASE = os.getenv("TTS_SERVICE_API_BASE")
@@ -192,6 +322,13 @@ class Config:
     STT_SERVICE = os.getenv("STT_SERVICE")
     STT_SERVICE_API_BASE = os.getenv("STT_SERVICE_API_BASE")
     STT_SERVICE_API_KEY = os.getenv("STT_SERVICE_API_KEY")
+    # Local STT | Worker processes that each load the Whisper model once, windows
+    # transcribed or queued at once, per-request timeout and the length of the
+    # windows long recordings are split into at silences
+    STT_WORKERS = int(os.getenv("STT_WORKERS", "2"))
+    STT_QUEUE_SIZE = int(os.getenv("STT_QUEUE_SIZE", "8"))
+    STT_TIMEOUT_SECONDS = float(os.getenv("STT_TIMEOUT_SECONDS", "1800"))
+    STT_SEGMENT_SECONDS = float(os.getenv("STT_SEGMENT_SECONDS", "300"))
 
     # Validation Checks
     # Check embedding dimension
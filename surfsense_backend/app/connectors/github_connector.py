@@ -98,6 +98,8 @@ class GitHubConnector:
         """
         if not token:
             raise ValueError("GitHub token cannot be empty.")
+        # Repository objects by full name, so each is fetched once
+        self._repositories: dict[str, Any] = {}
         try:
             self.gh = github_login(token=token)
             # Try a simple authenticated call to check token validity
@@ -135,11 +137,37 @@ class GitHubConnector:
             logger.error(f"Failed to fetch GitHub repositories: {e}")
             return []  # Return empty list on error
 
+    def _get_repository(self, repo_full_name: str):
+        """Fetch a repository once and reuse it for later calls."""
+        if repo_full_name not in self._repositories:
+            owner, repo_name = repo_full_name.split("/")
+            self._repositories[repo_full_name] = self.gh.repository(owner, repo_name)
+        return self._repositories[repo_full_name]
+
+    @staticmethod
+    def _indexable_file_type(name: str, size: int, path: str) -> str | None:
+        """Return "code" or "doc" for relevant files within the size limit."""
+        file_extension = "." + name.split(".")[-1].lower() if "." in name else ""
+        is_code = file_extension in CODE_EXTENSIONS
+        is_doc = file_extension in DOC_EXTENSIONS
+
+        if (is_code or is_doc) and size <= MAX_FILE_SIZE:
+            return "code" if is_code else "doc"
+        if size > MAX_FILE_SIZE:
+            logger.debug(f"Skipping large file: {path} ({size} bytes)")
+        else:
+            logger.debug(f"Skipping irrelevant file type: {path}")
+        return None
+
     def get_repository_files(
         self, repo_full_name: str, path: str = ""
     ) -> list[dict[str, Any]]:
         """
-        Recursively fetches details of relevant files (code, docs) within a repository path.
+        Fetches details of relevant files (code, docs) within a repository path.
+
+        The whole repository is listed with a single recursive git tree request.
+        If GitHub truncates the tree (very large repositories), falls back to
+        walking directories one by one.
 
         Args:
             repo_full_name: The full name of the repository (e.g., 'owner/repo').
@@ -149,10 +177,72 @@ class GitHubConnector:
             A list of dictionaries, each containing file details (path, sha, url, size).
             Returns an empty list if the repository or path is not found or on error.
         """
+        try:
+            repo = self._get_repository(repo_full_name)
+            if not repo:
+                logger.warning(f"Repository '{repo_full_name}' not found.")
+                return []
+
+            branch = repo.default_branch
+            tree = repo.tree(branch, recursive=True)
+            if tree.as_dict().get("truncated"):
+                logger.info(
+                    f"Git tree of '{repo_full_name}' is truncated, listing directories instead."
+                )
+                return self._list_directory_files(repo_full_name, path)
+
+            prefix = f"{path.strip('/')}/" if path.strip("/") else ""
+            files_list = []
+            for entry in tree.tree:
+                if entry.type != "blob" or not entry.path.startswith(prefix):
+                    continue
+
+                *directories, name = entry.path.split("/")
+                skipped_dir = next(
+                    (d for d in directories if d in self.SKIPPED_DIRS), None
+                )
+                if skipped_dir:
+                    logger.debug(f"Skipping file in {skipped_dir}: {entry.path}")
+                    continue
+
+                size = entry.size or 0
+                file_type = self._indexable_file_type(name, size, entry.path)
+                if file_type:
+                    files_list.append(
+                        {
+                            "path": entry.path,
+                            "sha": entry.sha,
+                            "url": f"{repo.html_url}/blob/{branch}/{entry.path}",
+                            "size": size,
+                            "type": file_type,
+                        }
+                    )
+            return files_list
+
+        except (NotFoundError, ForbiddenError) as e:
+            logger.warning(f"Cannot access path '{path}' in '{repo_full_name}': {e}")
+        except Exception as e:
+            logger.error(
+                f"Failed to get files for {repo_full_name} at path '{path}': {e}"
+            )
+        return []
+
+    def _list_directory_files(
+        self, repo_full_name: str, path: str = ""
+    ) -> list[dict[str, Any]]:
+        """
+        Recursively fetches details of relevant files one directory at a time.
+
+        Args:
+            repo_full_name: The full name of the repository (e.g., 'owner/repo').
+            path: The starting path within the repository (default is root).
+
+        Returns:
+            A list of dictionaries, each containing file details (path, sha, url, size).
+        """
         files_list = []
         try:
-            owner, repo_name = repo_full_name.split("/")
-            repo = self.gh.repository(owner, repo_name)
+            repo = self._get_repository(repo_full_name)
             if not repo:
                 logger.warning(f"Repository '{repo_full_name}' not found.")
                 return []
@@ -173,38 +263,25 @@ class GitHubConnector:
 
                     # Recursively fetch contents of subdirectory
                     files_list.extend(
-                        self.get_repository_files(
+                        self._list_directory_files(
                             repo_full_name, path=content_item.path
                         )
                     )
                 elif content_item.type == "file":
                     # Check if the file extension is relevant and size is within limits
-                    file_extension = (
-                        "." + content_item.name.split(".")[-1].lower()
-                        if "." in content_item.name
-                        else ""
+                    file_type = self._indexable_file_type(
+                        content_item.name, content_item.size, content_item.path
                     )
-                    is_code = file_extension in CODE_EXTENSIONS
-                    is_doc = file_extension in DOC_EXTENSIONS
-
-                    if (is_code or is_doc) and content_item.size <= MAX_FILE_SIZE:
+                    if file_type:
                         files_list.append(
                             {
                                 "path": content_item.path,
                                 "sha": content_item.sha,
                                 "url": content_item.html_url,
                                 "size": content_item.size,
-                                "type": "code" if is_code else "doc",
+                                "type": file_type,
                             }
                         )
-                    elif content_item.size > MAX_FILE_SIZE:
-                        logger.debug(
-                            f"Skipping large file: {content_item.path} ({content_item.size} bytes)"
-                        )
-                    else:
-                        logger.debug(
-                            f"Skipping irrelevant file type: {content_item.path}"
-                        )
 
         except (NotFoundError, ForbiddenError) as e:
             logger.warning(f"Cannot access path '{path}' in '{repo_full_name}': {e}")
@@ -216,6 +293,74 @@ class GitHubConnector:
 
         return files_list
 
+    def get_blob_content(
+        self, repo_full_name: str, file_sha: str, file_path: str = ""
+    ) -> str | None:
+        """
+        Fetches the decoded content of a file by its git blob sha.
+
+        Blobs are addressed by content, so this needs no path lookup and works for
+        any file listed by `get_repository_files`.
+
+        Args:
+            repo_full_name: The full name of the repository (e.g., 'owner/repo').
+            file_sha: The git blob sha of the file.
+            file_path: The file path, used for logging only.
+
+        Returns:
+            The decoded file content as a string, or None if fetching fails or file is too large.
+        """
+        label = file_path or file_sha
+        try:
+            repo = self._get_repository(repo_full_name)
+            if not repo:
+                logger.warning(
+                    f"Repository '{repo_full_name}' not found when fetching file '{label}'."
+                )
+                return None
+
+            blob = repo.blob(file_sha)
+            if blob.size > MAX_FILE_SIZE:
+                logger.warning(
+                    f"File '{label}' in '{repo_full_name}' exceeds max size ({blob.size} > {MAX_FILE_SIZE}). Skipping content fetch."
+                )
+                return None
+
+            if not blob.content:
+                return ""  # Return empty string for empty files
+            if blob.encoding != "base64":
+                return blob.content
+            return self._decode_content(blob.content, repo_full_name, label)
+
+        except (NotFoundError, ForbiddenError) as e:
+            logger.warning(f"Cannot access file '{label}' in '{repo_full_name}': {e}")
+            return None
+        except Exception as e:
+            logger.error(
+                f"Failed to get content for file '{label}' in '{repo_full_name}': {e}"
+            )
+            return None
+
+    @staticmethod
+    def _decode_content(
+        encoded_content: str, repo_full_name: str, file_path: str
+    ) -> str | None:
+        """Decode base64 file content as UTF-8, falling back to latin-1."""
+        try:
+            return base64.b64decode(encoded_content).decode("utf-8")
+        except UnicodeDecodeError:
+            logger.warning(
+                f"Could not decode file '{file_path}' in '{repo_full_name}' as UTF-8. Trying with 'latin-1'."
+            )
+            try:
+                # Try a fallback encoding
+                return base64.b64decode(encoded_content).decode("latin-1")
+            except Exception as decode_err:
+                logger.error(
+                    f"Failed to decode file '{file_path}' with fallback encoding: {decode_err}"
+                )
+                return None  # Give up if fallback fails
+
     def get_file_content(self, repo_full_name: str, file_path: str) -> str | None:
         """
         Fetches the decoded content of a specific file.
@@ -228,8 +373,7 @@ class GitHubConnector:
             The decoded file content as a string, or None if fetching fails or file is too large.
         """
         try:
-            owner, repo_name = repo_full_name.split("/")
-            repo = self.gh.repository(owner, repo_name)
+            repo = self._get_repository(repo_full_name)
             if not repo:
                 logger.warning(
                     f"Repository '{repo_full_name}' not found when fetching file '{file_path}'."
@@ -258,26 +402,9 @@ class GitHubConnector:
 
             # Content is base64 encoded
             if content_item.content:
-                try:
-                    decoded_content = base64.b64decode(content_item.content).decode(
-                        "utf-8"
-                    )
-                    return decoded_content
-                except UnicodeDecodeError:
-                    logger.warning(
-                        f"Could not decode file '{file_path}' in '{repo_full_name}' as UTF-8. Trying with 'latin-1'."
-                    )
-                    try:
-                        # Try a fallback encoding
-                        decoded_content = base64.b64decode(content_item.content).decode(
-                            "latin-1"
-                        )
-                        return decoded_content
-                    except Exception as decode_err:
-                        logger.error(
-                            f"Failed to decode file '{file_path}' with fallback encoding: {decode_err}"
-                        )
-                        return None  # Give up if fallback fails
+                return self._decode_content(
+                    content_item.content, repo_full_name, file_path
+                )
             else:
                 logger.warning(
                     f"No content returned for file '{file_path}' in '{repo_full_name}'. It might be empty."
@@ -1,6 +1,10 @@
+import asyncio
 import logging
+import time
+from collections import Counter
 
 from notion_client import AsyncClient
+from notion_client.errors import APIErrorCode, APIResponseError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -12,6 +16,53 @@ from app.utils.oauth_security import TokenEncryption
 
 logger = logging.getLogger(__name__)
 
+# Retries of a request rejected by Notion's rate limit before giving up
+_RATE_LIMIT_RETRIES = 5
+
+
+class _NotionRateLimiter:
+    """
+    Keeps requests under Notion's average rate limit (3 requests per second per
+    integration) and bounds the number of requests in flight.
+    """
+
+    def __init__(self, requests_per_second: float, max_concurrent: int):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+    async def _wait_for_slot(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at)
+            self._next_request_at = request_at + self.interval
+        if request_at > now:
+            await asyncio.sleep(request_at - now)
+
+    def pause(self, seconds: float) -> None:
+        """Delay every following request, e.g. after a rate-limited response."""
+        self._next_request_at = max(self._next_request_at, time.monotonic() + seconds)
+
+    async def call(self, request, *args, **kwargs):
+        """Run a Notion API request, retrying when it is rate limited."""
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            async with self._semaphore:
+                await self._wait_for_slot()
+                try:
+                    return await request(*args, **kwargs)
+                except APIResponseError as e:
+                    if (
+                        e.code != APIErrorCode.RateLimited
+                        or attempt == _RATE_LIMIT_RETRIES
+                    ):
+                        raise
+                    retry_after = float(e.headers.get("retry-after", 1) or 1)
+                    logger.warning(
+                        f"Notion rate limit hit, retrying in {retry_after:.1f}s"
+                    )
+                    self.pause(retry_after)
+
 
 class NotionHistoryConnector:
     def __init__(
@@ -32,6 +83,11 @@ class NotionHistoryConnector:
         self._connector_id = connector_id
         self._credentials = credentials
         self._notion_client: AsyncClient | None = None
+        self._rate_limiter = _NotionRateLimiter(
+            config.NOTION_REQUESTS_PER_SECOND, config.NOTION_MAX_CONCURRENT_REQUESTS
+        )
+        # Number of Notion API calls made to fetch each page's content
+        self.api_calls_per_page: Counter[str] = Counter()
 
     async def _get_valid_token(self) -> str:
         """
@@ -217,7 +273,9 @@ class NotionHistoryConnector:
             if cursor:
                 search_params["start_cursor"] = cursor
 
-            search_results = await notion.search(**search_params)
+            search_results = await self._rate_limiter.call(
+                notion.search, **search_params
+            )
 
             pages.extend(search_results["results"])
             has_more = search_results.get("has_more", False)
@@ -225,23 +283,33 @@ class NotionHistoryConnector:
             if has_more:
                 cursor = search_results.get("next_cursor")
 
-        all_page_data = []
+        # Fetch the content of several pages at once; requests of all pages share
+        # the rate limiter
+        page_semaphore = asyncio.Semaphore(max(1, config.NOTION_PAGE_CONCURRENCY))
 
-        for page in pages:
+        async def fetch_page(page):
             page_id = page["id"]
-
-            # Get detailed page information
-            page_content = await self.get_page_content(page_id)
-
-            all_page_data.append(
-                {
-                    "page_id": page_id,
-                    "title": self.get_page_title(page),
-                    "content": page_content,
-                }
+            async with page_semaphore:
+                # Get detailed page information
+                page_content = await self.get_page_content(page_id)
+            logger.debug(
+                f"Fetched Notion page {page_id} with "
+                f"{self.api_calls_per_page[page_id]} API calls"
             )
+            return {
+                "page_id": page_id,
+                "title": self.get_page_title(page),
+                "content": page_content,
+                "api_calls": self.api_calls_per_page[page_id],
+            }
 
-        return all_page_data
+        all_page_data = await asyncio.gather(*(fetch_page(page) for page in pages))
+
+        logger.info(
+            f"Fetched {len(pages)} Notion pages with "
+            f"{sum(self.api_calls_per_page.values())} block API calls"
+        )
+        return list(all_page_data)
 
     def get_page_title(self, page):
         """
@@ -265,15 +333,16 @@ class NotionHistoryConnector:
         # If no title found, return the page ID as fallback
         return f"Untitled page ({page['id']})"
 
-    async def get_page_content(self, page_id):
+    async def _list_children(self, block_id, page_id=None):
         """
-        Fetches the content (blocks) of a specific page.
+        Fetches all child blocks of a block or page, following pagination.
 
         Args:
-            page_id (str): The ID of the page to fetch
+            block_id (str): The ID of the block or page
+            page_id (str, optional): Page the API calls are counted against
 
         Returns:
-            list: List of processed blocks from the page
+            list: Child block objects
         """
         notion = await self._get_client()
 
@@ -283,39 +352,60 @@ class NotionHistoryConnector:
 
         # Paginate through all blocks
         while has_more:
+            params = {"block_id": block_id}
             if cursor:
-                response = await notion.blocks.children.list(
-                    block_id=page_id, start_cursor=cursor
-                )
-            else:
-                response = await notion.blocks.children.list(block_id=page_id)
+                params["start_cursor"] = cursor
+
+            response = await self._rate_limiter.call(
+                notion.blocks.children.list, **params
+            )
+            self.api_calls_per_page[page_id or block_id] += 1
 
             blocks.extend(response["results"])
-            has_more = response["has_more"]
+            has_more = response.get("has_more", False)
 
             if has_more:
                 cursor = response["next_cursor"]
 
-        # Process nested blocks recursively
-        processed_blocks = []
-        for block in blocks:
-            processed_block = await self.process_block(block)
-            processed_blocks.append(processed_block)
+        return blocks
 
-        return processed_blocks
+    async def get_page_content(self, page_id):
+        """
+        Fetches the content (blocks) of a specific page.
+
+        Sibling subtrees are fetched concurrently, within the connector's Notion
+        rate limit.
+
+        Args:
+            page_id (str): The ID of the page to fetch
 
-    async def process_block(self, block):
+        Returns:
+            list: List of processed blocks from the page
+        """
+        # Make sure the client (and a refreshed token) exists before fanning out
+        await self._get_client()
+
+        self.api_calls_per_page[page_id] = 0
+        blocks = await self._list_children(page_id, page_id)
+
+        # Process nested blocks recursively
+        return list(
+            await asyncio.gather(
+                *(self.process_block(block, page_id) for block in blocks)
+            )
+        )
+
+    async def process_block(self, block, page_id=None):
         """
         Processes a block and recursively fetches any child blocks.
 
         Args:
             block (dict): The block to process
+            page_id (str, optional): Page the API calls are counted against
 
         Returns:
             dict: Processed block with content and children
         """
-        notion = await self._get_client()
-
         block_id = block["id"]
         block_type = block["type"]
 
@@ -327,10 +417,13 @@ class NotionHistoryConnector:
         child_blocks = []
 
         if has_children:
-            # Fetch and process child blocks
-            children_response = await notion.blocks.children.list(block_id=block_id)
-            for child_block in children_response["results"]:
-                child_blocks.append(await self.process_block(child_block))
+            # Fetch all pages of child blocks, then process them concurrently
+            children = await self._list_children(block_id, page_id)
+            child_blocks = list(
+                await asyncio.gather(
+                    *(self.process_block(child, page_id) for child in children)
+                )
+            )
 
         return {
             "id": block_id,
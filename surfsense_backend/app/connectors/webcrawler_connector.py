@@ -5,6 +5,7 @@ A module for crawling web pages and extracting content using Firecrawl or Playwr
 Provides a unified interface for web scraping.
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,7 +13,8 @@ import trafilatura
 import validators
 from fake_useragent import UserAgent
 from firecrawl import AsyncFirecrawlApp
-from playwright.async_api import async_playwright
+
+from app.services.browser_pool_service import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,33 @@ class WebCrawlerConnector:
                 - source: Original URL
                 - crawler_type: Type of crawler used ("firecrawl" or "chromium")
         """
+        fetched, error = await self.fetch_url(url, formats)
+        if error:
+            return None, error
+
+        try:
+            # Content extraction is CPU-bound, keep it off the event loop
+            result = await asyncio.to_thread(self.extract_content, url, fetched)
+            return result, None
+        except Exception as e:
+            return None, f"Error crawling URL {url}: {e!s}"
+
+    async def fetch_url(
+        self, url: str, formats: list[str] | None = None
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Fetch a single URL without extracting its content.
+
+        Firecrawl results are returned already extracted. Chromium results hold the
+        raw page and must be passed to `extract_content`, which `crawl_url` does.
+
+        Args:
+            url: URL to fetch
+            formats: List of formats to extract (e.g., ["markdown", "html"]) - only for Firecrawl
+
+        Returns:
+            Tuple containing (fetch result dict, error message or None)
+        """
         try:
             # Validate URL
             if not validators.url(url):
@@ -80,7 +109,7 @@ class WebCrawlerConnector:
                         f"[webcrawler] Firecrawl failed, falling back to Chromium+Trafilatura for: {url}"
                     )
                     try:
-                        result = await self._crawl_with_chromium(url)
+                        result = await self._fetch_with_chromium(url)
                         return result, None
                     except Exception as chromium_error:
                         return (
@@ -90,7 +119,7 @@ class WebCrawlerConnector:
             else:
                 # No Firecrawl API key, use Chromium directly
                 logger.info(f"[webcrawler] Using Chromium+Trafilatura for: {url}")
-                result = await self._crawl_with_chromium(url)
+                result = await self._fetch_with_chromium(url)
                 return result, None
 
         except Exception as e:
@@ -147,40 +176,58 @@ class WebCrawlerConnector:
             "crawler_type": "firecrawl",
         }
 
-    async def _crawl_with_chromium(self, url: str) -> dict[str, Any]:
+    async def _fetch_with_chromium(self, url: str) -> dict[str, Any]:
         """
-        Crawl URL using Playwright with Trafilatura for content extraction.
-        Falls back to raw HTML if Trafilatura extraction fails.
+        Fetch URL using the shared Playwright Chromium browser.
 
         Args:
-            url: URL to crawl
+            url: URL to fetch
 
         Returns:
-            Dict containing crawled content and metadata
+            Dict containing the raw HTML and page title
 
         Raises:
-            Exception: If crawling fails
+            Exception: If fetching fails
         """
         # Generate a realistic User-Agent to avoid bot detection
         ua = UserAgent()
         user_agent = ua.random
 
-        # Use Playwright to fetch the page
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=user_agent)
-            page = await context.new_page()
-
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                raw_html = await page.content()
-                page_title = await page.title()
-            finally:
-                await browser.close()
+        # Fetch the page with the shared Chromium browser
+        raw_html, page_title = await get_browser_pool().fetch_html(
+            url, user_agent=user_agent
+        )
 
         if not raw_html:
             raise ValueError(f"Failed to load content from {url}")
 
+        return {
+            "raw_html": raw_html,
+            "page_title": page_title,
+            "crawler_type": "chromium",
+        }
+
+    def extract_content(self, url: str, fetched: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract content from a `fetch_url` result.
+
+        Chromium pages are extracted with Trafilatura, falling back to raw HTML if
+        extraction fails. Firecrawl results are returned unchanged. This is
+        CPU-bound and synchronous; run it in a thread from async code.
+
+        Args:
+            url: URL the result was fetched from
+            fetched: Result of `fetch_url`
+
+        Returns:
+            Dict containing crawled content and metadata
+        """
+        if "raw_html" not in fetched:
+            return fetched
+
+        raw_html = fetched["raw_html"]
+        page_title = fetched.get("page_title")
+
         # Extract basic metadata from the page
         base_metadata = {"title": page_title} if page_title else {}
 
@@ -11,17 +11,27 @@ from sqlalchemy import (
     TIMESTAMP,
     Boolean,
     Column,
+    Computed,
     Enum as SQLAlchemyEnum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    event,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, relationship
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    declared_attr,
+    deferred,
+    relationship,
+)
 
 from app.config import config
 
@@ -384,6 +394,19 @@ class NewChatMessage(BaseModel, TimestampMixin):
 
 class Document(BaseModel, TimestampMixin):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index(
+            "ix_documents_search_space_id_document_type",
+            "search_space_id",
+            "document_type",
+        ),
+        Index(
+            "ix_documents_search_space_id_file_hash",
+            "search_space_id",
+            "file_hash",
+            postgresql_where=text("file_hash IS NOT NULL"),
+        ),
+    )
 
     title = Column(String, nullable=False, index=True)
     document_type = Column(SQLAlchemyEnum(DocumentType), nullable=False)
@@ -394,6 +417,14 @@ class Document(BaseModel, TimestampMixin):
     unique_identifier_hash = Column(String, nullable=True, index=True, unique=True)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
 
+    # sha256 of the raw uploaded file, checked before a re-upload is sent to ETL
+    file_hash = Column(String(64), nullable=True)
+
+    # Stored full-text search vector, kept in sync with content by Postgres
+    content_tsv = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
+
     # BlockNote live editing state (NULL when never edited)
     blocknote_document = Column(JSONB, nullable=True)
 
@@ -416,16 +447,56 @@ class Document(BaseModel, TimestampMixin):
 
 class Chunk(BaseModel, TimestampMixin):
     __tablename__ = "chunks"
+    __table_args__ = (
+        Index(
+            "ix_chunks_search_space_id_document_type",
+            "search_space_id",
+            "document_type",
+        ),
+    )
 
     content = Column(Text, nullable=False)
     embedding = Column(Vector(config.embedding_model_instance.dimension))
 
+    # Denormalized from the parent document so vector search can filter chunks by
+    # search space and type without joining documents. Populated by a database
+    # trigger on insert (see migration 60), so callers never set these.
+    search_space_id = Column(Integer, nullable=True)
+    document_type = Column(SQLAlchemyEnum(DocumentType), nullable=True)
+
+    # Stored full-text search vector, kept in sync with content by Postgres
+    content_tsv = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True))
+    )
+
     document_id = Column(
         Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
     )
     document = relationship("Document", back_populates="chunks")
 
 
+class EmbeddingCache(Base):
+    """Content-addressed embeddings, keyed by embedding model and text hash."""
+
+    __tablename__ = "embedding_cache"
+
+    model = Column(String, primary_key=True)
+    # sha256 hex digest of the embedded text
+    text_hash = Column(String(64), primary_key=True)
+    # Untyped vector so models of different dimensions can share the table
+    embedding = Column(Vector(), nullable=False)
+    created_at = Column(
+        TIMESTAMP(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+    # Refreshed on cache hits; least recently used entries are evicted first
+    last_used_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        index=True,
+    )
+
+
 class Podcast(BaseModel, TimestampMixin):
     """Podcast model for storing generated podcasts."""
 
@@ -820,10 +891,74 @@ else:
         pages_used = Column(Integer, nullable=False, default=0, server_default="0")
 
 
+@event.listens_for(Session, "after_flush")
+def _track_written_search_spaces(session, _flush_context):
+    """Remember which search spaces had documents written in this transaction."""
+    written = session.info.setdefault("written_search_space_ids", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Document) and obj.search_space_id is not None:
+            written.add(obj.search_space_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_retrieval_cache(session):
+    """Bump the content version of search spaces written in the committed transaction."""
+    written = session.info.pop("written_search_space_ids", None)
+    if written:
+        from app.services.retrieval_cache_service import bump_search_space_versions
+
+        bump_search_space_versions(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_search_spaces(session):
+    session.info.pop("written_search_space_ids", None)
+
+
 engine = create_async_engine(DATABASE_URL)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
+CHUNK_DOCUMENT_FIELDS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION chunks_set_document_fields() RETURNS trigger AS $$
+BEGIN
+    SELECT search_space_id, document_type
+    INTO NEW.search_space_id, NEW.document_type
+    FROM documents WHERE id = NEW.document_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+CHUNK_DOCUMENT_FIELDS_TRIGGER_SQL = """
+CREATE OR REPLACE TRIGGER chunks_set_document_fields_trigger
+BEFORE INSERT OR UPDATE OF document_id ON chunks
+FOR EACH ROW EXECUTE FUNCTION chunks_set_document_fields()
+"""
+
+DOCUMENT_CHUNK_FIELDS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION documents_propagate_chunk_fields() RETURNS trigger AS $$
+BEGIN
+    UPDATE chunks
+    SET search_space_id = NEW.search_space_id, document_type = NEW.document_type
+    WHERE document_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+DOCUMENT_CHUNK_FIELDS_TRIGGER_SQL = """
+CREATE OR REPLACE TRIGGER documents_propagate_chunk_fields_trigger
+AFTER UPDATE OF search_space_id, document_type ON documents
+FOR EACH ROW
+WHEN (
+    OLD.search_space_id IS DISTINCT FROM NEW.search_space_id
+    OR OLD.document_type IS DISTINCT FROM NEW.document_type
+)
+EXECUTE FUNCTION documents_propagate_chunk_fields()
+"""
+
+
 async def setup_indexes():
     async with engine.begin() as conn:
         # Create indexes
@@ -835,7 +970,7 @@ async def setup_indexes():
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS document_search_index ON documents USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS document_content_tsv_index ON documents USING gin (content_tsv)"
             )
         )
         # Document Chuck Indexes
@@ -846,9 +981,15 @@ async def setup_indexes():
         )
         await conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS chucks_search_index ON chunks USING gin (to_tsvector('english', content))"
+                "CREATE INDEX IF NOT EXISTS chunks_content_tsv_index ON chunks USING gin (content_tsv)"
             )
         )
+        # Keep the denormalized chunk search_space_id/document_type in sync with the
+        # parent document
+        await conn.execute(text(CHUNK_DOCUMENT_FIELDS_FUNCTION_SQL))
+        await conn.execute(text(CHUNK_DOCUMENT_FIELDS_TRIGGER_SQL))
+        await conn.execute(text(DOCUMENT_CHUNK_FIELDS_FUNCTION_SQL))
+        await conn.execute(text(DOCUMENT_CHUNK_FIELDS_TRIGGER_SQL))
 
 
 async def create_db_and_tables():
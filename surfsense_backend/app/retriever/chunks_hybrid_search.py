@@ -1,15 +1,44 @@
 from datetime import datetime
 
+from app.retriever.context_window import fetch_document_chunks
+from app.retriever.query_embedding_cache import RequestQueryEmbeddings
+from app.retriever.vector_index import enable_iterative_index_scan
+
+
+def _projected_chunk_columns(chunk_model, document_model) -> tuple:
+    """
+    Loader options limiting chunk entities to the columns search results use.
+
+    The chunk's document is populated from the query's own join, and neither
+    embeddings nor the document's content and editor state are loaded.
+    """
+    from sqlalchemy.orm import contains_eager, load_only
+
+    return (
+        load_only(chunk_model.id, chunk_model.content, chunk_model.document_id),
+        contains_eager(chunk_model.document).load_only(
+            document_model.id,
+            document_model.title,
+            document_model.document_type,
+            document_model.document_metadata,
+        ),
+    )
+
 
 class ChucksHybridSearchRetriever:
-    def __init__(self, db_session):
+    def __init__(
+        self, db_session, query_embeddings: RequestQueryEmbeddings | None = None
+    ):
         """
         Initialize the hybrid search retriever with a database session.
 
         Args:
             db_session: SQLAlchemy AsyncSession from FastAPI dependency injection
+            query_embeddings: Optional per-request query embedding memo shared with
+                other retrievers so each query is embedded only once
         """
         self.db_session = db_session
+        self.query_embeddings = query_embeddings or RequestQueryEmbeddings()
 
     async def vector_search(
         self,
@@ -33,21 +62,18 @@ class ChucksHybridSearchRetriever:
             List of chunks sorted by vector similarity
         """
         from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Chunk, Document
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
 
         # Build the query filtered by search space
         query = (
             select(Chunk)
-            .options(joinedload(Chunk.document).joinedload(Document.search_space))
             .join(Document, Chunk.document_id == Document.id)
-            .where(Document.search_space_id == search_space_id)
+            .options(*_projected_chunk_columns(Chunk, Document))
+            .where(Chunk.search_space_id == search_space_id)
         )
 
         # Add time-based filtering if provided
@@ -60,6 +86,7 @@ class ChucksHybridSearchRetriever:
         query = query.order_by(Chunk.embedding.op("<=>")(query_embedding)).limit(top_k)
 
         # Execute the query
+        await enable_iterative_index_scan(self.db_session)
         result = await self.db_session.execute(query)
         chunks = result.scalars().all()
 
@@ -87,20 +114,19 @@ class ChucksHybridSearchRetriever:
             List of chunks sorted by text relevance
         """
         from sqlalchemy import func, select
-        from sqlalchemy.orm import joinedload
 
         from app.db import Chunk, Document
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Chunk.content_tsv
         tsquery = func.plainto_tsquery("english", query_text)
 
         # Build the query filtered by search space
         query = (
             select(Chunk)
-            .options(joinedload(Chunk.document).joinedload(Document.search_space))
             .join(Document, Chunk.document_id == Document.id)
-            .where(Document.search_space_id == search_space_id)
+            .options(*_projected_chunk_columns(Chunk, Document))
+            .where(Chunk.search_space_id == search_space_id)
             .where(
                 tsvector.op("@@")(tsquery)
             )  # Only include results that match the query
@@ -152,25 +178,24 @@ class ChucksHybridSearchRetriever:
               - document: {id, title, document_type, metadata}
         """
         from sqlalchemy import func, select, text
-        from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Chunk, Document, DocumentType
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
 
         # RRF constants
         k = 60
         n_results = top_k * 5  # Fetch extra chunks for better document-level fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Chunk.content)
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Chunk.content_tsv
         tsquery = func.plainto_tsquery("english", query_text)
 
-        # Base conditions for chunk filtering - search space is required
-        base_conditions = [Document.search_space_id == search_space_id]
+        # Base conditions for chunk filtering - search space is required. Search space
+        # and type are filtered on the denormalized chunk columns so the vector scan
+        # can reject other tenants' chunks without joining documents.
+        base_conditions = [Chunk.search_space_id == search_space_id]
 
         # Add document type filter if provided
         if document_type is not None:
@@ -178,12 +203,12 @@ class ChucksHybridSearchRetriever:
             if isinstance(document_type, str):
                 try:
                     doc_type_enum = DocumentType[document_type]
-                    base_conditions.append(Document.document_type == doc_type_enum)
+                    base_conditions.append(Chunk.document_type == doc_type_enum)
                 except KeyError:
                     # If the document type doesn't exist in the enum, return empty results
                     return []
             else:
-                base_conditions.append(Document.document_type == document_type)
+                base_conditions.append(Chunk.document_type == document_type)
 
         # Add time-based filtering if provided
         if start_date is not None:
@@ -228,10 +253,16 @@ class ChucksHybridSearchRetriever:
             .cte("keyword_search")
         )
 
-        # Final combined query using a FULL OUTER JOIN with RRF scoring
+        # Final combined query using a FULL OUTER JOIN with RRF scoring. Only the
+        # columns that are serialized are selected, so the documents' full content,
+        # embeddings and editor state are never transferred or turned into entities.
         final_query = (
             select(
-                Chunk,
+                Chunk.id,
+                Chunk.document_id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
                 (
                     func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0)
                     + func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
@@ -249,102 +280,64 @@ class ChucksHybridSearchRetriever:
                 Chunk.id
                 == func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id),
             )
-            .options(joinedload(Chunk.document))
+            .join(Document, Chunk.document_id == Document.id)
             .order_by(text("score DESC"))
             .limit(top_k)
         )
 
         # Execute the query
+        await enable_iterative_index_scan(self.db_session)
         result = await self.db_session.execute(final_query)
-        chunks_with_scores = result.all()
+        rows = result.all()
 
         # If no results were found, return an empty list
-        if not chunks_with_scores:
+        if not rows:
             return []
 
-        # Convert to serializable dictionaries
-        serialized_chunk_results: list[dict] = []
-        for chunk, score in chunks_with_scores:
-            serialized_chunk_results.append(
-                {
-                    "chunk_id": chunk.id,
-                    "content": chunk.content,
-                    "score": float(score),  # Ensure score is a Python float
-                    "document": {
-                        "id": chunk.document.id,
-                        "title": chunk.document.title,
-                        "document_type": chunk.document.document_type.value
-                        if hasattr(chunk.document, "document_type")
-                        else None,
-                        "metadata": chunk.document.document_metadata,
-                    },
-                }
-            )
-
         # Group by document, preserving ranking order by best chunk rank
         doc_scores: dict[int, float] = {}
         doc_order: list[int] = []
-        for item in serialized_chunk_results:
-            doc_id = item.get("document", {}).get("id")
-            if doc_id is None:
-                continue
+        matched_chunk_ids: dict[int, list[int]] = {}
+        doc_info: dict[int, dict] = {}
+        for chunk_id, doc_id, title, doc_type, metadata, score in rows:
             if doc_id not in doc_scores:
-                doc_scores[doc_id] = item.get("score", 0.0)
+                doc_scores[doc_id] = float(score)
                 doc_order.append(doc_id)
             else:
                 # Use the best score as doc score
-                doc_scores[doc_id] = max(doc_scores[doc_id], item.get("score", 0.0))
+                doc_scores[doc_id] = max(doc_scores[doc_id], float(score))
+            matched_chunk_ids.setdefault(doc_id, []).append(chunk_id)
+            doc_info[doc_id] = {
+                "id": doc_id,
+                "title": title,
+                "document_type": doc_type.value if doc_type else None,
+                "metadata": metadata or {},
+            }
 
         # Keep only top_k documents by initial rank order.
         doc_ids = doc_order[:top_k]
         if not doc_ids:
             return []
 
-        # Fetch ALL chunks for selected documents in a single query so the final prompt can cite
-        # any chunk from those documents.
-        chunk_query = (
-            select(Chunk)
-            .options(joinedload(Chunk.document))
-            .join(Document, Chunk.document_id == Document.id)
-            .where(Document.id.in_(doc_ids))
-            .where(*base_conditions)
-            .order_by(Chunk.document_id, Chunk.id)
+        # Fetch the chunks to cite for the selected documents: the matched chunks and
+        # their neighbours (or every chunk in "full" context mode)
+        chunks_by_doc = await fetch_document_chunks(
+            self.db_session, doc_ids, matched_chunk_ids
         )
-        chunks_result = await self.db_session.execute(chunk_query)
-        all_chunks = chunks_result.scalars().all()
 
         # Assemble final doc-grouped results in the same order as doc_ids
         doc_map: dict[int, dict] = {
             doc_id: {
                 "document_id": doc_id,
                 "content": "",
-                "score": float(doc_scores.get(doc_id, 0.0)),
-                "chunks": [],
-                "document": {},
-                "source": None,
+                "score": doc_scores[doc_id],
+                "chunks": chunks_by_doc.get(doc_id, []),
+                "document": doc_info[doc_id],
+                "source": doc_info[doc_id]["document_type"],
             }
             for doc_id in doc_ids
         }
 
-        for chunk in all_chunks:
-            doc = chunk.document
-            doc_id = doc.id
-            if doc_id not in doc_map:
-                continue
-            doc_entry = doc_map[doc_id]
-            doc_entry["document"] = {
-                "id": doc.id,
-                "title": doc.title,
-                "document_type": doc.document_type.value
-                if getattr(doc, "document_type", None)
-                else None,
-                "metadata": doc.document_metadata or {},
-            }
-            doc_entry["source"] = (
-                doc.document_type.value if getattr(doc, "document_type", None) else None
-            )
-            doc_entry["chunks"].append({"chunk_id": chunk.id, "content": chunk.content})
-
         # Fill concatenated content (useful for reranking)
         final_docs: list[dict] = []
         for doc_id in doc_ids:
@@ -355,3 +348,199 @@ class ChucksHybridSearchRetriever:
             final_docs.append(entry)
 
         return final_docs
+
+    async def hybrid_search_multi(
+        self,
+        query_text: str,
+        top_k: int,
+        search_space_id: int,
+        document_types: list[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, list]:
+        """
+        Run `hybrid_search` for several document types in a single pass.
+
+        The semantic and keyword searches of each type are the bounded searches
+        `hybrid_search(document_type=...)` runs, combined with UNION ALL, so each
+        type gets exactly the results it would return, but with one ranking query
+        and one chunk-fetch query instead of two per type.
+
+        Args:
+            query_text: The search query text
+            top_k: Number of documents to return per document type
+            search_space_id: The search space ID to search within
+            document_types: Document types to search (e.g., ["FILE", "CRAWLED_URL"])
+            start_date: Optional start date for filtering documents by updated_at
+            end_date: Optional end date for filtering documents by updated_at
+
+        Returns:
+            Dict mapping each requested document type to its list of
+            document-grouped results (same shape as `hybrid_search`).
+        """
+        from sqlalchemy import func, select, union_all
+
+        from app.db import Chunk, Document, DocumentType
+
+        results: dict[str, list] = {doc_type: [] for doc_type in document_types}
+
+        # Unknown document types simply yield no results, like hybrid_search
+        doc_type_enums = [
+            DocumentType[doc_type]
+            for doc_type in document_types
+            if doc_type in DocumentType.__members__
+        ]
+        if not doc_type_enums:
+            return results
+
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
+
+        # RRF constants
+        k = 60
+        n_results = top_k * 5  # Fetch extra chunks for better document-level fusion
+
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Chunk.content_tsv
+        tsquery = func.plainto_tsquery("english", query_text)
+
+        base_conditions = [Chunk.search_space_id == search_space_id]
+        if start_date is not None:
+            base_conditions.append(Document.updated_at >= start_date)
+        if end_date is not None:
+            base_conditions.append(Document.updated_at <= end_date)
+
+        # One bounded search per document type, as hybrid_search runs it, so each
+        # type is an index scan with its own LIMIT rather than a ranking of every
+        # chunk in the search space
+        def per_type_ranks(order_by, *conditions):
+            return union_all(
+                *(
+                    select(
+                        Chunk.id,
+                        Chunk.document_type,
+                        func.rank().over(order_by=order_by).label("rank"),
+                    )
+                    .join(Document, Chunk.document_id == Document.id)
+                    .where(*base_conditions, Chunk.document_type == doc_type_enum)
+                    .where(*conditions)
+                    .order_by(order_by)
+                    .limit(n_results)
+                    for doc_type_enum in doc_type_enums
+                )
+            )
+
+        # Semantic ranks per document type, keeping the top n_results of each type
+        semantic_search_cte = per_type_ranks(
+            Chunk.embedding.op("<=>")(query_embedding)
+        ).cte("semantic_search")
+
+        # Keyword ranks per document type, keeping the top n_results of each type
+        keyword_search_cte = per_type_ranks(
+            func.ts_rank_cd(tsvector, tsquery).desc(), tsvector.op("@@")(tsquery)
+        ).cte("keyword_search")
+
+        # RRF score per chunk, keeping the top_k chunks of each document type
+        score = func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0) + (
+            func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
+        )
+        chunk_id = func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id)
+        document_type = func.coalesce(
+            semantic_search_cte.c.document_type, keyword_search_cte.c.document_type
+        )
+        scored = (
+            select(
+                chunk_id.label("chunk_id"),
+                document_type.label("document_type"),
+                score.label("score"),
+                func.row_number()
+                .over(partition_by=document_type, order_by=score.desc())
+                .label("row_num"),
+            )
+            .select_from(
+                semantic_search_cte.outerjoin(
+                    keyword_search_cte,
+                    semantic_search_cte.c.id == keyword_search_cte.c.id,
+                    full=True,
+                )
+            )
+            .subquery("scored")
+        )
+        final_query = (
+            select(
+                Chunk.id,
+                Chunk.document_id,
+                scored.c.document_type,
+                scored.c.score,
+                Document.title,
+                Document.document_metadata,
+            )
+            .join(Chunk, Chunk.id == scored.c.chunk_id)
+            .join(Document, Chunk.document_id == Document.id)
+            .where(scored.c.row_num <= top_k)
+            .order_by(scored.c.document_type, scored.c.score.desc())
+        )
+
+        await enable_iterative_index_scan(self.db_session)
+        result = await self.db_session.execute(final_query)
+        rows = result.all()
+        if not rows:
+            return results
+
+        # Group by document within each type, preserving ranking order by best chunk
+        doc_scores_by_type: dict[str, dict[int, float]] = {}
+        matched_chunk_ids: dict[int, list[int]] = {}
+        doc_info: dict[int, dict] = {}
+        for chunk_id, doc_id, doc_type, chunk_score, title, metadata in rows:
+            doc_type_value = (
+                doc_type.value if isinstance(doc_type, DocumentType) else doc_type
+            )
+            doc_scores = doc_scores_by_type.setdefault(doc_type_value, {})
+            if doc_id not in doc_scores:
+                doc_scores[doc_id] = float(chunk_score)
+            else:
+                doc_scores[doc_id] = max(doc_scores[doc_id], float(chunk_score))
+            matched_chunk_ids.setdefault(doc_id, []).append(chunk_id)
+            doc_info[doc_id] = {
+                "id": doc_id,
+                "title": title,
+                "document_type": doc_type_value,
+                "metadata": metadata or {},
+            }
+
+        selected_doc_ids = [
+            doc_id
+            for doc_scores in doc_scores_by_type.values()
+            for doc_id in list(doc_scores)[:top_k]
+        ]
+
+        # Fetch the chunks to cite for the selected documents of every type at once
+        chunks_by_doc = await fetch_document_chunks(
+            self.db_session, selected_doc_ids, matched_chunk_ids
+        )
+
+        doc_map: dict[int, dict] = {
+            doc_id: {
+                "document_id": doc_id,
+                "content": "",
+                "score": float(doc_scores.get(doc_id, 0.0)),
+                "chunks": chunks_by_doc.get(doc_id, []),
+                "document": doc_info[doc_id],
+                "source": doc_info[doc_id]["document_type"],
+            }
+            for doc_scores in doc_scores_by_type.values()
+            for doc_id in list(doc_scores)[:top_k]
+        }
+
+        # Fill concatenated content (useful for reranking) in per-type rank order
+        for doc_type_value, doc_scores in doc_scores_by_type.items():
+            if doc_type_value not in results:
+                continue
+            for doc_id in list(doc_scores)[:top_k]:
+                entry = doc_map[doc_id]
+                entry["content"] = "\n\n".join(
+                    c["content"] for c in entry.get("chunks", []) if c.get("content")
+                )
+                results[doc_type_value].append(entry)
+
+        return results
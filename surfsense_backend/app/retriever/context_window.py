@@ -0,0 +1,121 @@
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for context budgets."""
+    return (len(text) + 3) // 4
+
+
+def _select_window_ids(
+    ordered_ids: list[int],
+    matched_ids: list[int],
+    neighbours: int,
+) -> list[int]:
+    """
+    Pick the chunk ids to keep for one document, in priority order.
+
+    Matched chunks come first (in rank order), followed by their neighbours by
+    increasing distance in chunk order. Documents without matched chunks (e.g.
+    found by document-level search) keep their leading chunks instead.
+    """
+    positions = {chunk_id: pos for pos, chunk_id in enumerate(ordered_ids)}
+    matched_positions = [positions[cid] for cid in matched_ids if cid in positions]
+    if not matched_positions:
+        return ordered_ids[: 2 * neighbours + 1]
+
+    selected: list[int] = []
+    seen: set[int] = set()
+    for distance in range(neighbours + 1):
+        for pos in matched_positions:
+            for candidate in {pos - distance, pos + distance}:
+                if 0 <= candidate < len(ordered_ids) and candidate not in seen:
+                    seen.add(candidate)
+                    selected.append(ordered_ids[candidate])
+    return selected
+
+
+async def fetch_document_chunks(
+    db_session,
+    doc_ids: list[int],
+    matched_chunk_ids: dict[int, list[int]] | None = None,
+) -> dict[int, list[dict]]:
+    """
+    Fetch the chunks to present for each retrieved document.
+
+    In "full" context mode every chunk of each document is returned. In the
+    default "window" mode only the matched chunks plus
+    RETRIEVAL_CONTEXT_NEIGHBOURS chunks on each side (by chunk order) are kept,
+    capped at RETRIEVAL_CONTEXT_MAX_TOKENS_PER_DOCUMENT per document, so
+    reranking and prompt formatting work on a bounded amount of text.
+
+    Args:
+        db_session: SQLAlchemy AsyncSession
+        doc_ids: Documents to fetch chunks for
+        matched_chunk_ids: Optional matched chunk ids per document, best first
+
+    Returns:
+        Dict of document id to a list of {chunk_id, content} in chunk order
+    """
+    from sqlalchemy import select
+
+    from app.config import config
+    from app.db import Chunk
+
+    chunks_by_doc: dict[int, list[dict]] = {doc_id: [] for doc_id in doc_ids}
+    if not doc_ids:
+        return chunks_by_doc
+
+    if config.RETRIEVAL_CONTEXT_MODE == "full":
+        result = await db_session.execute(
+            select(Chunk.id, Chunk.document_id, Chunk.content)
+            .where(Chunk.document_id.in_(doc_ids))
+            .order_by(Chunk.document_id, Chunk.id)
+        )
+        for chunk_id, doc_id, content in result.all():
+            chunks_by_doc[doc_id].append({"chunk_id": chunk_id, "content": content})
+        return chunks_by_doc
+
+    matched_chunk_ids = matched_chunk_ids or {}
+    neighbours = max(0, config.RETRIEVAL_CONTEXT_NEIGHBOURS)
+    token_budget = config.RETRIEVAL_CONTEXT_MAX_TOKENS_PER_DOCUMENT
+
+    # Chunk order per document, without loading any content
+    result = await db_session.execute(
+        select(Chunk.id, Chunk.document_id)
+        .where(Chunk.document_id.in_(doc_ids))
+        .order_by(Chunk.document_id, Chunk.id)
+    )
+    ordered_ids: dict[int, list[int]] = {doc_id: [] for doc_id in doc_ids}
+    for chunk_id, doc_id in result.all():
+        ordered_ids[doc_id].append(chunk_id)
+
+    window_ids = {
+        doc_id: _select_window_ids(
+            ordered_ids[doc_id], matched_chunk_ids.get(doc_id, []), neighbours
+        )
+        for doc_id in doc_ids
+    }
+    candidate_ids = [cid for ids in window_ids.values() for cid in ids]
+    if not candidate_ids:
+        return chunks_by_doc
+
+    result = await db_session.execute(
+        select(Chunk.id, Chunk.content).where(Chunk.id.in_(candidate_ids))
+    )
+    contents = dict(result.all())
+
+    for doc_id, ids in window_ids.items():
+        # Spend the token budget in priority order, always keeping the best chunk
+        kept: set[int] = set()
+        used_tokens = 0
+        for chunk_id in ids:
+            tokens = estimate_tokens(contents.get(chunk_id) or "")
+            if kept and used_tokens + tokens > token_budget:
+                continue
+            kept.add(chunk_id)
+            used_tokens += tokens
+
+        chunks_by_doc[doc_id] = [
+            {"chunk_id": chunk_id, "content": contents.get(chunk_id, "")}
+            for chunk_id in ordered_ids[doc_id]
+            if chunk_id in kept
+        ]
+
+    return chunks_by_doc
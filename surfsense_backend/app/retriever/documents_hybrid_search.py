@@ -1,15 +1,40 @@
 from datetime import datetime
 
+from app.retriever.context_window import fetch_document_chunks
+from app.retriever.query_embedding_cache import RequestQueryEmbeddings
+from app.retriever.vector_index import enable_iterative_index_scan
+
+
+def _projected_document_columns(document_model):
+    """
+    Loader option limiting document entities to the columns search results use.
+
+    The content, embedding and editor state of the documents are not loaded.
+    """
+    from sqlalchemy.orm import load_only
+
+    return load_only(
+        document_model.id,
+        document_model.title,
+        document_model.document_type,
+        document_model.document_metadata,
+    )
+
 
 class DocumentHybridSearchRetriever:
-    def __init__(self, db_session):
+    def __init__(
+        self, db_session, query_embeddings: RequestQueryEmbeddings | None = None
+    ):
         """
         Initialize the hybrid search retriever with a database session.
 
         Args:
             db_session: SQLAlchemy AsyncSession from FastAPI dependency injection
+            query_embeddings: Optional per-request query embedding memo shared with
+                other retrievers so each query is embedded only once
         """
         self.db_session = db_session
+        self.query_embeddings = query_embeddings or RequestQueryEmbeddings()
 
     async def vector_search(
         self,
@@ -33,19 +58,16 @@ class DocumentHybridSearchRetriever:
             List of documents sorted by vector similarity
         """
         from sqlalchemy import select
-        from sqlalchemy.orm import joinedload
 
-        from app.config import config
         from app.db import Document
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
 
         # Build the query filtered by search space
         query = (
             select(Document)
-            .options(joinedload(Document.search_space))
+            .options(_projected_document_columns(Document))
             .where(Document.search_space_id == search_space_id)
         )
 
@@ -61,6 +83,7 @@ class DocumentHybridSearchRetriever:
         )
 
         # Execute the query
+        await enable_iterative_index_scan(self.db_session)
         result = await self.db_session.execute(query)
         documents = result.scalars().all()
 
@@ -88,18 +111,17 @@ class DocumentHybridSearchRetriever:
             List of documents sorted by text relevance
         """
         from sqlalchemy import func, select
-        from sqlalchemy.orm import joinedload
 
         from app.db import Document
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Document.content_tsv
         tsquery = func.plainto_tsquery("english", query_text)
 
         # Build the query filtered by search space
         query = (
             select(Document)
-            .options(joinedload(Document.search_space))
+            .options(_projected_document_columns(Document))
             .where(Document.search_space_id == search_space_id)
             .where(
                 tsvector.op("@@")(tsquery)
@@ -146,21 +168,18 @@ class DocumentHybridSearchRetriever:
 
         """
         from sqlalchemy import func, select, text
-        from sqlalchemy.orm import joinedload
 
-        from app.config import config
-        from app.db import Chunk, Document, DocumentType
+        from app.db import Document, DocumentType
 
-        # Get embedding for the query
-        embedding_model = config.embedding_model_instance
-        query_embedding = embedding_model.embed(query_text)
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
 
         # RRF constants
         k = 60
         n_results = top_k * 2  # Fetch extra documents for better fusion
 
-        # Create tsvector and tsquery for PostgreSQL full-text search
-        tsvector = func.to_tsvector("english", Document.content)
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Document.content_tsv
         tsquery = func.plainto_tsquery("english", query_text)
 
         # Base conditions for document filtering - search space is required
@@ -217,10 +236,15 @@ class DocumentHybridSearchRetriever:
             .cte("keyword_search")
         )
 
-        # Final combined query using a FULL OUTER JOIN with RRF scoring
+        # Final combined query using a FULL OUTER JOIN with RRF scoring. Only the
+        # columns that are serialized are selected, so the documents' full content,
+        # embeddings and editor state are never transferred or turned into entities.
         final_query = (
             select(
-                Document,
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
                 (
                     func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0)
                     + func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
@@ -238,61 +262,43 @@ class DocumentHybridSearchRetriever:
                 Document.id
                 == func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id),
             )
-            .options(joinedload(Document.search_space))
             .order_by(text("score DESC"))
             .limit(top_k)
         )
 
         # Execute the query
+        await enable_iterative_index_scan(self.db_session)
         result = await self.db_session.execute(final_query)
-        documents_with_scores = result.all()
+        rows = result.all()
 
         # If no results were found, return an empty list
-        if not documents_with_scores:
+        if not rows:
             return []
 
         # Collect document IDs for chunk fetching
-        doc_ids: list[int] = [doc.id for doc, _score in documents_with_scores]
-
-        # Fetch ALL chunks for these documents in a single query
-        chunks_query = (
-            select(Chunk)
-            .options(joinedload(Chunk.document))
-            .where(Chunk.document_id.in_(doc_ids))
-            .order_by(Chunk.document_id, Chunk.id)
-        )
-        chunks_result = await self.db_session.execute(chunks_query)
-        chunks = chunks_result.scalars().all()
+        doc_ids: list[int] = [row.id for row in rows]
+
+        # Fetch the chunks to cite for these documents in a single pass (leading
+        # chunks within the context budget, or every chunk in "full" context mode)
+        chunks_by_doc = await fetch_document_chunks(self.db_session, doc_ids)
 
         # Assemble doc-grouped results
-        doc_map: dict[int, dict] = {
-            doc.id: {
-                "document_id": doc.id,
+        doc_map: dict[int, dict] = {}
+        for doc_id, title, doc_type, metadata, score in rows:
+            document_type = doc_type.value if doc_type else None
+            doc_map[doc_id] = {
+                "document_id": doc_id,
                 "content": "",
                 "score": float(score),
-                "chunks": [],
+                "chunks": chunks_by_doc.get(doc_id, []),
                 "document": {
-                    "id": doc.id,
-                    "title": doc.title,
-                    "document_type": doc.document_type.value
-                    if getattr(doc, "document_type", None)
-                    else None,
-                    "metadata": doc.document_metadata or {},
+                    "id": doc_id,
+                    "title": title,
+                    "document_type": document_type,
+                    "metadata": metadata or {},
                 },
-                "source": doc.document_type.value
-                if getattr(doc, "document_type", None)
-                else None,
+                "source": document_type,
             }
-            for doc, score in documents_with_scores
-        }
-
-        for chunk in chunks:
-            doc_id = chunk.document_id
-            if doc_id not in doc_map:
-                continue
-            doc_map[doc_id]["chunks"].append(
-                {"chunk_id": chunk.id, "content": chunk.content}
-            )
 
         # Fill concatenated content (useful for reranking)
         final_docs: list[dict] = []
@@ -304,3 +310,165 @@ class DocumentHybridSearchRetriever:
             final_docs.append(entry)
 
         return final_docs
+
+    async def hybrid_search_multi(
+        self,
+        query_text: str,
+        top_k: int,
+        search_space_id: int,
+        document_types: list[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, list]:
+        """
+        Run `hybrid_search` for several document types in a single pass.
+
+        The semantic and keyword searches of each type are the bounded searches
+        `hybrid_search(document_type=...)` runs, combined with UNION ALL, so each
+        type gets exactly the results it would return.
+
+        Args:
+            query_text: The search query text
+            top_k: Number of documents to return per document type
+            search_space_id: The search space ID to search within
+            document_types: Document types to search (e.g., ["FILE", "CRAWLED_URL"])
+            start_date: Optional start date for filtering documents by updated_at
+            end_date: Optional end date for filtering documents by updated_at
+
+        Returns:
+            Dict mapping each requested document type to its list of
+            document-grouped results (same shape as `hybrid_search`).
+        """
+        from sqlalchemy import func, select, union_all
+
+        from app.db import Document, DocumentType
+
+        results: dict[str, list] = {doc_type: [] for doc_type in document_types}
+
+        # Unknown document types simply yield no results, like hybrid_search
+        doc_type_enums = [
+            DocumentType[doc_type]
+            for doc_type in document_types
+            if doc_type in DocumentType.__members__
+        ]
+        if not doc_type_enums:
+            return results
+
+        # Get embedding for the query (memoized per request and process-wide)
+        query_embedding = self.query_embeddings.embed(query_text)
+
+        # RRF constants
+        k = 60
+        n_results = top_k * 2  # Fetch extra documents for better fusion
+
+        # Use the stored tsvector column and build the tsquery for full-text search
+        tsvector = Document.content_tsv
+        tsquery = func.plainto_tsquery("english", query_text)
+
+        base_conditions = [Document.search_space_id == search_space_id]
+        if start_date is not None:
+            base_conditions.append(Document.updated_at >= start_date)
+        if end_date is not None:
+            base_conditions.append(Document.updated_at <= end_date)
+
+        # One bounded search per document type, as hybrid_search runs it, so each
+        # type is an index scan with its own LIMIT rather than a ranking of every
+        # document in the search space
+        def per_type_ranks(order_by, *conditions):
+            return union_all(
+                *(
+                    select(
+                        Document.id,
+                        Document.document_type,
+                        func.rank().over(order_by=order_by).label("rank"),
+                    )
+                    .where(*base_conditions, Document.document_type == doc_type_enum)
+                    .where(*conditions)
+                    .order_by(order_by)
+                    .limit(n_results)
+                    for doc_type_enum in doc_type_enums
+                )
+            )
+
+        # Semantic ranks per document type, keeping the top n_results of each type
+        semantic_search_cte = per_type_ranks(
+            Document.embedding.op("<=>")(query_embedding)
+        ).cte("semantic_search")
+
+        # Keyword ranks per document type, keeping the top n_results of each type
+        keyword_search_cte = per_type_ranks(
+            func.ts_rank_cd(tsvector, tsquery).desc(), tsvector.op("@@")(tsquery)
+        ).cte("keyword_search")
+
+        # RRF score per document, keeping the top_k documents of each type
+        score = func.coalesce(1.0 / (k + semantic_search_cte.c.rank), 0.0) + (
+            func.coalesce(1.0 / (k + keyword_search_cte.c.rank), 0.0)
+        )
+        document_id = func.coalesce(semantic_search_cte.c.id, keyword_search_cte.c.id)
+        document_type = func.coalesce(
+            semantic_search_cte.c.document_type, keyword_search_cte.c.document_type
+        )
+        scored = (
+            select(
+                document_id.label("document_id"),
+                score.label("score"),
+                func.row_number()
+                .over(partition_by=document_type, order_by=score.desc())
+                .label("row_num"),
+            )
+            .select_from(
+                semantic_search_cte.outerjoin(
+                    keyword_search_cte,
+                    semantic_search_cte.c.id == keyword_search_cte.c.id,
+                    full=True,
+                )
+            )
+            .subquery("scored")
+        )
+        final_query = (
+            select(
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
+                scored.c.score,
+            )
+            .join(scored, Document.id == scored.c.document_id)
+            .where(scored.c.row_num <= top_k)
+            .order_by(Document.document_type, scored.c.score.desc())
+        )
+
+        await enable_iterative_index_scan(self.db_session)
+        result = await self.db_session.execute(final_query)
+        rows = result.all()
+        if not rows:
+            return results
+
+        doc_ids: list[int] = [row.id for row in rows]
+
+        # Fetch the chunks to cite for the documents of every type in a single pass
+        chunks_by_doc = await fetch_document_chunks(self.db_session, doc_ids)
+
+        # Assemble doc-grouped results, filling concatenated content (useful for
+        # reranking) and splitting by type
+        for doc_id, title, doc_type, metadata, score in rows:
+            chunks = chunks_by_doc.get(doc_id, [])
+            results.setdefault(doc_type.value, []).append(
+                {
+                    "document_id": doc_id,
+                    "content": "\n\n".join(
+                        c["content"] for c in chunks if c.get("content")
+                    ),
+                    "score": float(score),
+                    "chunks": chunks,
+                    "document": {
+                        "id": doc_id,
+                        "title": title,
+                        "document_type": doc_type.value,
+                        "metadata": metadata or {},
+                    },
+                    "source": doc_type.value,
+                }
+            )
+
+        return results
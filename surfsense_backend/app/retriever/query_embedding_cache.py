@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class QueryEmbeddingCache:
+    """
+    Process-wide LRU cache for query embeddings with a TTL.
+
+    Entries are keyed by (embedding model, query text) so that switching the
+    embedding model never serves vectors from a different model.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of embeddings kept in memory
+            ttl_seconds: Seconds after which an entry is considered stale
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model_name: str, query_text: str) -> Any | None:
+        key = (model_name, query_text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, embedding = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def set(self, model_name: str, query_text: str, embedding: Any) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = (model_name, query_text)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for the process-wide cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+_query_embedding_cache: QueryEmbeddingCache | None = None
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Get the process-wide query embedding cache, creating it on first use."""
+    global _query_embedding_cache
+
+    if _query_embedding_cache is None:
+        from app.config import config
+
+        _query_embedding_cache = QueryEmbeddingCache(
+            max_size=config.QUERY_EMBEDDING_CACHE_SIZE,
+            ttl_seconds=config.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+    return _query_embedding_cache
+
+
+class RequestQueryEmbeddings:
+    """
+    Per-request query embedding memo backed by the process-wide cache.
+
+    A single instance is shared by all retrievers used to answer one request,
+    so a query is embedded at most once no matter how many connectors are
+    searched.
+    """
+
+    def __init__(self, shared_cache: QueryEmbeddingCache | None = None):
+        self.shared_cache = shared_cache or get_query_embedding_cache()
+        self._memo: dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, query_text: str) -> Any:
+        """
+        Get the embedding for a query, computing it only if neither the request
+        memo nor the process-wide cache has it.
+        """
+        if query_text in self._memo:
+            self.hits += 1
+            return self._memo[query_text]
+
+        from app.config import config
+
+        model_name = config.EMBEDDING_MODEL or ""
+        embedding = self.shared_cache.get(model_name, query_text)
+        if embedding is None:
+            self.misses += 1
+            embedding = config.embedding_model_instance.embed(query_text)
+            self.shared_cache.set(model_name, query_text, embedding)
+        else:
+            self.hits += 1
+
+        self._memo[query_text] = embedding
+        return embedding
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this request and the shared cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "shared": self.shared_cache.stats(),
+        }
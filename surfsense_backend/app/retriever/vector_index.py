@@ -0,0 +1,60 @@
+from sqlalchemy import text
+
+# pgvector gained iterative index scans (hnsw.iterative_scan) in 0.8.0
+_ITERATIVE_SCAN_MIN_VERSION = (0, 8, 0)
+
+_iterative_scan_supported: bool | None = None
+
+
+def _parse_version(version: str) -> tuple[int, ...]:
+    parts = []
+    for part in version.split("."):
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+async def _supports_iterative_scan(db_session) -> bool:
+    global _iterative_scan_supported
+
+    if _iterative_scan_supported is None:
+        result = await db_session.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        )
+        version = result.scalar()
+        _iterative_scan_supported = (
+            version is not None
+            and _parse_version(version) >= _ITERATIVE_SCAN_MIN_VERSION
+        )
+    return _iterative_scan_supported
+
+
+async def enable_iterative_index_scan(db_session) -> None:
+    """
+    Enable HNSW iterative index scans for the current transaction.
+
+    Search space and document type filters are applied after the HNSW scan, so
+    with many search spaces the first `ef_search` neighbours often belong to other
+    tenants and filtered queries return too few rows. Iterative scans keep
+    walking the index until enough rows pass the filters.
+
+    Does nothing on pgvector versions without iterative scan support or when
+    VECTOR_ITERATIVE_SCAN is "off".
+
+    Args:
+        db_session: SQLAlchemy AsyncSession the vector query will run on
+    """
+    from app.config import config
+
+    mode = config.VECTOR_ITERATIVE_SCAN
+    if mode == "off" or not await _supports_iterative_scan(db_session):
+        return
+
+    await db_session.execute(
+        text("SELECT set_config('hnsw.iterative_scan', :mode, true)"),
+        {"mode": mode},
+    )
+    await db_session.execute(
+        text("SELECT set_config('hnsw.max_scan_tuples', :max_scan_tuples, true)"),
+        {"max_scan_tuples": str(config.VECTOR_MAX_SCAN_TUPLES)},
+    )
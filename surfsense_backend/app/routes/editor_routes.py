@@ -8,9 +8,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.db import Document, DocumentType, Permission, User, get_async_session
+from app.db import Chunk, Document, DocumentType, Permission, User, get_async_session
 from app.users import current_active_user
 from app.utils.rbac import check_permission
 
@@ -41,10 +40,9 @@ async def get_editor_content(
         "You don't have permission to read documents in this search space",
     )
 
+    # Chunks are only loaded when the BlockNote state has to be rebuilt from them
     result = await session.execute(
-        select(Document)
-        .options(selectinload(Document.chunks))
-        .filter(
+        select(Document).filter(
             Document.id == document_id,
             Document.search_space_id == search_space_id,
         )
@@ -90,10 +88,25 @@ async def get_editor_content(
             else None,
         }
 
+    # PDFs processed in page slices are too large to rebuild from their chunks
+    if (document.document_metadata or {}).get("PAGE_STREAMING"):
+        raise HTTPException(
+            status_code=400,
+            detail="This document was processed in page slices because of its size and cannot be edited.",
+        )
+
     # Lazy migration: Try to generate blocknote_document from chunks (for other document types)
     from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
-    chunks = sorted(document.chunks, key=lambda c: c.id)
+    chunks = (
+        (
+            await session.execute(
+                select(Chunk).where(Chunk.document_id == document.id).order_by(Chunk.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
 
     if not chunks:
         raise HTTPException(
@@ -788,7 +788,10 @@ async def process_attachment(
             if stt_service_type == "local":
                 from app.services.stt_service import stt_service
 
-                result = stt_service.transcribe_file(temp_path)
+                try:
+                    result = await stt_service.atranscribe_file(temp_path)
+                except TimeoutError as e:
+                    raise HTTPException(status_code=504, detail=str(e)) from e
                 extracted_content = result.get("text", "")
             else:
                 from litellm import atranscription
@@ -0,0 +1,225 @@
+"""
+Service for a shared, long-lived headless Chromium browser.
+
+Launching Chromium dominates the cost of fetching a single page, so crawling,
+webpage scraping and link previews share one browser per event loop instead of
+launching one per URL. Every fetch gets its own browser context (isolated
+cookies and user agent), and the number of concurrently open pages is bounded.
+The browser is relaunched after serving BROWSER_POOL_RECYCLE_AFTER pages to
+bound memory growth, and whenever it crashes or disconnects.
+
+Celery tasks run each job on a fresh event loop, so they must call
+`close_browser_pool()` before their loop is closed.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Resource types extraction-only fetches never need
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPoolService:
+    """Shared headless Chromium with a bounded number of concurrent pages."""
+
+    def __init__(self, max_pages: int = 4, recycle_after: int = 200):
+        """
+        Initialize the browser pool.
+
+        Args:
+            max_pages: Maximum number of pages (and contexts) open at once
+            recycle_after: Relaunch the browser after serving this many pages
+        """
+        self.max_pages = max(1, max_pages)
+        self.recycle_after = recycle_after
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._pages_served = 0
+        self._in_flight: dict[Any, int] = {}
+        self._retired: set = set()
+
+    async def _launch(self):
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+
+        browser = await self._playwright.chromium.launch(headless=True)
+        browser.on("disconnected", self._on_disconnected)
+        logger.info("[browser_pool] Launched Chromium")
+        return browser
+
+    def _on_disconnected(self, browser) -> None:
+        if browser is self._browser:
+            logger.warning("[browser_pool] Chromium disconnected, will relaunch")
+            self._browser = None
+        self._retired.discard(browser)
+        self._in_flight.pop(browser, None)
+
+    async def _acquire_browser(self):
+        async with self._lock:
+            browser = self._browser
+            needs_recycle = (
+                self.recycle_after > 0 and self._pages_served >= self.recycle_after
+            )
+            if browser is None or not browser.is_connected() or needs_recycle:
+                if browser is not None and browser.is_connected():
+                    # Close the old browser once its in-flight pages are done
+                    self._retired.add(browser)
+                    await self._close_if_idle(browser)
+                try:
+                    self._browser = await self._launch()
+                except Exception:
+                    # The Playwright driver itself may have died; restart it
+                    await self._stop_playwright()
+                    self._browser = await self._launch()
+                self._pages_served = 0
+
+            self._pages_served += 1
+            self._in_flight[self._browser] = self._in_flight.get(self._browser, 0) + 1
+            return self._browser
+
+    async def _release_browser(self, browser) -> None:
+        if browser in self._in_flight:
+            self._in_flight[browser] -= 1
+        await self._close_if_idle(browser)
+
+    async def _close_if_idle(self, browser) -> None:
+        if browser in self._retired and self._in_flight.get(browser, 0) <= 0:
+            self._retired.discard(browser)
+            self._in_flight.pop(browser, None)
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"[browser_pool] Error closing retired browser: {e}")
+
+    async def _stop_playwright(self) -> None:
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"[browser_pool] Error stopping Playwright: {e}")
+            self._playwright = None
+
+    @asynccontextmanager
+    async def page(self, user_agent: str | None = None, block_resources: bool = True):
+        """
+        Open a page in a fresh browser context.
+
+        Args:
+            user_agent: Optional User-Agent for the context
+            block_resources: Abort image, font and media requests
+
+        Yields:
+            A Playwright page, closed (with its context) on exit
+        """
+        async with self._semaphore:
+            browser = await self._acquire_browser()
+            context = None
+            try:
+                context = await browser.new_context(user_agent=user_agent)
+                if block_resources:
+                    await context.route("**/*", _block_heavy_resources)
+                yield await context.new_page()
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug(f"[browser_pool] Error closing context: {e}")
+                await self._release_browser(browser)
+
+    async def fetch_html(
+        self,
+        url: str,
+        user_agent: str | None = None,
+        timeout_ms: int = 30000,
+        block_resources: bool = True,
+    ) -> tuple[str, str]:
+        """
+        Load a URL and return its rendered HTML and title.
+
+        Retries once on a fresh browser if Chromium crashed during the fetch.
+
+        Args:
+            url: URL to load
+            user_agent: Optional User-Agent for the request
+            timeout_ms: Navigation timeout in milliseconds
+            block_resources: Abort image, font and media requests
+
+        Returns:
+            Tuple of (raw_html, page_title)
+        """
+        for attempt in range(2):
+            try:
+                async with self.page(user_agent, block_resources) as page:
+                    await page.goto(
+                        url, wait_until="domcontentloaded", timeout=timeout_ms
+                    )
+                    return await page.content(), await page.title()
+            except Exception:
+                browser = self._browser
+                crashed = browser is None or not browser.is_connected()
+                if attempt == 0 and crashed:
+                    logger.warning(
+                        f"[browser_pool] Chromium crashed fetching {url}, retrying"
+                    )
+                    continue
+                raise
+        raise RuntimeError(f"Failed to fetch {url}")
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        async with self._lock:
+            browsers = [self._browser, *self._retired]
+            self._browser = None
+            self._retired.clear()
+            self._in_flight.clear()
+            for browser in browsers:
+                if browser is not None:
+                    try:
+                        await browser.close()
+                    except Exception as e:
+                        logger.debug(f"[browser_pool] Error closing browser: {e}")
+            await self._stop_playwright()
+
+
+_browser_pools: dict[asyncio.AbstractEventLoop, BrowserPoolService] = {}
+
+
+def get_browser_pool() -> BrowserPoolService:
+    """Get the browser pool for the running event loop."""
+    from app.config import config
+
+    loop = asyncio.get_running_loop()
+    pool = _browser_pools.get(loop)
+    if pool is None:
+        # Drop pools of event loops that have been closed
+        for closed_loop in [lp for lp in _browser_pools if lp.is_closed()]:
+            del _browser_pools[closed_loop]
+        pool = BrowserPoolService(
+            max_pages=config.BROWSER_POOL_MAX_PAGES,
+            recycle_after=config.BROWSER_POOL_RECYCLE_AFTER,
+        )
+        _browser_pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the browser pool of the running event loop, if one was started."""
+    pool = _browser_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
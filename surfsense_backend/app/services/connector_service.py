@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 from urllib.parse import urljoin
@@ -6,7 +7,7 @@ from urllib.parse import urljoin
 import httpx
 from linkup import LinkupClient
 from sqlalchemy import func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.future import select
 from tavily import TavilyClient
 
@@ -18,14 +19,32 @@ from app.db import (
 )
 from app.retriever.chunks_hybrid_search import ChucksHybridSearchRetriever
 from app.retriever.documents_hybrid_search import DocumentHybridSearchRetriever
+from app.retriever.query_embedding_cache import RequestQueryEmbeddings
+from app.services.retrieval_cache_service import get_retrieval_cache
 
 
 class ConnectorService:
-    def __init__(self, session: AsyncSession, search_space_id: int | None = None):
+    def __init__(
+        self,
+        session: AsyncSession,
+        search_space_id: int | None = None,
+        session_factory: async_sessionmaker | None = None,
+    ):
         self.session = session
-        self.chunk_retriever = ChucksHybridSearchRetriever(session)
-        self.document_retriever = DocumentHybridSearchRetriever(session)
+        # When set, searches open short-lived sessions from this factory instead of
+        # using `session`, so several searches can run concurrently.
+        self.session_factory = session_factory
+        # Shared by both retrievers so each query is embedded once per request
+        self.query_embeddings = RequestQueryEmbeddings()
+        self.chunk_retriever = ChucksHybridSearchRetriever(
+            session, query_embeddings=self.query_embeddings
+        )
+        self.document_retriever = DocumentHybridSearchRetriever(
+            session, query_embeddings=self.query_embeddings
+        )
         self.search_space_id = search_space_id
+        # Results of prefetch_combined_rrf_search, consumed by _combined_rrf_search
+        self._prefetched_rrf_results: dict[tuple, list[dict[str, Any]]] = {}
         self.source_id_counter = (
             100000  # High starting value to avoid collisions with existing IDs
         )
@@ -33,6 +52,64 @@ class ConnectorService:
             asyncio.Lock()
         )  # Lock to protect counter in multithreaded environments
 
+    @asynccontextmanager
+    async def _db_session(self):
+        """
+        Yield a session for a single search.
+
+        With a session factory each search gets its own short-lived session, which
+        makes concurrent searches safe. Otherwise the shared session is used.
+        """
+        if self.session_factory is None:
+            yield self.session
+            return
+
+        async with self.session_factory() as session:
+            yield session
+
+    async def _run_hybrid_searches(
+        self, method_name: str, **search_kwargs
+    ) -> tuple[Any, Any]:
+        """
+        Run the same hybrid search method on the chunk and document retrievers.
+
+        Args:
+            method_name: Retriever method to call ("hybrid_search" or "hybrid_search_multi")
+            **search_kwargs: Arguments passed to the retriever method
+
+        Returns:
+            tuple: (chunk_results, doc_results)
+        """
+        if self.session_factory is None:
+            # IMPORTANT:
+            # These retrievers share the same AsyncSession. AsyncSession does not permit
+            # concurrent awaits that require DB IO on the same session/connection.
+            # Running these in parallel can raise:
+            # "This session is provisioning a new connection; concurrent operations are not permitted"
+            #
+            # So we run them sequentially.
+            chunk_results = await getattr(self.chunk_retriever, method_name)(
+                **search_kwargs
+            )
+            doc_results = await getattr(self.document_retriever, method_name)(
+                **search_kwargs
+            )
+            return chunk_results, doc_results
+
+        async def _search(retriever_cls):
+            async with self._db_session() as session:
+                retriever = retriever_cls(
+                    session, query_embeddings=self.query_embeddings
+                )
+                return await getattr(retriever, method_name)(**search_kwargs)
+
+        # Each retriever has its own session, so both can run concurrently
+        chunk_results, doc_results = await asyncio.gather(
+            _search(ChucksHybridSearchRetriever),
+            _search(DocumentHybridSearchRetriever),
+        )
+        return chunk_results, doc_results
+
     async def initialize_counter(self):
         """
         Initialize the source_id_counter based on the total number of chunks for the search space.
@@ -246,28 +323,38 @@ class ConnectorService:
         Returns:
             List of combined and deduplicated document results
         """
-        # RRF constant
-        k = 60
+        # Serve results prefetched by prefetch_combined_rrf_search if available
+        prefetch_key = (
+            query_text,
+            search_space_id,
+            document_type,
+            top_k,
+            start_date,
+            end_date,
+        )
+        if prefetch_key in self._prefetched_rrf_results:
+            return self._prefetched_rrf_results.pop(prefetch_key)
+
+        # Serve results cached for the current content version of the search space
+        retrieval_cache = get_retrieval_cache()
+        cache_version = None
+        if retrieval_cache is not None:
+            cache_version, cached = await retrieval_cache.get_many(
+                search_space_id,
+                [document_type],
+                query_text,
+                start_date,
+                end_date,
+                top_k,
+            )
+            if document_type in cached:
+                return cached[document_type]
 
         # Get more results from each retriever for better fusion
         retriever_top_k = top_k * 2
 
-        # IMPORTANT:
-        # These retrievers share the same AsyncSession. AsyncSession does not permit
-        # concurrent awaits that require DB IO on the same session/connection.
-        # Running these in parallel can raise:
-        # "This session is provisioning a new connection; concurrent operations are not permitted"
-        #
-        # So we run them sequentially.
-        chunk_results = await self.chunk_retriever.hybrid_search(
-            query_text=query_text,
-            top_k=retriever_top_k,
-            search_space_id=search_space_id,
-            document_type=document_type,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        doc_results = await self.document_retriever.hybrid_search(
+        chunk_results, doc_results = await self._run_hybrid_searches(
+            "hybrid_search",
             query_text=query_text,
             top_k=retriever_top_k,
             search_space_id=search_space_id,
@@ -276,6 +363,43 @@ class ConnectorService:
             end_date=end_date,
         )
 
+        combined_results = self._fuse_rrf_results(chunk_results, doc_results, top_k)
+
+        if retrieval_cache is not None:
+            await retrieval_cache.set(
+                search_space_id,
+                document_type,
+                query_text,
+                start_date,
+                end_date,
+                top_k,
+                cache_version,
+                combined_results,
+            )
+
+        return combined_results
+
+    def _fuse_rrf_results(
+        self,
+        chunk_results: list[dict[str, Any]],
+        doc_results: list[dict[str, Any]],
+        top_k: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Merge chunk-level and document-level hybrid search results using
+        Reciprocal Rank Fusion (RRF) at the document level.
+
+        Args:
+            chunk_results: Document-grouped results from the chunk retriever
+            doc_results: Document-grouped results from the document retriever
+            top_k: Number of results to return
+
+        Returns:
+            List of combined and deduplicated document results
+        """
+        # RRF constant
+        k = 60
+
         # Helper to extract document_id from our doc-grouped result
         def _doc_id(item: dict[str, Any]) -> int | None:
             doc = item.get("document", {})
@@ -337,6 +461,127 @@ class ConnectorService:
 
         return combined_results
 
+    async def _combined_rrf_search_multi(
+        self,
+        query_text: str,
+        search_space_id: int,
+        document_types: list[str],
+        top_k: int = 20,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Perform `_combined_rrf_search` for several document types at once.
+
+        Runs one chunk-level and one document-level hybrid search query over all
+        requested document types, then splits the results per type and RRF-fuses
+        them in Python. Each type's results are identical to calling
+        `_combined_rrf_search` for that type on its own.
+
+        Args:
+            query_text: The search query text
+            search_space_id: The search space ID to search within
+            document_types: Document types to search (e.g., ["FILE", "CRAWLED_URL"])
+            top_k: Number of results to return per document type
+            start_date: Optional start date for filtering documents by updated_at
+            end_date: Optional end date for filtering documents by updated_at
+
+        Returns:
+            Dict mapping each document type to its combined results
+        """
+        # Only search the document types without results cached for the current
+        # content version of the search space
+        retrieval_cache = get_retrieval_cache()
+        cache_version = None
+        results_by_type: dict[str, list[dict[str, Any]]] = {}
+        if retrieval_cache is not None:
+            cache_version, results_by_type = await retrieval_cache.get_many(
+                search_space_id,
+                document_types,
+                query_text,
+                start_date,
+                end_date,
+                top_k,
+            )
+        missing_types = [t for t in document_types if t not in results_by_type]
+        if not missing_types:
+            return results_by_type
+
+        # Get more results from each retriever for better fusion
+        retriever_top_k = top_k * 2
+
+        chunk_results_by_type, doc_results_by_type = await self._run_hybrid_searches(
+            "hybrid_search_multi",
+            query_text=query_text,
+            top_k=retriever_top_k,
+            search_space_id=search_space_id,
+            document_types=missing_types,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        for document_type in missing_types:
+            results_by_type[document_type] = self._fuse_rrf_results(
+                chunk_results_by_type.get(document_type, []),
+                doc_results_by_type.get(document_type, []),
+                top_k,
+            )
+            if retrieval_cache is not None:
+                await retrieval_cache.set(
+                    search_space_id,
+                    document_type,
+                    query_text,
+                    start_date,
+                    end_date,
+                    top_k,
+                    cache_version,
+                    results_by_type[document_type],
+                )
+
+        return results_by_type
+
+    async def prefetch_combined_rrf_search(
+        self,
+        query_text: str,
+        search_space_id: int,
+        document_types: list[str],
+        top_k: int = 20,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> None:
+        """
+        Prefetch combined search results for several document types in one pass.
+
+        Subsequent `search_*` calls with the same arguments are served from the
+        prefetched results instead of issuing their own queries.
+
+        Args:
+            query_text: The search query text
+            search_space_id: The search space ID to search within
+            document_types: Document types that will be searched
+            top_k: Number of results per document type
+            start_date: Optional start date for filtering documents by updated_at
+            end_date: Optional end date for filtering documents by updated_at
+        """
+        results_by_type = await self._combined_rrf_search_multi(
+            query_text=query_text,
+            search_space_id=search_space_id,
+            document_types=document_types,
+            top_k=top_k,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        for document_type, results in results_by_type.items():
+            key = (
+                query_text,
+                search_space_id,
+                document_type,
+                top_k,
+                start_date,
+                end_date,
+            )
+            self._prefetched_rrf_results[key] = results
+
     def _get_doc_url(self, metadata: dict[str, Any]) -> str:
         return (
             metadata.get("url")
@@ -420,8 +665,9 @@ class ConnectorService:
             SearchSourceConnector.connector_type == connector_type,
         )
 
-        result = await self.session.execute(query)
-        return result.scalars().first()
+        async with self._db_session() as session:
+            result = await session.execute(query)
+            return result.scalars().first()
 
     async def search_tavily(
         self, user_query: str, search_space_id: int, top_k: int = 20
@@ -457,7 +703,9 @@ class ConnectorService:
 
         # Perform search with Tavily
         try:
-            response = tavily_client.search(
+            # The Tavily client is synchronous; run it off the event loop
+            response = await asyncio.to_thread(
+                tavily_client.search,
                 query=user_query,
                 max_results=top_k,
                 search_depth="advanced",  # Use advanced search for better results
@@ -2110,7 +2358,9 @@ class ConnectorService:
 
         # Perform search with Linkup
         try:
-            response = linkup_client.search(
+            # The Linkup client is synchronous; run it off the event loop
+            response = await asyncio.to_thread(
+                linkup_client.search,
                 query=user_query,
                 depth=mode,  # Use the provided mode ("standard" or "deep")
                 output_type="searchResults",  # Default to search results
@@ -2,26 +2,113 @@
 """
 Docling Document Processing Service for SurfSense
 SSL-safe implementation with pre-downloaded models
+
+One DoclingService is shared per process and its DocumentConverter is built on
+first use. Conversions run in a pool of worker processes that each load the
+Docling models once, so concurrent uploads convert in parallel without blocking
+the event loop. Where child processes cannot be started (Celery prefork workers
+are daemonic) or DOCLING_CONVERSION_WORKERS is 0, conversions run one at a time
+on a worker thread with the shared converter instead.
+
+Summarization is done by module-level functions, so other ETL paths can use
+it without constructing the service, whose SSL setup affects the whole process.
 """
 
+import asyncio
+import hashlib
 import logging
+import multiprocessing
 import os
+import random
 import ssl
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 
+from app.utils.executor_slots import ExecutorSlots
+
 logger = logging.getLogger(__name__)
 
+_CHUNK_SUMMARY_KEY_PREFIX = "surfsense:docling:chunk_summary"
+
+# Share of the model's context window the combine step may fill with section
+# summaries; the rest is left for the prompt and the generated summary
+_REDUCE_CONTEXT_SHARE = 0.6
+
+
+class _ChunkSummaryStore:
+    """
+    Chunk summaries kept in Redis so a retried summarization resumes.
+
+    Keys are content addressed (model, chunk position and chunk text), so a
+    retried task that re-chunks the same document finds the summaries finished
+    by the failed attempt. A store that cannot reach Redis stores nothing.
+    """
+
+    def __init__(self, redis_url: str | None, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+        if redis_url and ttl_seconds > 0:
+            try:
+                import redis.asyncio as redis_async
+
+                self._client = redis_async.from_url(redis_url, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Chunk summary store unavailable: {e!s}")
+
+    @staticmethod
+    def key(model_name: str, chunk_number: int, total_chunks: int, text: str) -> str:
+        digest = hashlib.sha256(
+            f"{model_name}|{chunk_number}|{total_chunks}|{text}".encode()
+        ).hexdigest()
+        return f"{_CHUNK_SUMMARY_KEY_PREFIX}:{digest}"
+
+    async def get_many(self, keys: list[str]) -> list[str | None]:
+        if self._client is None or not keys:
+            return [None] * len(keys)
+        try:
+            return await self._client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Chunk summary lookup failed: {e!s}")
+            return [None] * len(keys)
+
+    async def set(self, key: str, summary: str) -> None:
+        if self._client is None:
+            return
+        try:
+            await self._client.set(key, summary, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Chunk summary write failed: {e!s}")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
 
 class DoclingService:
     """Docling service for enhanced document processing with SSL fixes."""
 
     def __init__(self):
-        """Initialize Docling service with SSL, model fixes, and GPU acceleration."""
+        """
+        Initialize Docling service with SSL, model fixes, and GPU acceleration.
+
+        The converter and its models are loaded lazily, on the first conversion
+        that runs in this process.
+        """
         self.converter = None
         self.use_gpu = False
+        self._converter_lock = threading.Lock()
         self._configure_ssl_environment()
-        self._check_wsl2_gpu_support()
-        self._initialize_docling()
+
+    def _get_converter(self):
+        """Get the DocumentConverter, building it on first use."""
+        if self.converter is None:
+            with self._converter_lock:
+                if self.converter is None:
+                    self._check_wsl2_gpu_support()
+                    self._initialize_docling()
+        return self.converter
 
     def _configure_ssl_environment(self):
         """Configure SSL environment for secure model downloads."""
@@ -128,55 +215,60 @@ class DoclingService:
             logger.error(f"❌ Docling initialization failed: {e}")
             raise RuntimeError(f"Docling initialization failed: {e}") from e
 
+    def convert_to_markdown(self, file_path: str) -> str:
+        """
+        Convert a document to markdown with the shared converter.
+
+        Blocking; runs in a conversion worker process or thread.
+        """
+        result = self._get_converter().convert(file_path)
+
+        # Extract content using version-safe methods
+        content = None
+        if hasattr(result, "document") and result.document:
+            # Try different export methods (version compatibility)
+            if hasattr(result.document, "export_to_markdown"):
+                content = result.document.export_to_markdown()
+                logger.info("📄 Used export_to_markdown method")
+            elif hasattr(result.document, "to_markdown"):
+                content = result.document.to_markdown()
+                logger.info("📄 Used to_markdown method")
+            elif hasattr(result.document, "text"):
+                content = result.document.text
+                logger.info("📄 Used text property")
+            elif hasattr(result.document, "__str__"):
+                content = str(result.document)
+                logger.info("📄 Used string conversion")
+
+            if not content:
+                raise ValueError("No content could be extracted from document")
+            return content
+
+        raise ValueError("No document object returned by Docling")
+
     async def process_document(
         self, file_path: str, filename: str | None = None
     ) -> dict[str, Any]:
         """Process document with Docling using pre-downloaded models."""
-
-        if self.converter is None:
-            raise RuntimeError("Docling converter not initialized")
-
         try:
             logger.info(
                 f"🔄 Processing {filename} with Docling (using local models)..."
             )
 
-            # Process document with local models
-            result = self.converter.convert(file_path)
-
-            # Extract content using version-safe methods
-            content = None
-            if hasattr(result, "document") and result.document:
-                # Try different export methods (version compatibility)
-                if hasattr(result.document, "export_to_markdown"):
-                    content = result.document.export_to_markdown()
-                    logger.info("📄 Used export_to_markdown method")
-                elif hasattr(result.document, "to_markdown"):
-                    content = result.document.to_markdown()
-                    logger.info("📄 Used to_markdown method")
-                elif hasattr(result.document, "text"):
-                    content = result.document.text
-                    logger.info("📄 Used text property")
-                elif hasattr(result.document, "__str__"):
-                    content = str(result.document)
-                    logger.info("📄 Used string conversion")
-
-                if content:
-                    logger.info(
-                        f"✅ Docling SUCCESS - {filename}: {len(content)} chars (local models)"
-                    )
+            # Convert off the event loop, in a worker process when available
+            content = await _convert_off_loop(self, file_path)
 
-                    return {
-                        "content": content,
-                        "full_text": content,
-                        "service_used": "docling",
-                        "status": "success",
-                        "processing_notes": "Processed with Docling using pre-downloaded models",
-                    }
-                else:
-                    raise ValueError("No content could be extracted from document")
-            else:
-                raise ValueError("No document object returned by Docling")
+            logger.info(
+                f"✅ Docling SUCCESS - {filename}: {len(content)} chars (local models)"
+            )
+
+            return {
+                "content": content,
+                "full_text": content,
+                "service_used": "docling",
+                "status": "success",
+                "processing_notes": "Processed with Docling using pre-downloaded models",
+            }
 
         except Exception as e:
             logger.error(f"❌ Docling processing failed for {filename}: {e}")
@@ -189,110 +281,242 @@ class DoclingService:
     async def process_large_document_summary(
         self, content: str, llm, document_title: str = "Document"
     ) -> str:
-        """
-        Process large documents using chunked LLM summarization.
+        """Summarize a document with `summarize_large_document`."""
+        return await summarize_large_document(content, llm, document_title)
+
+
+async def summarize_large_document(
+    content: str, llm, document_title: str = "Document"
+) -> str:
+    """
+    Process large documents using chunked LLM summarization.
+
+    Independent of DoclingService, so other ETL paths can summarize without
+    constructing it.
+
+    Args:
+        content: The full document content
+        llm: The language model to use for summarization
+        document_title: Title of the document for context
+
+    Returns:
+        Final summary of the document
+    """
+    # Large document threshold (100K characters ≈ 25K tokens)
+    large_document_threshold = 100_000
+
+    if len(content) <= large_document_threshold:
+        # For smaller documents, use direct processing
+        logger.info(f"📄 Document size: {len(content)} chars - using direct processing")
+        from app.prompts import SUMMARY_PROMPT_TEMPLATE
+
+        summary_chain = SUMMARY_PROMPT_TEMPLATE | llm
+        result = await summary_chain.ainvoke({"document": content})
+        return result.content
+
+    logger.info(
+        f"📚 Large document detected: {len(content)} chars - using chunked processing"
+    )
+
+    # Import chunker from config
+    # Create LLM-optimized chunks (8K tokens max for safety)
+    from chonkie import OverlapRefinery, RecursiveChunker
+    from langchain_core.prompts import PromptTemplate
+
+    llm_chunker = RecursiveChunker(
+        chunk_size=8000  # Conservative for most LLMs
+    )
+
+    # Apply overlap refinery for context preservation (10% overlap = 800 tokens)
+    overlap_refinery = OverlapRefinery(
+        context_size=0.1,  # 10% overlap for context preservation
+        method="suffix",  # Add next chunk context to current chunk
+    )
+
+    # First chunk the content, then apply overlap refinery
+    initial_chunks = llm_chunker.chunk(content)
+    chunks = overlap_refinery.refine(initial_chunks)
+    total_chunks = len(chunks)
+
+    logger.info(f"📄 Split into {total_chunks} chunks for LLM processing")
+
+    # Template for chunk processing
+    chunk_template = PromptTemplate(
+        input_variables=["chunk", "chunk_number", "total_chunks"],
+        template="""<INSTRUCTIONS>
+You are summarizing chunk {chunk_number} of {total_chunks} from a large document.
 
-        Args:
-            content: The full document content
-            llm: The language model to use for summarization
-            document_title: Title of the document for context
+Create a comprehensive summary of this document chunk. Focus on:
+- Key concepts, facts, and information
+- Important details and context
+- Main topics and themes
 
-        Returns:
-            Final summary of the document
-        """
-        # Large document threshold (100K characters ≈ 25K tokens)
-        large_document_threshold = 100_000
+Provide a clear, structured summary that captures the essential content.
 
-        if len(content) <= large_document_threshold:
-            # For smaller documents, use direct processing
-            logger.info(
-                f"📄 Document size: {len(content)} chars - using direct processing"
-            )
-            from app.prompts import SUMMARY_PROMPT_TEMPLATE
+Chunk {chunk_number}/{total_chunks}:
+<document_chunk>
+{chunk}
+</document_chunk>
+</INSTRUCTIONS>""",
+    )
+
+    from app.config import config
+
+    model_name = getattr(llm, "model", "") or ""
+    store = _ChunkSummaryStore(
+        config.DOCLING_SUMMARY_CACHE_REDIS_URL,
+        config.DOCLING_SUMMARY_CACHE_TTL_SECONDS,
+    )
+    try:
+        # Map: summarize chunks concurrently, reusing summaries persisted by
+        # a previous attempt
+        chunk_summaries = await _summarize_chunks(
+            chunks, chunk_template | llm, model_name, store
+        )
+    finally:
+        await store.close()
 
-            summary_chain = SUMMARY_PROMPT_TEMPLATE | llm
-            result = await summary_chain.ainvoke({"document": content})
-            return result.content
+    # Reduce: combine summaries, hierarchically if they exceed the context window
+    logger.info(f"🔄 Combining {len(chunk_summaries)} chunk summaries")
 
+    try:
+        final_summary = await _combine_summaries(
+            chunk_summaries, llm, model_name, document_title
+        )
         logger.info(
-            f"📚 Large document detected: {len(content)} chars - using chunked processing"
+            f"✅ Large document processing complete: {len(final_summary)} chars summary"
         )
 
-        # Import chunker from config
-        # Create LLM-optimized chunks (8K tokens max for safety)
-        from chonkie import OverlapRefinery, RecursiveChunker
-        from langchain_core.prompts import PromptTemplate
+        return final_summary
 
-        llm_chunker = RecursiveChunker(
-            chunk_size=8000  # Conservative for most LLMs
-        )
+    except Exception as e:
+        logger.error(f"❌ Failed to combine summaries: {e}")
+        # Fallback: return concatenated chunk summaries
+        fallback_summary = "\n\n".join(chunk_summaries)
+        logger.warning("⚠️ Using fallback combined summary")
+        return fallback_summary
 
-        # Apply overlap refinery for context preservation (10% overlap = 800 tokens)
-        overlap_refinery = OverlapRefinery(
-            context_size=0.1,  # 10% overlap for context preservation
-            method="suffix",  # Add next chunk context to current chunk
-        )
 
-        # First chunk the content, then apply overlap refinery
-        initial_chunks = llm_chunker.chunk(content)
-        chunks = overlap_refinery.refine(initial_chunks)
-        total_chunks = len(chunks)
+async def combine_section_summaries(
+    summaries: list[str], llm, document_title: str = "Document"
+) -> str:
+    """
+    Combine summaries of consecutive sections of a document into one summary.
 
-        logger.info(f"📄 Split into {total_chunks} chunks for LLM processing")
+    Used when a document is summarized section by section as it is
+    converted, instead of from its full content.
 
-        # Template for chunk processing
-        chunk_template = PromptTemplate(
-            input_variables=["chunk", "chunk_number", "total_chunks"],
-            template="""<INSTRUCTIONS>
-You are summarizing chunk {chunk_number} of {total_chunks} from a large document.
+    Args:
+        summaries: Section summaries, in document order
+        llm: The language model to use for combining
+        document_title: Title of the document for context
 
-Create a comprehensive summary of this document chunk. Focus on:
-- Key concepts, facts, and information
-- Important details and context
-- Main topics and themes
+    Returns:
+        Final summary of the document
+    """
+    if len(summaries) == 1:
+        return summaries[0]
 
-Provide a clear, structured summary that captures the essential content.
+    model_name = getattr(llm, "model", "") or ""
+    try:
+        return await _combine_summaries(summaries, llm, model_name, document_title)
+    except Exception as e:
+        logger.error(f"❌ Failed to combine section summaries: {e}")
+        logger.warning("⚠️ Using fallback combined summary")
+        return "\n\n".join(summaries)
 
-Chunk {chunk_number}/{total_chunks}:
-<document_chunk>
-{chunk}
-</document_chunk>
-</INSTRUCTIONS>""",
-        )
 
-        # Process each chunk individually
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks, 1):
-            try:
-                logger.info(
-                    f"🔄 Processing chunk {i}/{total_chunks} ({len(chunk.text)} chars)"
-                )
+async def _ainvoke_with_retry(chain, inputs: dict[str, Any]):
+    """Invoke an LLM chain, retrying failures with exponential backoff."""
+    from app.config import config
 
-                chunk_chain = chunk_template | llm
-                chunk_result = await chunk_chain.ainvoke(
-                    {
-                        "chunk": chunk.text,
-                        "chunk_number": i,
-                        "total_chunks": total_chunks,
-                    }
-                )
+    max_retries = max(0, config.DOCLING_SUMMARY_MAX_RETRIES)
+    for attempt in range(max_retries + 1):
+        try:
+            return await chain.ainvoke(inputs)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = 2**attempt + random.uniform(0, 1)
+            logger.warning(
+                f"⚠️ LLM call failed ({e}), retrying in {delay:.1f}s "
+                f"({attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
 
-                chunk_summary = chunk_result.content
-                chunk_summaries.append(f"=== Section {i} ===\n{chunk_summary}")
 
-                logger.info(f"✅ Completed chunk {i}/{total_chunks}")
+async def _summarize_chunks(
+    chunks, chunk_chain, model_name: str, store: _ChunkSummaryStore
+) -> list[str]:
+    """Summarize chunks with bounded concurrency, in document order."""
+    from app.config import config
+
+    total_chunks = len(chunks)
+    keys = [
+        store.key(model_name, i, total_chunks, chunk.text)
+        for i, chunk in enumerate(chunks, 1)
+    ]
+    persisted = await store.get_many(keys)
+    resumed = sum(summary is not None for summary in persisted)
+    if resumed:
+        logger.info(f"♻️ Resuming with {resumed}/{total_chunks} chunk summaries")
 
+    semaphore = asyncio.Semaphore(max(1, config.DOCLING_SUMMARY_CONCURRENCY))
+
+    async def summarize(i: int, chunk, key: str, summary: str | None) -> str:
+        if summary is None:
+            try:
+                async with semaphore:
+                    logger.info(
+                        f"🔄 Processing chunk {i}/{total_chunks} ({len(chunk.text)} chars)"
+                    )
+                    chunk_result = await _ainvoke_with_retry(
+                        chunk_chain,
+                        {
+                            "chunk": chunk.text,
+                            "chunk_number": i,
+                            "total_chunks": total_chunks,
+                        },
+                    )
+                summary = chunk_result.content
+                await store.set(key, summary)
+                logger.info(f"✅ Completed chunk {i}/{total_chunks}")
             except Exception as e:
                 logger.error(f"❌ Failed to process chunk {i}/{total_chunks}: {e}")
-                chunk_summaries.append(f"=== Section {i} ===\n[Processing failed]")
+                summary = "[Processing failed]"
+        return f"=== Section {i} ===\n{summary}"
+
+    return list(
+        await asyncio.gather(
+            *(
+                summarize(i, chunk, key, summary)
+                for i, (chunk, key, summary) in enumerate(
+                    zip(chunks, keys, persisted, strict=True), 1
+                )
+            )
+        )
+    )
 
-        # Combine summaries into final document summary
-        logger.info(f"🔄 Combining {len(chunk_summaries)} chunk summaries")
 
-        try:
-            combine_template = PromptTemplate(
-                input_variables=["summaries", "document_title"],
-                template="""<INSTRUCTIONS>
+async def _combine_summaries(
+    summaries: list[str], llm, model_name: str, document_title: str
+) -> str:
+    """
+    Combine section summaries into one summary.
+
+    While the joined summaries exceed the combine step's share of the
+    model's context window, consecutive summaries are combined in groups
+    that fit, concurrently, and the group summaries are combined again.
+    """
+    from langchain_core.prompts import PromptTemplate
+
+    from app.config import config
+    from app.utils.document_converters import get_model_context_window
+    from app.utils.token_truncation import get_tokenizer
+
+    combine_template = PromptTemplate(
+        input_variables=["summaries", "document_title"],
+        template="""<INSTRUCTIONS>
 You are combining multiple section summaries into a final comprehensive document summary.
 
 Create a unified, coherent summary from the following section summaries of "{document_title}".
@@ -306,30 +530,186 @@ Ensure:
 {summaries}
 </section_summaries>
 </INSTRUCTIONS>""",
-            )
+    )
+    combine_chain = combine_template | llm
 
-            combined_summaries = "\n\n".join(chunk_summaries)
-            combine_chain = combine_template | llm
+    tokenizer = get_tokenizer(model_name)
+    token_budget = int(get_model_context_window(model_name) * _REDUCE_CONTEXT_SHARE)
 
-            final_result = await combine_chain.ainvoke(
-                {"summaries": combined_summaries, "document_title": document_title}
-            )
+    def count_tokens(text: str) -> int:
+        return len(tokenizer.token_starts(text))
 
-            final_summary = final_result.content
-            logger.info(
-                f"✅ Large document processing complete: {len(final_summary)} chars summary"
+    async def combine(group: list[str]) -> str:
+        result = await _ainvoke_with_retry(
+            combine_chain,
+            {"summaries": "\n\n".join(group), "document_title": document_title},
+        )
+        return result.content
+
+    semaphore = asyncio.Semaphore(max(1, config.DOCLING_SUMMARY_CONCURRENCY))
+
+    async def combine_group(group: list[str], label: str) -> str:
+        if len(group) == 1:
+            return group[0]
+        async with semaphore:
+            return f"=== {label} ===\n{await combine(group)}"
+
+    level = 0
+    while len(summaries) > 1 and count_tokens("\n\n".join(summaries)) > token_budget:
+        # Group consecutive summaries that fit the budget together
+        groups: list[list[str]] = [[]]
+        group_tokens = 0
+        for summary in summaries:
+            summary_tokens = count_tokens(summary)
+            if groups[-1] and group_tokens + summary_tokens > token_budget:
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(summary)
+            group_tokens += summary_tokens
+
+        if len(groups) == len(summaries):
+            # Every summary fills the budget on its own; nothing left to merge
+            break
+
+        level += 1
+        logger.info(
+            f"🔄 Reduce level {level}: combining {len(summaries)} summaries "
+            f"in {len(groups)} groups"
+        )
+        summaries = list(
+            await asyncio.gather(
+                *(
+                    combine_group(group, f"Part {n} (level {level})")
+                    for n, group in enumerate(groups, 1)
+                )
             )
+        )
 
-            return final_summary
+    return await combine(summaries)
 
-        except Exception as e:
-            logger.error(f"❌ Failed to combine summaries: {e}")
-            # Fallback: return concatenated chunk summaries
-            fallback_summary = "\n\n".join(chunk_summaries)
-            logger.warning("⚠️ Using fallback combined summary")
-            return fallback_summary
+
+_docling_service: DoclingService | None = None
+_docling_service_lock = threading.Lock()
 
 
 def create_docling_service() -> DoclingService:
-    """Create a Docling service instance."""
-    return DoclingService()
+    """Get the process-wide Docling service instance."""
+    global _docling_service
+
+    if _docling_service is None:
+        with _docling_service_lock:
+            if _docling_service is None:
+                _docling_service = DoclingService()
+    return _docling_service
+
+
+# Docling service of a conversion worker process
+_worker_service: DoclingService | None = None
+
+
+def _init_conversion_worker() -> None:
+    """Load the Docling models once per conversion worker process."""
+    global _worker_service
+
+    import warnings
+
+    # pdfminer warnings are harmless but can flood logs and stall processing
+    warnings.filterwarnings("ignore", category=UserWarning, module="pdfminer")
+    warnings.filterwarnings("ignore", message=".*Cannot set gray non-stroke color.*")
+    warnings.filterwarnings("ignore", message=".*invalid float value.*")
+    logging.getLogger("pdfminer").setLevel(logging.ERROR)
+
+    _worker_service = DoclingService()
+    _worker_service._get_converter()
+
+
+def _convert_in_worker(file_path: str) -> str:
+    return _worker_service.convert_to_markdown(file_path)
+
+
+_conversion_pool: ProcessPoolExecutor | None = None
+_conversion_slots: ExecutorSlots | None = None
+# Runs conversions one at a time when they run in this process
+_in_process_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="docling-conversion"
+)
+_conversion_pool_lock = threading.Lock()
+
+
+def _get_conversion_slots() -> ExecutorSlots:
+    """Slots bounding the conversions running or queued at once."""
+    global _conversion_slots
+
+    if _conversion_slots is None:
+        with _conversion_pool_lock:
+            if _conversion_slots is None:
+                from app.config import config
+
+                _conversion_slots = ExecutorSlots(config.DOCLING_CONVERSION_QUEUE_SIZE)
+    return _conversion_slots
+
+
+def _get_conversion_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the conversion worker pool, or None if conversions must run in-process.
+
+    Daemonic processes (such as Celery prefork workers) cannot have children.
+    """
+    global _conversion_pool
+
+    from app.config import config
+
+    if (
+        config.DOCLING_CONVERSION_WORKERS <= 0
+        or multiprocessing.current_process().daemon
+    ):
+        return None
+
+    if _conversion_pool is None:
+        with _conversion_pool_lock:
+            if _conversion_pool is None:
+                _conversion_pool = ProcessPoolExecutor(
+                    max_workers=config.DOCLING_CONVERSION_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_conversion_worker,
+                )
+                logger.info(
+                    f"🔧 Started {config.DOCLING_CONVERSION_WORKERS} Docling "
+                    "conversion workers"
+                )
+    return _conversion_pool
+
+
+async def _convert_off_loop(service: DoclingService, file_path: str) -> str:
+    """Convert a document to markdown without blocking the event loop."""
+    global _conversion_pool
+
+    # The slot is held until the conversion finishes, even if this is cancelled
+    slots = _get_conversion_slots()
+    pool = _get_conversion_pool()
+    if pool is None:
+        future = await slots.submit(
+            _in_process_executor, service.convert_to_markdown, file_path
+        )
+        return await asyncio.wrap_future(future)
+
+    future = await slots.submit(pool, _convert_in_worker, file_path)
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); start a fresh pool next time
+        with _conversion_pool_lock:
+            if _conversion_pool is pool:
+                _conversion_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_docling_workers() -> None:
+    """Stop the conversion worker processes, if they were started."""
+    global _conversion_pool
+
+    with _conversion_pool_lock:
+        pool, _conversion_pool = _conversion_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
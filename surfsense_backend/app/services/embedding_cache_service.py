@@ -0,0 +1,239 @@
+"""
+Service for the content-addressed document embedding cache.
+
+Embeddings are stored in the `embedding_cache` table keyed by (embedding model,
+sha256 of the text), so boilerplate repeated across messages, the same file
+uploaded into several search spaces and summaries that did not change are
+embedded once. Lookups refresh `last_used_at` at most once per hour per entry,
+and every EMBEDDING_CACHE_EVICTION_INTERVAL new entries the least recently used
+entries beyond EMBEDDING_CACHE_MAX_ENTRIES are deleted.
+
+The cache uses its own engine without connection pooling so it works from the
+API process and from Celery tasks, which run every job on a fresh event loop.
+Cache errors are logged and treated as misses; they never fail indexing.
+"""
+
+import hashlib
+import logging
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between two last_used_at refreshes of an entry
+_TOUCH_INTERVAL = timedelta(hours=1)
+
+
+def hash_text(text_value: str) -> str:
+    """Content address of a text: the sha256 hex digest of its UTF-8 bytes."""
+    return hashlib.sha256(text_value.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCacheService:
+    """Service for looking up and storing embeddings by model and text hash."""
+
+    def __init__(
+        self,
+        database_url: str,
+        max_entries: int = 1_000_000,
+        eviction_interval: int = 1000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            database_url: Database holding the embedding_cache table
+            max_entries: Number of entries kept after an eviction pass
+            eviction_interval: New entries written between two eviction passes
+        """
+        self.max_entries = max_entries
+        self.eviction_interval = max(1, eviction_interval)
+        self._session_maker = async_sessionmaker(
+            create_async_engine(database_url, poolclass=NullPool),
+            expire_on_commit=False,
+        )
+        self._lock = threading.Lock()
+        self._writes_since_eviction = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    async def get_many(self, model: str, text_hashes: list[str]) -> dict[str, Any]:
+        """
+        Get cached embeddings.
+
+        Args:
+            model: Embedding model name
+            text_hashes: Hashes of the texts, see hash_text
+
+        Returns:
+            Dict of text hash to embedding for cache hits
+        """
+        text_hashes = list(dict.fromkeys(text_hashes))
+        if not text_hashes:
+            return {}
+
+        try:
+            async with self._session_maker() as session:
+                result = await session.execute(
+                    select(EmbeddingCache.text_hash, EmbeddingCache.embedding).where(
+                        EmbeddingCache.model == model,
+                        EmbeddingCache.text_hash.in_(text_hashes),
+                    )
+                )
+                cached = dict(result.all())
+
+                if cached:
+                    now = datetime.now(UTC)
+                    await session.execute(
+                        update(EmbeddingCache)
+                        .where(
+                            EmbeddingCache.model == model,
+                            EmbeddingCache.text_hash.in_(list(cached)),
+                            EmbeddingCache.last_used_at < now - _TOUCH_INTERVAL,
+                        )
+                        .values(last_used_at=now)
+                    )
+                    await session.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e!s}")
+            cached = {}
+
+        with self._lock:
+            self.hits += len(cached)
+            self.misses += len(text_hashes) - len(cached)
+        return cached
+
+    async def set_many(self, model: str, embeddings: dict[str, Any]) -> None:
+        """
+        Store embeddings, keeping existing entries for the same texts.
+
+        Args:
+            model: Embedding model name
+            embeddings: Dict of text hash to embedding
+        """
+        if not embeddings:
+            return
+
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "model": model,
+                "text_hash": text_hash,
+                "embedding": embedding,
+                "created_at": now,
+                "last_used_at": now,
+            }
+            for text_hash, embedding in embeddings.items()
+        ]
+        try:
+            async with self._session_maker() as session:
+                await session.execute(
+                    insert(EmbeddingCache).on_conflict_do_nothing(
+                        index_elements=["model", "text_hash"]
+                    ),
+                    rows,
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e!s}")
+            return
+
+        with self._lock:
+            self.writes += len(rows)
+            self._writes_since_eviction += len(rows)
+            evict = self._writes_since_eviction >= self.eviction_interval
+            if evict:
+                self._writes_since_eviction = 0
+        if evict:
+            await self.evict()
+
+    async def evict(self) -> int:
+        """
+        Delete the least recently used entries beyond max_entries.
+
+        Returns:
+            Number of deleted entries
+        """
+        try:
+            async with self._session_maker() as session:
+                entry_count = (
+                    await session.execute(
+                        select(func.count()).select_from(EmbeddingCache)
+                    )
+                ).scalar_one()
+                excess = entry_count - self.max_entries
+                if excess <= 0:
+                    return 0
+
+                result = await session.execute(
+                    text(
+                        """
+                        DELETE FROM embedding_cache
+                        WHERE ctid IN (
+                            SELECT ctid FROM embedding_cache
+                            ORDER BY last_used_at
+                            LIMIT :excess
+                        )
+                        """
+                    ),
+                    {"excess": excess},
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache eviction failed: {e!s}")
+            return 0
+
+        with self._lock:
+            self.evictions += result.rowcount
+        logger.info(f"Evicted {result.rowcount} entries from the embedding cache")
+        return result.rowcount
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters of this process."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+
+_embedding_cache: EmbeddingCacheService | None = None
+_embedding_cache_initialized = False
+
+
+def get_embedding_cache() -> EmbeddingCacheService | None:
+    """
+    Get the process-wide embedding cache.
+
+    Returns:
+        The cache, or None if EMBEDDING_CACHE_ENABLED is false
+    """
+    global _embedding_cache, _embedding_cache_initialized
+
+    if _embedding_cache_initialized:
+        return _embedding_cache
+
+    from app.config import config
+
+    _embedding_cache_initialized = True
+    if config.EMBEDDING_CACHE_ENABLED:
+        _embedding_cache = EmbeddingCacheService(
+            config.DATABASE_URL,
+            max_entries=config.EMBEDDING_CACHE_MAX_ENTRIES,
+            eviction_interval=config.EMBEDDING_CACHE_EVICTION_INTERVAL,
+        )
+    return _embedding_cache
@@ -1,8 +1,35 @@
+import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from rerankers import Document as RerankerDocument
 
+# Rough characters-per-token ratio used to truncate candidates to the model's
+# max input length without tokenizing them first
+_CHARS_PER_TOKEN = 4
+
+_rerank_executor: ThreadPoolExecutor | None = None
+_rerank_executor_lock = threading.Lock()
+
+
+def _get_rerank_executor() -> ThreadPoolExecutor:
+    """Get the process-wide thread pool reranker inference runs on."""
+    global _rerank_executor
+
+    if _rerank_executor is None:
+        with _rerank_executor_lock:
+            if _rerank_executor is None:
+                from app.config import config
+
+                _rerank_executor = ThreadPoolExecutor(
+                    max_workers=max(1, config.RERANKERS_MAX_WORKERS),
+                    thread_name_prefix="reranker",
+                )
+    return _rerank_executor
+
 
 class RerankerService:
     """
@@ -16,7 +43,115 @@ class RerankerService:
         Args:
             reranker_instance: The reranker instance to use for reranking
         """
+        from app.config import config
+
         self.reranker_instance = reranker_instance
+        self.batch_size = config.RERANKERS_BATCH_SIZE
+        self.max_input_tokens = self._resolve_max_input_tokens(
+            reranker_instance, config.RERANKERS_MAX_INPUT_TOKENS
+        )
+        # Timings of the last rerank call, in seconds
+        self.last_timings: dict[str, float] = {}
+
+    @staticmethod
+    def _resolve_max_input_tokens(reranker_instance, default: int) -> int:
+        """Use the model's own max input length when the reranker exposes one."""
+        for attr in ("max_length", "max_input_length"):
+            value = getattr(reranker_instance, attr, None)
+            if isinstance(value, int) and value > 0:
+                return value
+        return default
+
+    def _truncate(self, text: str) -> str:
+        """Truncate a candidate to the model's max input length."""
+        if self.max_input_tokens <= 0:
+            return text
+        return text[: self.max_input_tokens * _CHARS_PER_TOKEN]
+
+    def _build_reranker_docs(
+        self, documents: list[dict[str, Any]]
+    ) -> list[RerankerDocument]:
+        reranker_docs = []
+        for i, doc in enumerate(documents):
+            document_info = doc.get("document", {})
+            reranker_docs.append(
+                RerankerDocument(
+                    # Use concatenated content for reranking
+                    text=self._truncate(doc.get("content", "") or ""),
+                    # The original index is used to map results back
+                    doc_id=i,
+                    metadata={
+                        "document_id": document_info.get("id", ""),
+                        "document_title": document_info.get("title", ""),
+                        "document_type": document_info.get("document_type", ""),
+                        "rrf_score": doc.get("score", 0.0),
+                    },
+                )
+            )
+        return reranker_docs
+
+    def _rank(
+        self, query_text: str, reranker_docs: list[RerankerDocument]
+    ) -> list[tuple[int, float | None]]:
+        """
+        Rank candidates in batches of `batch_size`.
+
+        Cross-encoder scores are computed per (query, document) pair, so batches
+        are scored independently and merged by score. Rerankers that only return
+        a rank order (no scores) cannot be merged across batches, so all
+        candidates are then ranked in one call and the reranker's order is kept.
+
+        Returns:
+            List of (original index, score or None) in ranked order
+        """
+        batch_size = self.batch_size if self.batch_size > 0 else len(reranker_docs)
+        scored: list[tuple[int, float | None]] = []
+        for start in range(0, len(reranker_docs), batch_size):
+            batch = reranker_docs[start : start + batch_size]
+            ranked = self._rank_batch(query_text, batch)
+            if any(score is None for _doc_id, score in ranked):
+                if start == 0 and len(batch) == len(reranker_docs):
+                    return ranked
+                return self._rank_batch(query_text, reranker_docs)
+            scored.extend(ranked)
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
+
+    def _rank_batch(
+        self, query_text: str, batch: list[RerankerDocument]
+    ) -> list[tuple[int, float | None]]:
+        """Rank one batch, returning (original index, score) in the reranker's order."""
+        reranking_results = self.reranker_instance.rank(query=query_text, docs=batch)
+        ranked = []
+        for result in reranking_results.results:
+            score = None if result.score is None else float(result.score)
+            ranked.append((result.document.doc_id, score))
+        return ranked
+
+    @staticmethod
+    def _apply_ranking(
+        documents: list[dict[str, Any]], ranking: list[tuple[int, float | None]]
+    ) -> list[dict[str, Any]]:
+        """
+        Copy the original documents in ranked order with reranker scores.
+
+        Documents keep their original score if the reranker returned none.
+        """
+        documents_by_index = dict(enumerate(documents))
+
+        serialized_results = []
+        for rank, (original_index, score) in enumerate(ranking, start=1):
+            original_doc = documents_by_index.get(original_index)
+            if original_doc is None:
+                continue
+            # Shallow copy preserves the chunks list (important for citation formatting)
+            reranked_doc = original_doc.copy()
+            if score is not None:
+                reranked_doc["score"] = score
+            reranked_doc["rank"] = rank
+            serialized_results.append(reranked_doc)
+        return serialized_results
 
     def rerank_documents(
         self, query_text: str, documents: list[dict[str, Any]]
@@ -28,6 +163,9 @@ class RerankerService:
         - Document-grouped (new format): Has `document_id`, `chunks` list, and `content` (concatenated)
         - Chunk-based (legacy format): Individual chunks with `chunk_id` and `content`
 
+        This runs inference on the calling thread; use `arerank_documents` from
+        async code so the event loop is not blocked.
+
         Args:
             query_text: The query text to use for reranking
             documents: List of document dictionaries to rerank
@@ -39,69 +177,14 @@ class RerankerService:
             return documents
 
         try:
-            # Create Document objects for the rerankers library
-            reranker_docs = []
-            for i, doc in enumerate(documents):
-                # Use document_id for matching
-                doc_id = doc.get("document_id") or f"doc_{i}"
-                # Use concatenated content for reranking
-                content = doc.get("content", "")
-                score = doc.get("score", 0.0)
-                document_info = doc.get("document", {})
-
-                reranker_docs.append(
-                    RerankerDocument(
-                        text=content,
-                        doc_id=doc_id,
-                        metadata={
-                            "document_id": document_info.get("id", ""),
-                            "document_title": document_info.get("title", ""),
-                            "document_type": document_info.get("document_type", ""),
-                            "rrf_score": score,
-                            # Track original index for fallback matching
-                            "original_index": i,
-                        },
-                    )
-                )
-
-            # Rerank using the configured reranker
-            reranking_results = self.reranker_instance.rank(
-                query=query_text, docs=reranker_docs
-            )
-
-            # Process the results from the reranker
-            # Convert to serializable dictionaries while preserving full structure
-            serialized_results = []
-            for result in reranking_results.results:
-                result_doc_id = result.document.doc_id
-                original_index = result.document.metadata.get("original_index")
-
-                # Find the original document by document_id
-                original_doc = None
-                for doc in documents:
-                    if doc.get("document_id") == result_doc_id:
-                        original_doc = doc
-                        break
-
-                # Fallback to original index if ID matching fails
-                if (
-                    original_doc is None
-                    and original_index is not None
-                    and 0 <= original_index < len(documents)
-                ):
-                    original_doc = documents[original_index]
-
-                if original_doc:
-                    # Create a deep copy to preserve the full structure including chunks
-                    reranked_doc = original_doc.copy()
-                    # Preserve chunks list if present (important for citation formatting)
-                    if "chunks" in original_doc:
-                        reranked_doc["chunks"] = original_doc["chunks"]
-                    reranked_doc["score"] = float(result.score)
-                    reranked_doc["rank"] = result.rank
-                    serialized_results.append(reranked_doc)
-
-            return serialized_results
+            reranker_docs = self._build_reranker_docs(documents)
+            started = time.perf_counter()
+            ranking = self._rank(query_text, reranker_docs)
+            self.last_timings = {
+                "queue_wait": 0.0,
+                "inference": time.perf_counter() - started,
+            }
+            return self._apply_ranking(documents, ranking)
 
         except Exception as e:
             # Log the error
@@ -109,6 +192,53 @@ class RerankerService:
             # Fall back to original documents without reranking
             return documents
 
+    async def arerank_documents(
+        self, query_text: str, documents: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Rerank documents on the reranker thread pool without blocking the event loop.
+
+        Time spent waiting for a free reranker worker and time spent in model
+        inference are logged and stored separately in `last_timings`.
+
+        Args:
+            query_text: The query text to use for reranking
+            documents: List of document dictionaries to rerank
+
+        Returns:
+            List[Dict[str, Any]]: Reranked documents with preserved structure
+        """
+        if not self.reranker_instance or not documents:
+            return documents
+
+        try:
+            reranker_docs = self._build_reranker_docs(documents)
+            submitted = time.perf_counter()
+
+            def run() -> tuple[list[tuple[int, float | None]], float, float]:
+                started = time.perf_counter()
+                ranking = self._rank(query_text, reranker_docs)
+                return ranking, started, time.perf_counter()
+
+            loop = asyncio.get_running_loop()
+            ranking, started, finished = await loop.run_in_executor(
+                _get_rerank_executor(), run
+            )
+            self.last_timings = {
+                "queue_wait": started - submitted,
+                "inference": finished - started,
+            }
+            logging.info(
+                f"Reranked {len(reranker_docs)} documents: "
+                f"queue wait {self.last_timings['queue_wait'] * 1000:.1f} ms, "
+                f"inference {self.last_timings['inference'] * 1000:.1f} ms"
+            )
+            return self._apply_ranking(documents, ranking)
+
+        except Exception as e:
+            logging.error(f"Error during reranking: {e!s}")
+            return documents
+
     @staticmethod
     def get_reranker_instance() -> Optional["RerankerService"]:
         """
@@ -0,0 +1,262 @@
+"""
+Service for caching knowledge base retrieval results.
+
+Results of `ConnectorService._combined_rrf_search` are cached per
+(search space, document type, query, date range, top_k). Every search space has
+a content version counter that is bumped whenever one of its documents is
+written, and cached results from an older version are ignored, so writes
+invalidate a search space's cache without having to enumerate its keys.
+
+The cache and version counters live in Redis so they are shared by all API and
+Celery worker processes; version bumps made by an indexing task must reach the
+API process. If Redis is not configured or unreachable, caching is disabled.
+Version bumps are sent from a worker thread when a commit happens on an event
+loop, so a slow Redis never stalls the committing request or task.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "surfsense:retrieval"
+
+# A slow or unreachable Redis fails cache operations quickly instead of
+# stalling searches and commits for the OS TCP timeout
+_SOCKET_TIMEOUT_SECONDS = 0.5
+
+
+class _RedisBackend:
+    """Redis backend shared by all processes."""
+
+    def __init__(self, redis_url: str):
+        import redis
+        import redis.asyncio as redis_async
+
+        self._redis_url = redis_url
+        timeouts = {
+            "socket_timeout": _SOCKET_TIMEOUT_SECONDS,
+            "socket_connect_timeout": _SOCKET_TIMEOUT_SECONDS,
+        }
+        self._client = redis_async.from_url(
+            redis_url, decode_responses=True, **timeouts
+        )
+        # Version bumps happen from synchronous SQLAlchemy session events
+        self._sync_client = redis.from_url(redis_url, decode_responses=True, **timeouts)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return await self._client.mget(keys)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._client.set(key, value, ex=ttl_seconds)
+
+    def incr(self, key: str) -> None:
+        self._sync_client.incr(key)
+
+
+class RetrievalCacheService:
+    """Service for caching retrieval results per search space content version."""
+
+    def __init__(self, backend, ttl_seconds: int = 600):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _version_key(search_space_id: int) -> str:
+        return f"{_KEY_PREFIX}:version:{search_space_id}"
+
+    @staticmethod
+    def _date_key(value: datetime | None) -> str:
+        # Keyed on the exact value; the implicit default range is already
+        # hour-aligned by resolve_date_range, so it maps to a stable key
+        if value is None:
+            return ""
+        return value.isoformat()
+
+    def _result_key(
+        self,
+        search_space_id: int,
+        document_type: str,
+        query_text: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        top_k: int,
+    ) -> str:
+        normalized_query = " ".join(query_text.split())
+        digest = hashlib.sha256(
+            "|".join(
+                [
+                    normalized_query,
+                    self._date_key(start_date),
+                    self._date_key(end_date),
+                    str(top_k),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{_KEY_PREFIX}:result:{search_space_id}:{document_type}:{digest}"
+
+    async def get_many(
+        self,
+        search_space_id: int,
+        document_types: list[str],
+        query_text: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        top_k: int,
+    ) -> tuple[int | None, dict[str, list[dict[str, Any]]]]:
+        """
+        Get cached results for several document types in one round trip.
+
+        Returns:
+            Tuple of (content version, dict of document type to cached results for
+            cache hits). The version is None if the cache is unreachable and must be
+            passed to `set` when caching freshly computed results.
+        """
+        keys = [self._version_key(search_space_id)] + [
+            self._result_key(
+                search_space_id, document_type, query_text, start_date, end_date, top_k
+            )
+            for document_type in document_types
+        ]
+        try:
+            values = await self.backend.mget(keys)
+        except Exception as e:
+            logger.warning(f"Retrieval cache lookup failed: {e!s}")
+            return None, {}
+
+        version = int(values[0] or 0)
+        cached: dict[str, list[dict[str, Any]]] = {}
+        for document_type, value in zip(document_types, values[1:], strict=True):
+            if value is not None:
+                payload = json.loads(value)
+                if payload.get("version") == version:
+                    cached[document_type] = payload["results"]
+                    continue
+            self.misses += 1
+        self.hits += len(cached)
+        return version, cached
+
+    async def set(
+        self,
+        search_space_id: int,
+        document_type: str,
+        query_text: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        top_k: int,
+        version: int | None,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """
+        Cache results for one document type.
+
+        `version` must be the one returned by `get_many` before the results were
+        computed, so results racing with a document write are tagged with the
+        older version and ignored afterwards.
+        """
+        if version is None:
+            return
+
+        try:
+            payload = json.dumps({"version": version, "results": results}, default=str)
+            await self.backend.set(
+                self._result_key(
+                    search_space_id,
+                    document_type,
+                    query_text,
+                    start_date,
+                    end_date,
+                    top_k,
+                ),
+                payload,
+                self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Retrieval cache write failed: {e!s}")
+
+    def bump_search_space_version(self, search_space_id: int) -> None:
+        """Invalidate all cached results for a search space."""
+        try:
+            self.backend.incr(self._version_key(search_space_id))
+        except Exception as e:
+            logger.warning(
+                f"Failed to bump content version for search space {search_space_id}: {e!s}"
+            )
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_retrieval_cache: RetrievalCacheService | None = None
+_retrieval_cache_initialized = False
+
+
+def get_retrieval_cache() -> RetrievalCacheService | None:
+    """
+    Get the process-wide retrieval cache.
+
+    Returns:
+        The cache, or None if RETRIEVAL_CACHE_ENABLED is false or Redis is
+        unavailable
+    """
+    global _retrieval_cache, _retrieval_cache_initialized
+
+    if _retrieval_cache_initialized:
+        return _retrieval_cache
+
+    from app.config import config
+
+    _retrieval_cache_initialized = True
+    if not config.RETRIEVAL_CACHE_ENABLED:
+        return None
+
+    if not config.RETRIEVAL_CACHE_REDIS_URL:
+        logger.warning("Retrieval cache disabled: no Redis URL configured")
+        return None
+
+    try:
+        backend = _RedisBackend(config.RETRIEVAL_CACHE_REDIS_URL)
+        backend._sync_client.ping()
+    except Exception as e:
+        # A per-process cache would never see version bumps made by other
+        # processes and would serve stale results
+        logger.warning(f"Retrieval cache disabled: could not connect to Redis: {e!s}")
+        return None
+
+    _retrieval_cache = RetrievalCacheService(
+        backend, ttl_seconds=config.RETRIEVAL_CACHE_TTL_SECONDS
+    )
+    return _retrieval_cache
+
+
+def _bump_versions(cache: RetrievalCacheService, search_space_ids: list[int]) -> None:
+    for search_space_id in search_space_ids:
+        cache.bump_search_space_version(search_space_id)
+
+
+def bump_search_space_versions(search_space_ids: set[int]) -> None:
+    """Bump the content version of each given search space, if caching is enabled."""
+    cache = get_retrieval_cache()
+    if cache is None:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _bump_versions(cache, list(search_space_ids))
+        return
+
+    # Committed on the event loop; the sync client is used from a thread since
+    # the async one is bound to a single loop and Celery tasks each run their own
+    loop.run_in_executor(None, _bump_versions, cache, list(search_space_ids))
@@ -1,12 +1,43 @@
-"""Local Speech-to-Text service using Faster-Whisper."""
+"""
+Local Speech-to-Text service using Faster-Whisper.
 
+Transcriptions run in a pool of worker processes that each load the Whisper
+model once, so they never block the event loop and several recordings are
+transcribed in parallel. Long recordings are cut at silences found by voice
+activity detection into windows of about STT_SEGMENT_SECONDS, which are
+transcribed concurrently and streamed back in order as partial text. Where
+child processes cannot be started (Celery prefork workers are daemonic) or
+STT_WORKERS is 0, windows are transcribed on worker threads sharing one model.
+
+At most STT_QUEUE_SIZE windows are transcribed or waiting for a worker at once,
+counting windows still running for requests that timed out or were abandoned,
+and every request gives up after STT_TIMEOUT_SECONDS.
+"""
+
+import asyncio
+import logging
+import multiprocessing
 import os
 import tempfile
+import threading
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 from faster_whisper import WhisperModel
 
 from app.config import config
+from app.utils.executor_slots import ExecutorSlots
+
+logger = logging.getLogger(__name__)
+
+# Sampling rate Whisper models expect
+_SAMPLING_RATE = 16000
+
+# Silence that may separate two windows of a long recording
+_VAD_MIN_SILENCE_MS = 500
 
 
 class STTService:
@@ -21,24 +52,35 @@ class STTService:
         else:
             self.model_size = "base"  # fallback
         self._model: WhisperModel | None = None
+        self._model_lock = threading.Lock()
+
+    def _get_model(self, num_workers: int = 1) -> WhisperModel:
+        """
+        Lazy load the Whisper model.
 
-    def _get_model(self) -> WhisperModel:
-        """Lazy load the Whisper model."""
+        Args:
+            num_workers: Number of transcriptions the model may run concurrently
+                from different threads
+        """
         if self._model is None:
-            # Use CPU with optimizations for better performance
-            self._model = WhisperModel(
-                self.model_size,
-                device="cpu",
-                compute_type="int8",  # Quantization for faster CPU inference
-                num_workers=1,  # Single worker for stability
-            )
+            with self._model_lock:
+                if self._model is None:
+                    # Use CPU with optimizations for better performance
+                    self._model = WhisperModel(
+                        self.model_size,
+                        device="cpu",
+                        compute_type="int8",  # Quantization for faster CPU inference
+                        num_workers=num_workers,
+                    )
         return self._model
 
-    def transcribe_file(self, audio_path: str, language: str | None = None) -> dict:
-        """Transcribe audio file to text.
+    def transcribe_audio(self, audio, language: str | None = None) -> dict:
+        """Transcribe audio (a file path or 16 kHz mono samples) to text.
+
+        Blocking; runs in an STT worker process or thread.
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to an audio file, or a numpy array of samples
             language: Optional language code (e.g., "en", "es")
 
         Returns:
@@ -48,13 +90,13 @@ class STTService:
 
         # Transcribe with optimized settings
         segments, info = model.transcribe(
-            audio_path,
+            audio,
             language=language,
             beam_size=1,  # Faster inference
             best_of=1,  # Single pass
             temperature=0,  # Deterministic output
             vad_filter=True,  # Voice activity detection
-            vad_parameters={"min_silence_duration_ms": 500},
+            vad_parameters={"min_silence_duration_ms": _VAD_MIN_SILENCE_MS},
         )
 
         # Combine all segments
@@ -67,6 +109,20 @@ class STTService:
             "duration": info.duration,
         }
 
+    def transcribe_file(self, audio_path: str, language: str | None = None) -> dict:
+        """Transcribe audio file to text.
+
+        Blocking; prefer atranscribe_file from async code.
+
+        Args:
+            audio_path: Path to audio file
+            language: Optional language code (e.g., "en", "es")
+
+        Returns:
+            Dict with transcription text and metadata
+        """
+        return self.transcribe_audio(audio_path, language)
+
     def transcribe_bytes(
         self,
         audio_bytes: bytes,
@@ -95,6 +151,249 @@ class STTService:
             # Clean up temp file
             os.unlink(tmp_path)
 
+    async def astream_transcription(
+        self,
+        audio_path: str,
+        language: str | None = None,
+        timeout: float | None = None,
+    ) -> AsyncIterator[dict]:
+        """Transcribe an audio file without blocking, yielding partial text.
+
+        Windows of a long recording are transcribed concurrently and yielded in
+        order as soon as every earlier window is done.
+
+        Args:
+            audio_path: Path to audio file
+            language: Optional language code (e.g., "en", "es")
+            timeout: Seconds the whole transcription may take, defaults to
+                STT_TIMEOUT_SECONDS
+
+        Yields:
+            Dicts with the text of a window, its start and end in seconds, the
+            detected language and the transcribed fraction of the recording
+
+        Raises:
+            TimeoutError: If the transcription exceeds the timeout
+        """
+        timeout = timeout if timeout is not None else config.STT_TIMEOUT_SECONDS
+        deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+
+        audio = await asyncio.to_thread(_decode_audio, audio_path)
+        duration = len(audio) / _SAMPLING_RATE
+        windows = await asyncio.to_thread(_split_at_silences, audio)
+        if len(windows) > 1:
+            logger.info(
+                f"Transcribing {duration:.0f}s of audio in {len(windows)} windows"
+            )
+
+        tasks = [
+            asyncio.ensure_future(
+                _transcribe_off_loop(self, audio[start:end], language)
+            )
+            for start, end in windows
+        ]
+        try:
+            for (start, end), task in zip(windows, tasks, strict=True):
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(task), remaining)
+                except TimeoutError:
+                    raise TimeoutError(
+                        f"Transcription of {Path(audio_path).name} exceeded {timeout}s"
+                    ) from None
+
+                yield {
+                    "text": result["text"],
+                    "start": start / _SAMPLING_RATE,
+                    "end": end / _SAMPLING_RATE,
+                    "language": result["language"],
+                    "language_probability": result["language_probability"],
+                    "duration": duration,
+                    "progress": end / len(audio) if len(audio) else 1.0,
+                }
+        finally:
+            # Drop windows still waiting for a worker
+            for task in tasks:
+                task.cancel()
+
+    async def atranscribe_file(
+        self,
+        audio_path: str,
+        language: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """Transcribe an audio file to text without blocking the event loop.
+
+        Args:
+            audio_path: Path to audio file
+            language: Optional language code (e.g., "en", "es")
+            timeout: Seconds the transcription may take, defaults to
+                STT_TIMEOUT_SECONDS
+
+        Returns:
+            Dict with transcription text and metadata
+        """
+        texts = []
+        result = {
+            "language": language,
+            "language_probability": None,
+            "duration": 0.0,
+        }
+        async for partial in self.astream_transcription(audio_path, language, timeout):
+            if partial["text"]:
+                texts.append(partial["text"])
+            if result["language_probability"] is None:
+                result["language"] = partial["language"]
+                result["language_probability"] = partial["language_probability"]
+            result["duration"] = partial["duration"]
+
+        return {"text": " ".join(texts), **result}
+
+
+def _decode_audio(audio_path: str):
+    from faster_whisper import decode_audio
+
+    return decode_audio(audio_path, sampling_rate=_SAMPLING_RATE)
+
+
+def _split_at_silences(audio) -> list[tuple[int, int]]:
+    """
+    Split audio into windows of about STT_SEGMENT_SECONDS, cut at silences.
+
+    Returns:
+        (start, end) sample offsets of the windows, covering the speech of
+        the recording in order
+    """
+    window_samples = int(config.STT_SEGMENT_SECONDS * _SAMPLING_RATE)
+    if window_samples <= 0 or len(audio) <= window_samples:
+        return [(0, len(audio))]
+
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(
+        audio, VadOptions(min_silence_duration_ms=_VAD_MIN_SILENCE_MS)
+    )
+    if not speech:
+        return [(0, len(audio))]
+
+    windows: list[tuple[int, int]] = []
+    window_start = speech[0]["start"]
+    window_end = speech[0]["end"]
+    for chunk in speech[1:]:
+        if chunk["end"] - window_start > window_samples:
+            windows.append((window_start, window_end))
+            window_start = chunk["start"]
+        window_end = chunk["end"]
+    windows.append((window_start, window_end))
+    return windows
+
+
+# STT service of a transcription worker process
+_worker_service: STTService | None = None
+
+
+def _init_stt_worker() -> None:
+    """Load the Whisper model once per transcription worker process."""
+    global _worker_service
+
+    _worker_service = STTService()
+    _worker_service._get_model()
+
+
+def _transcribe_in_worker(audio, language: str | None) -> dict:
+    return _worker_service.transcribe_audio(audio, language)
+
+
+_stt_pool: ProcessPoolExecutor | None = None
+_stt_slots: ExecutorSlots | None = None
+# Runs transcriptions when they run on threads of this process
+_in_process_executor: ThreadPoolExecutor | None = None
+_stt_pool_lock = threading.Lock()
+
+
+def _get_stt_slots() -> ExecutorSlots:
+    """Slots bounding the windows transcribed or queued at once."""
+    global _stt_slots, _in_process_executor
+
+    if _stt_slots is None:
+        with _stt_pool_lock:
+            if _stt_slots is None:
+                _in_process_executor = ThreadPoolExecutor(
+                    max_workers=max(1, config.STT_WORKERS),
+                    thread_name_prefix="stt-transcription",
+                )
+                _stt_slots = ExecutorSlots(config.STT_QUEUE_SIZE)
+    return _stt_slots
+
+
+def _get_stt_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the transcription worker pool, or None if transcriptions must run
+    in-process.
+
+    Daemonic processes (such as Celery prefork workers) cannot have children.
+    """
+    global _stt_pool
+
+    if config.STT_WORKERS <= 0 or multiprocessing.current_process().daemon:
+        return None
+
+    if _stt_pool is None:
+        with _stt_pool_lock:
+            if _stt_pool is None:
+                _stt_pool = ProcessPoolExecutor(
+                    max_workers=config.STT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_stt_worker,
+                )
+                logger.info(f"Started {config.STT_WORKERS} STT worker processes")
+    return _stt_pool
+
+
+def _transcribe_in_process(service: STTService, audio, language: str | None) -> dict:
+    service._get_model(num_workers=max(1, config.STT_WORKERS))
+    return service.transcribe_audio(audio, language)
+
+
+async def _transcribe_off_loop(
+    service: STTService, audio, language: str | None
+) -> dict:
+    """Transcribe audio samples without blocking the event loop."""
+    global _stt_pool
+
+    # The slot is held until the window is transcribed, even if this is
+    # cancelled by a timeout or a disconnected client
+    slots = _get_stt_slots()
+    pool = _get_stt_pool()
+    if pool is None:
+        future = await slots.submit(
+            _in_process_executor, _transcribe_in_process, service, audio, language
+        )
+        return await asyncio.wrap_future(future)
+
+    future = await slots.submit(pool, _transcribe_in_worker, audio, language)
+    try:
+        return await asyncio.wrap_future(future)
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); start a fresh pool next time
+        with _stt_pool_lock:
+            if _stt_pool is pool:
+                _stt_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_stt_workers() -> None:
+    """Stop the transcription worker processes, if they were started."""
+    global _stt_pool
+
+    with _stt_pool_lock:
+        pool, _stt_pool = _stt_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 # Global STT service instance
 stt_service = STTService()
@@ -686,11 +686,16 @@ async def _index_crawled_urls(
     from app.routes.search_source_connectors_routes import (
         run_web_page_indexing,
     )
+    from app.services.browser_pool_service import close_browser_pool
 
-    async with get_celery_session_maker()() as session:
-        await run_web_page_indexing(
-            session, connector_id, search_space_id, user_id, start_date, end_date
-        )
+    try:
+        async with get_celery_session_maker()() as session:
+            await run_web_page_indexing(
+                session, connector_id, search_space_id, user_id, start_date, end_date
+            )
+    finally:
+        # The browser is bound to this task's event loop, which is closed next
+        await close_browser_pool()
 
 
 @celery_app.task(name="index_bookstack_pages", bind=True)
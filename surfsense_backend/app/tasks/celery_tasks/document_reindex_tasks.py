@@ -2,7 +2,7 @@
 
 import logging
 
-from sqlalchemy import delete, select
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
@@ -15,8 +15,8 @@ from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
 from app.utils.blocknote_converter import convert_blocknote_to_markdown
 from app.utils.document_converters import (
-    create_document_chunks,
     generate_document_summary,
+    rechunk_document_content,
 )
 
 logger = logging.getLogger(__name__)
@@ -109,23 +109,20 @@ async def _reindex_document(document_id: int, user_id: str):
                 )
                 return
 
-            # 2. Delete old chunks explicitly
-            from app.db import Chunk
-
-            await session.execute(delete(Chunk).where(Chunk.document_id == document_id))
-            await session.flush()  # Ensure old chunks are deleted
-
-            # 3. Create new chunks
-            new_chunks = await create_document_chunks(markdown_content)
+            # 2. Re-chunk, keeping unchanged chunks and their embeddings
+            new_chunks, rechunk_stats = await rechunk_document_content(
+                markdown_content, document.chunks
+            )
 
-            # 4. Add new chunks to session
-            for chunk in new_chunks:
-                chunk.document_id = document_id
-                session.add(chunk)
+            # 3. Replace the chunks; rows that are not kept are deleted as orphans
+            document.chunks = new_chunks
 
-            logger.info(f"Created {len(new_chunks)} chunks for document {document_id}")
+            logger.info(
+                f"Rechunked document {document_id}: {len(new_chunks)} chunks, "
+                f"{rechunk_stats['reembedded_fraction']:.0%} re-embedded"
+            )
 
-            # 5. Regenerate summary
+            # 4. Regenerate summary
             user_llm = await get_user_long_context_llm(
                 session, user_id, document.search_space_id
             )
@@ -139,7 +136,7 @@ async def _reindex_document(document_id: int, user_id: str):
                 markdown_content, user_llm, document_metadata
             )
 
-            # 6. Update document
+            # 5. Update document
             document.content = summary_content
             document.embedding = summary_embedding
             document.content_needs_reindexing = False
@@ -153,6 +150,7 @@ async def _reindex_document(document_id: int, user_id: str):
                 {
                     "chunks_created": len(new_chunks),
                     "document_id": document_id,
+                    **rechunk_stats,
                 },
             )
 
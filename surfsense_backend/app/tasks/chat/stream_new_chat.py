@@ -25,7 +25,7 @@ from app.agents.new_chat.llm_config import (
     load_agent_config,
     load_llm_config_from_yaml,
 )
-from app.db import Document
+from app.db import Document, async_session_maker
 from app.schemas.new_chat import ChatAttachment
 from app.services.connector_service import ConnectorService
 from app.services.new_streaming_service import VercelStreamingService
@@ -168,7 +168,13 @@ async def stream_new_chat(
             return
 
         # Create connector service
-        connector_service = ConnectorService(session, search_space_id=search_space_id)
+        # Searches open their own short-lived sessions so connectors can be searched
+        # concurrently by the knowledge base tool
+        connector_service = ConnectorService(
+            session,
+            search_space_id=search_space_id,
+            session_factory=async_session_maker,
+        )
 
         # Get Firecrawl API key from webcrawler connector if configured
         from app.db import SearchSourceConnectorType
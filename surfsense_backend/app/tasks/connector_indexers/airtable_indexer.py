@@ -10,6 +10,7 @@ from app.connectors.airtable_history import AirtableHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -199,6 +200,7 @@ async def index_airtable_records(
                     logger.info(f"Found {len(records)} records in table {table_name}")
 
                     documents_indexed = 0
+                    document_writer = BulkDocumentWriter(session)
                     skipped_messages = []
                     documents_skipped = 0
                     # Process each record
@@ -290,7 +292,7 @@ async def index_airtable_records(
 
                                     # Process chunks
                                     chunks = await create_document_chunks(
-                                        markdown_content
+                                        markdown_content, existing_document.chunks
                                     )
 
                                     # Update existing document
@@ -368,7 +370,9 @@ async def index_airtable_records(
                                 updated_at=get_current_timestamp(),
                             )
 
-                            session.add(document)
+                            if not await document_writer.add(document):
+                                documents_skipped += 1
+                                continue
                             documents_indexed += 1
                             logger.info(
                                 f"Successfully indexed new Airtable record {summary_content}"
@@ -395,6 +399,9 @@ async def index_airtable_records(
                     # Accumulate total processed across all tables
                     total_processed += documents_indexed
 
+                    # Write new documents still buffered by the bulk writer
+                    await document_writer.flush()
+
                     # Final commit for any remaining documents not yet committed in batches
                     if documents_indexed > 0:
                         logger.info(
@@ -71,6 +71,43 @@ async def check_document_by_unique_identifier(
     return existing_doc_result.scalars().first()
 
 
+# Maximum number of hashes sent in a single IN (...) lookup
+_UNIQUE_IDENTIFIER_LOOKUP_BATCH_SIZE = 1000
+
+
+async def check_documents_by_unique_identifiers(
+    session: AsyncSession, unique_identifier_hashes: list[str]
+) -> dict[str, tuple[int, str]]:
+    """
+    Look up which of the given unique identifier hashes are already indexed.
+
+    Unlike check_document_by_unique_identifier this loads neither documents nor
+    their chunks, so indexers can skip unchanged items with one query per batch
+    and only load the full documents they are going to update.
+
+    Args:
+        session: Database session
+        unique_identifier_hashes: Hashes of the unique identifiers from the source system
+
+    Returns:
+        Dict mapping each indexed unique identifier hash to (document_id, content_hash)
+    """
+    hashes = list(dict.fromkeys(h for h in unique_identifier_hashes if h))
+    existing: dict[str, tuple[int, str]] = {}
+
+    for start in range(0, len(hashes), _UNIQUE_IDENTIFIER_LOOKUP_BATCH_SIZE):
+        batch = hashes[start : start + _UNIQUE_IDENTIFIER_LOOKUP_BATCH_SIZE]
+        result = await session.execute(
+            select(
+                Document.unique_identifier_hash, Document.id, Document.content_hash
+            ).where(Document.unique_identifier_hash.in_(batch))
+        )
+        for unique_identifier_hash, document_id, content_hash in result.all():
+            existing[unique_identifier_hash] = (document_id, content_hash)
+
+    return existing
+
+
 async def get_connector_by_id(
     session: AsyncSession, connector_id: int, connector_type: SearchSourceConnectorType
 ) -> SearchSourceConnector | None:
@@ -12,6 +12,7 @@ from app.connectors.bookstack_connector import BookStackConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -175,6 +176,7 @@ async def index_bookstack_pages(
 
         # Process and index each page
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         skipped_pages = []
         documents_skipped = 0
 
@@ -293,7 +295,9 @@ async def index_bookstack_pages(
                             )
 
                         # Process chunks
-                        chunks = await create_document_chunks(full_content)
+                        chunks = await create_document_chunks(
+                            full_content, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"BookStack - {page_name}"
@@ -361,7 +365,9 @@ async def index_bookstack_pages(
                     updated_at=get_current_timestamp(),
                 )
 
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(f"Successfully indexed new page {page_name}")
 
@@ -388,6 +394,9 @@ async def index_bookstack_pages(
         if update_last_indexed:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(
             f"Final commit: Total {documents_indexed} BookStack pages processed"
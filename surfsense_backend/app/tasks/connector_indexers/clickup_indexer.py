@@ -13,6 +13,7 @@ from app.connectors.clickup_history import ClickUpHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -129,6 +130,7 @@ async def index_clickup_tasks(
             return 0, error_msg
 
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
 
         # Iterate workspaces and fetch tasks
@@ -273,7 +275,9 @@ async def index_clickup_tasks(
                                 )
 
                             # Process chunks
-                            chunks = await create_document_chunks(task_content)
+                            chunks = await create_document_chunks(
+                                task_content, existing_document.chunks
+                            )
 
                             # Update existing document
                             existing_document.title = f"Task - {task_name}"
@@ -358,7 +362,9 @@ async def index_clickup_tasks(
                         updated_at=get_current_timestamp(),
                     )
 
-                    session.add(document)
+                    if not await document_writer.add(document):
+                        documents_skipped += 1
+                        continue
                     documents_indexed += 1
                     logger.info(f"Successfully indexed new task {task_name}")
 
@@ -381,6 +387,9 @@ async def index_clickup_tasks(
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} ClickUp tasks processed")
         await session.commit()
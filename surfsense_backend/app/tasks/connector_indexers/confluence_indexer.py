@@ -13,6 +13,7 @@ from app.connectors.confluence_history import ConfluenceHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -171,6 +172,7 @@ async def index_confluence_pages(
 
         # Process and index each page
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         skipped_pages = []
         documents_skipped = 0
 
@@ -283,7 +285,9 @@ async def index_confluence_pages(
                             )
 
                         # Process chunks
-                        chunks = await create_document_chunks(full_content)
+                        chunks = await create_document_chunks(
+                            full_content, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Confluence - {page_title}"
@@ -367,7 +371,9 @@ async def index_confluence_pages(
                     updated_at=get_current_timestamp(),
                 )
 
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(f"Successfully indexed new page {page_title}")
 
@@ -394,6 +400,9 @@ async def index_confluence_pages(
         if update_last_indexed:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(
             f"Final commit: Total {documents_indexed} Confluence pages processed"
@@ -12,6 +12,7 @@ from app.config import config
 from app.connectors.discord_connector import DiscordConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -277,6 +278,7 @@ async def index_discord_messages(
 
         # Track results
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
         skipped_channels: list[str] = []
 
@@ -417,7 +419,8 @@ async def index_discord_messages(
 
                                     # Update chunks and embedding
                                     chunks = await create_document_chunks(
-                                        combined_document_string
+                                        combined_document_string,
+                                        existing_document.chunks,
                                     )
                                     doc_embedding = (
                                         config.embedding_model_instance.embed(
@@ -488,7 +491,9 @@ async def index_discord_messages(
                                 updated_at=get_current_timestamp(),
                             )
 
-                            session.add(document)
+                            if not await document_writer.add(document):
+                                documents_skipped += 1
+                                continue
                             documents_indexed += 1
 
                             # Batch commit every 10 documents
@@ -516,6 +521,9 @@ async def index_discord_messages(
         if documents_indexed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(
             f"Final commit: Total {documents_indexed} Discord messages processed"
@@ -13,6 +13,7 @@ from sqlalchemy.future import select
 from app.connectors.elasticsearch_connector import ElasticsearchConnector
 from app.db import Document, DocumentType, SearchSourceConnector
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -154,6 +155,7 @@ async def index_elasticsearch_documents(
         )
 
         documents_processed = 0
+        document_writer = BulkDocumentWriter(session)
 
         try:
             await task_logger.log_task_progress(
@@ -251,7 +253,9 @@ async def index_elasticsearch_documents(
                             existing_doc.content_hash = content_hash
                             existing_doc.document_metadata = metadata
                             existing_doc.unique_identifier_hash = unique_identifier_hash
-                            chunks = await create_document_chunks(content)
+                            chunks = await create_document_chunks(
+                                content, existing_doc.chunks
+                            )
                             existing_doc.chunks = chunks
                             existing_doc.updated_at = get_current_timestamp()
                             await session.flush()
@@ -275,8 +279,8 @@ async def index_elasticsearch_documents(
                     # Create chunks and attach to document (persist via relationship)
                     chunks = await create_document_chunks(content)
                     document.chunks = chunks
-                    session.add(document)
-                    await session.flush()
+                    if not await document_writer.add(document):
+                        continue
 
                     documents_processed += 1
 
@@ -300,6 +304,9 @@ async def index_elasticsearch_documents(
                     )
                     continue
 
+            # Write new documents still buffered by the bulk writer
+            await document_writer.flush()
+
             # Final commit
             await session.commit()
 
@@ -2,6 +2,7 @@
 GitHub connector indexer.
 """
 
+import asyncio
 from datetime import UTC, datetime
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,6 +13,7 @@ from app.connectors.github_connector import GitHubConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -21,12 +23,79 @@ from app.utils.document_converters import (
 
 from .base import (
     check_document_by_unique_identifier,
+    check_documents_by_unique_identifiers,
     get_connector_by_id,
     get_current_timestamp,
     logger,
 )
 
 
+async def _filter_unchanged_files(
+    session: AsyncSession, files: list[dict], search_space_id: int
+) -> tuple[list[dict], int]:
+    """
+    Drop files whose blob sha is already indexed, before downloading any content.
+
+    GitHub documents are identified by their blob sha, so an indexed sha means
+    the file content has not changed since it was indexed.
+
+    Returns:
+        Tuple of (files to download and index, number of unchanged files skipped)
+    """
+    file_hashes = [
+        (
+            file_info,
+            generate_unique_identifier_hash(
+                DocumentType.GITHUB_CONNECTOR, file_info["sha"], search_space_id
+            )
+            if file_info.get("sha")
+            else None,
+        )
+        for file_info in files
+    ]
+    hashes = [file_hash for _file_info, file_hash in file_hashes if file_hash]
+    if not hashes:
+        return files, 0
+
+    indexed = await check_documents_by_unique_identifiers(session, hashes)
+    remaining = [
+        file_info
+        for file_info, file_hash in file_hashes
+        if file_hash is None or file_hash not in indexed
+    ]
+    return remaining, len(files) - len(remaining)
+
+
+async def _iter_file_contents(
+    github_client: GitHubConnector, repo_full_name: str, files: list[dict]
+):
+    """
+    Yield (file_info, content) for each file, downloading blobs concurrently.
+
+    Blobs are fetched GITHUB_BLOB_FETCH_CONCURRENCY at a time in worker threads
+    (the GitHub client is synchronous), and each batch is yielded before the next
+    one is downloaded so memory stays bounded.
+    """
+    batch_size = max(1, config.GITHUB_BLOB_FETCH_CONCURRENCY)
+    for start in range(0, len(files), batch_size):
+        batch = files[start : start + batch_size]
+        contents = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    github_client.get_blob_content,
+                    repo_full_name,
+                    file_info.get("sha"),
+                    file_info.get("path", ""),
+                )
+                if file_info.get("sha")
+                else asyncio.sleep(0, result=None)
+                for file_info in batch
+            )
+        )
+        for file_info, content in zip(batch, contents, strict=True):
+            yield file_info, content
+
+
 async def index_github_repos(
     session: AsyncSession,
     connector_id: int,
@@ -67,6 +136,7 @@ async def index_github_repos(
     )
 
     documents_processed = 0
+    document_writer = BulkDocumentWriter(session)
     errors = []
 
     try:
@@ -166,18 +236,27 @@ async def index_github_repos(
 
             logger.info(f"Processing repository: {repo_full_name}")
             try:
-                files_to_index = github_client.get_repository_files(repo_full_name)
+                # List the whole repository with one tree request, off the event loop
+                files_to_index = await asyncio.to_thread(
+                    github_client.get_repository_files, repo_full_name
+                )
                 if not files_to_index:
                     logger.info(
                         f"No indexable files found in repository: {repo_full_name}"
                     )
                     continue
 
+                files_to_index, unchanged_count = await _filter_unchanged_files(
+                    session, files_to_index, search_space_id
+                )
                 logger.info(
-                    f"Found {len(files_to_index)} files to process in {repo_full_name}"
+                    f"Found {len(files_to_index) + unchanged_count} files in {repo_full_name}: "
+                    f"{unchanged_count} unchanged since last run, {len(files_to_index)} to process"
                 )
 
-                for file_info in files_to_index:
+                async for file_info, file_content in _iter_file_contents(
+                    github_client, repo_full_name, files_to_index
+                ):
                     file_path = file_info.get("path")
                     file_url = file_info.get("url")
                     file_sha = file_info.get("sha")
@@ -190,11 +269,6 @@ async def index_github_repos(
                         )
                         continue
 
-                    # Get file content
-                    file_content = github_client.get_file_content(
-                        repo_full_name, file_path
-                    )
-
                     if file_content is None:
                         logger.warning(
                             f"Could not retrieve content for {full_path_key}. Skipping."
@@ -262,11 +336,13 @@ async def index_github_repos(
                             try:
                                 if hasattr(config, "code_chunker_instance"):
                                     chunks_data = [
-                                        await create_document_chunks(file_content)
+                                        await create_document_chunks(
+                                            file_content, existing_document.chunks
+                                        )
                                     ][0]
                                 else:
                                     chunks_data = await create_document_chunks(
-                                        file_content
+                                        file_content, existing_document.chunks
                                     )
                             except Exception as chunk_err:
                                 logger.error(
@@ -381,7 +457,8 @@ async def index_github_repos(
                         chunks=chunks_data,  # Associate chunks directly
                         updated_at=get_current_timestamp(),
                     )
-                    session.add(document)
+                    if not await document_writer.add(document):
+                        continue
                     documents_processed += 1
 
                     # Batch commit every 10 documents
@@ -397,6 +474,9 @@ async def index_github_repos(
                 )
                 errors.append(f"Failed processing {repo_full_name}: {repo_err}")
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_processed} GitHub files processed")
         await session.commit()
@@ -12,6 +12,7 @@ from app.connectors.google_calendar_connector import GoogleCalendarConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -264,6 +265,7 @@ async def index_google_calendar_events(
             return 0, f"Error fetching Google Calendar events: {e!s}"
 
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
         skipped_events = []
 
@@ -361,7 +363,9 @@ async def index_google_calendar_events(
                             )
 
                         # Process chunks
-                        chunks = await create_document_chunks(event_markdown)
+                        chunks = await create_document_chunks(
+                            event_markdown, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Calendar Event - {event_summary}"
@@ -448,7 +452,9 @@ async def index_google_calendar_events(
                     updated_at=get_current_timestamp(),
                 )
 
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(f"Successfully indexed new event {event_summary}")
 
@@ -474,6 +480,9 @@ async def index_google_calendar_events(
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(
             f"Final commit: Total {documents_indexed} Google Calendar events processed"
@@ -16,6 +16,7 @@ from app.db import (
 )
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -185,6 +186,7 @@ async def index_google_gmail_messages(
         logger.info(f"Found {len(messages)} Google gmail messages to index")
 
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         skipped_messages = []
         documents_skipped = 0
         for message in messages:
@@ -283,7 +285,9 @@ async def index_google_gmail_messages(
                             )
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        chunks = await create_document_chunks(
+                            markdown_content, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Gmail: {subject}"
@@ -360,7 +364,9 @@ async def index_google_gmail_messages(
                     chunks=chunks,
                     updated_at=get_current_timestamp(),
                 )
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(f"Successfully indexed new email {summary_content}")
 
@@ -385,6 +391,9 @@ async def index_google_gmail_messages(
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Gmail messages processed")
         await session.commit()
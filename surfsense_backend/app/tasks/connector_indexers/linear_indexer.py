@@ -12,6 +12,7 @@ from app.connectors.linear_connector import LinearConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -22,6 +23,7 @@ from app.utils.document_converters import (
 from .base import (
     calculate_date_range,
     check_document_by_unique_identifier,
+    check_documents_by_unique_identifiers,
     get_connector_by_id,
     get_current_timestamp,
     logger,
@@ -184,6 +186,7 @@ async def index_linear_issues(
 
         # Track the number of documents indexed
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
         skipped_issues = []
 
@@ -193,6 +196,18 @@ async def index_linear_issues(
             {"stage": "process_issues", "total_issues": len(issues)},
         )
 
+        # Look up all already indexed issues at once instead of once per issue
+        existing_documents = await check_documents_by_unique_identifiers(
+            session,
+            [
+                generate_unique_identifier_hash(
+                    DocumentType.LINEAR_CONNECTOR, issue["id"], search_space_id
+                )
+                for issue in issues
+                if issue.get("id")
+            ],
+        )
+
         # Process each issue
         for issue in issues:
             try:
@@ -232,9 +247,22 @@ async def index_linear_issues(
                 # Generate content hash
                 content_hash = generate_content_hash(issue_content, search_space_id)
 
-                # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
+                # Skip unchanged issues without loading their documents
+                existing = existing_documents.get(unique_identifier_hash)
+                if existing and existing[1] == content_hash:
+                    logger.info(
+                        f"Document for Linear issue {issue_identifier} unchanged. Skipping."
+                    )
+                    documents_skipped += 1
+                    continue
+
+                # Load the full document only when it is going to be updated
+                existing_document = (
+                    await check_document_by_unique_identifier(
+                        session, unique_identifier_hash
+                    )
+                    if existing
+                    else None
                 )
 
                 state = formatted_issue.get("state", "Unknown")
@@ -289,7 +317,9 @@ async def index_linear_issues(
                             )
 
                         # Process chunks
-                        chunks = await create_document_chunks(issue_content)
+                        chunks = await create_document_chunks(
+                            issue_content, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = (
@@ -377,7 +407,9 @@ async def index_linear_issues(
                     updated_at=get_current_timestamp(),
                 )
 
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(
                     f"Successfully indexed new issue {issue_identifier} - {issue_title}"
@@ -406,6 +438,9 @@ async def index_linear_issues(
         if update_last_indexed:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Linear issues processed")
         await session.commit()
@@ -11,6 +11,7 @@ from app.connectors.notion_history import NotionHistoryConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -179,6 +180,7 @@ async def index_notion_pages(
 
         # Track the number of documents indexed
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
         skipped_pages = []
 
@@ -333,7 +335,9 @@ async def index_notion_pages(
                         )
 
                         # Process chunks
-                        chunks = await create_document_chunks(markdown_content)
+                        chunks = await create_document_chunks(
+                            markdown_content, existing_document.chunks
+                        )
 
                         # Update existing document
                         existing_document.title = f"Notion - {page_title}"
@@ -405,7 +409,9 @@ async def index_notion_pages(
                     updated_at=get_current_timestamp(),
                 )
 
-                session.add(document)
+                if not await document_writer.add(document):
+                    documents_skipped += 1
+                    continue
                 documents_indexed += 1
                 logger.info(f"Successfully indexed new Notion page: {page_title}")
 
@@ -433,6 +439,9 @@ async def index_notion_pages(
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} documents processed")
         await session.commit()
@@ -12,6 +12,7 @@ from app.config import config
 from app.connectors.slack_history import SlackHistory
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
@@ -22,6 +23,7 @@ from .base import (
     build_document_metadata_markdown,
     calculate_date_range,
     check_document_by_unique_identifier,
+    check_documents_by_unique_identifiers,
     get_connector_by_id,
     get_current_timestamp,
     logger,
@@ -160,6 +162,7 @@ async def index_slack_messages(
 
         # Track the number of documents indexed
         documents_indexed = 0
+        document_writer = BulkDocumentWriter(session)
         documents_skipped = 0
         skipped_channels = []
 
@@ -234,6 +237,19 @@ async def index_slack_messages(
                     documents_skipped += 1
                     continue  # Skip if no valid messages after filtering
 
+                # Look up the channel's already indexed messages in one query
+                existing_documents = await check_documents_by_unique_identifiers(
+                    session,
+                    [
+                        generate_unique_identifier_hash(
+                            DocumentType.SLACK_CONNECTOR,
+                            f"{channel_id}_{msg.get('ts', msg.get('datetime', 'Unknown Time'))}",
+                            search_space_id,
+                        )
+                        for msg in formatted_messages
+                    ],
+                )
+
                 for msg in formatted_messages:
                     timestamp = msg.get("datetime", "Unknown Time")
                     msg_ts = msg.get("ts", timestamp)  # Get original Slack timestamp
@@ -275,9 +291,22 @@ async def index_slack_messages(
                         combined_document_string, search_space_id
                     )
 
-                    # Check if document with this unique identifier already exists
-                    existing_document = await check_document_by_unique_identifier(
-                        session, unique_identifier_hash
+                    # Skip unchanged messages without loading their documents
+                    existing = existing_documents.get(unique_identifier_hash)
+                    if existing and existing[1] == content_hash:
+                        logger.info(
+                            f"Document for Slack message {msg_ts} in channel {channel_name} unchanged. Skipping."
+                        )
+                        documents_skipped += 1
+                        continue
+
+                    # Load the full document only when it is going to be updated
+                    existing_document = (
+                        await check_document_by_unique_identifier(
+                            session, unique_identifier_hash
+                        )
+                        if existing
+                        else None
                     )
 
                     if existing_document:
@@ -296,7 +325,7 @@ async def index_slack_messages(
 
                             # Update chunks and embedding
                             chunks = await create_document_chunks(
-                                combined_document_string
+                                combined_document_string, existing_document.chunks
                             )
                             doc_embedding = config.embedding_model_instance.embed(
                                 combined_document_string
@@ -353,7 +382,9 @@ async def index_slack_messages(
                         updated_at=get_current_timestamp(),
                     )
 
-                    session.add(document)
+                    if not await document_writer.add(document):
+                        documents_skipped += 1
+                        continue
                     documents_indexed += 1
 
                     # Batch commit every 10 documents
@@ -386,6 +417,9 @@ async def index_slack_messages(
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(f"Final commit: Total {documents_indexed} Slack channels processed")
         await session.commit()
@@ -1,8 +1,17 @@
 """
 Webcrawler connector indexer.
+
+URLs are processed in a pipeline: pages are fetched with bounded concurrency
+and per-domain politeness limits, content is extracted in worker threads,
+summaries and chunk embeddings are generated concurrently, and documents are
+written through the shared session with batched commits.
 """
 
+import asyncio
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from urllib.parse import urlparse
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,8 +21,10 @@ from app.connectors.webcrawler_connector import WebCrawlerConnector
 from app.db import Document, DocumentType, SearchSourceConnectorType
 from app.services.llm_service import get_user_long_context_llm
 from app.services.task_logging_service import TaskLoggingService
+from app.utils.bulk_document_writer import BulkDocumentWriter
 from app.utils.document_converters import (
     create_document_chunks,
+    embed_texts,
     generate_content_hash,
     generate_document_summary,
     generate_unique_identifier_hash,
@@ -28,6 +39,68 @@ from .base import (
 )
 
 
+class _DomainLimiter:
+    """Per-domain politeness: bounded concurrency and a minimum request interval."""
+
+    def __init__(self, max_per_domain: int, min_interval: float):
+        self.max_per_domain = max(1, max_per_domain)
+        self.min_interval = max(0.0, min_interval)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._next_request_at: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        domain = urlparse(url).netloc.lower()
+        semaphore = self._semaphores.setdefault(
+            domain, asyncio.Semaphore(self.max_per_domain)
+        )
+        async with semaphore:
+            # Reserve the next request slot for this domain before waiting for it
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at.get(domain, 0.0))
+            self._next_request_at[domain] = request_at + self.min_interval
+            if request_at > now:
+                await asyncio.sleep(request_at - now)
+            yield
+
+
+class _StageStats:
+    """Item count, busy time and active wall time of one pipeline stage."""
+
+    def __init__(self):
+        self.items = 0
+        self.busy_seconds = 0.0
+        self._first_start: float | None = None
+        self._last_end: float | None = None
+
+    @asynccontextmanager
+    async def measure(self):
+        started = time.monotonic()
+        if self._first_start is None:
+            self._first_start = started
+        try:
+            yield
+        finally:
+            self._last_end = time.monotonic()
+            self.busy_seconds += self._last_end - started
+            self.items += 1
+
+    def summary(self) -> dict:
+        wall_seconds = (
+            self._last_end - self._first_start
+            if self._first_start is not None and self._last_end is not None
+            else 0.0
+        )
+        return {
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 2),
+            "wall_seconds": round(wall_seconds, 2),
+            "items_per_minute": round(self.items * 60 / wall_seconds, 1)
+            if wall_seconds
+            else 0.0,
+        }
+
+
 async def index_crawled_urls(
     session: AsyncSession,
     connector_id: int,
@@ -139,232 +212,280 @@ async def index_crawled_urls(
             },
         )
 
+        # Duplicate URLs would race to insert the same document
+        urls = list(dict.fromkeys(urls))
+
+        # Same LLM for every URL
+        user_llm = await get_user_long_context_llm(session, user_id, search_space_id)
+
         documents_indexed = 0
         documents_updated = 0
         documents_skipped = 0
         failed_urls = []
 
-        for idx, url in enumerate(urls, 1):
-            try:
-                logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
-
-                await task_logger.log_task_progress(
-                    log_entry,
-                    f"Crawling URL {idx}/{len(urls)}: {url}",
-                    {
-                        "stage": "crawling_url",
-                        "url_index": idx,
-                        "url": url,
-                    },
-                )
-
-                # Crawl the URL
-                crawl_result, error = await crawler.crawl_url(url)
-
-                if error or not crawl_result:
-                    logger.warning(f"Failed to crawl URL {url}: {error}")
-                    failed_urls.append((url, error or "Unknown error"))
-                    continue
-
-                # Extract content and metadata
-                content = crawl_result.get("content", "")
-                metadata = crawl_result.get("metadata", {})
-                crawler_type = crawl_result.get("crawler_type", "unknown")
-
-                if not content.strip():
-                    logger.warning(f"Skipping URL with no content: {url}")
-                    failed_urls.append((url, "No content extracted"))
-                    documents_skipped += 1
-                    continue
-
-                # Format content as structured document for summary generation (includes all metadata)
-                structured_document = crawler.format_to_structured_document(
-                    crawl_result
-                )
-
-                # Generate unique identifier hash for this URL
-                unique_identifier_hash = generate_unique_identifier_hash(
-                    DocumentType.CRAWLED_URL, url, search_space_id
+        # The session cannot run concurrent operations, so every use is serialized
+        session_lock = asyncio.Lock()
+        document_writer = BulkDocumentWriter(session)
+        fetch_semaphore = asyncio.Semaphore(max(1, config.WEBCRAWLER_FETCH_CONCURRENCY))
+        extract_semaphore = asyncio.Semaphore(
+            max(1, config.WEBCRAWLER_EXTRACT_CONCURRENCY)
+        )
+        process_semaphore = asyncio.Semaphore(
+            max(1, config.WEBCRAWLER_PROCESS_CONCURRENCY)
+        )
+        # Bound the number of URLs held in memory between stages
+        in_flight_semaphore = asyncio.Semaphore(
+            4 * max(1, config.WEBCRAWLER_FETCH_CONCURRENCY)
+        )
+        domain_limiter = _DomainLimiter(
+            config.WEBCRAWLER_PER_DOMAIN_CONCURRENCY,
+            config.WEBCRAWLER_DOMAIN_DELAY_SECONDS,
+        )
+        commit_batch_size = max(1, config.WEBCRAWLER_COMMIT_BATCH_SIZE)
+        stage_stats = {
+            "fetch": _StageStats(),
+            "extract": _StageStats(),
+            "process": _StageStats(),
+            "write": _StageStats(),
+        }
+        pending_writes = 0
+
+        def extract(url: str, fetched: dict) -> tuple[dict, str, str]:
+            crawl_result = crawler.extract_content(url, fetched)
+            # Format content as structured document for summary generation (includes all metadata)
+            structured_document = crawler.format_to_structured_document(crawl_result)
+            # Generate content hash using a version WITHOUT metadata
+            # This ensures the hash only changes when actual content changes,
+            # not when metadata (which contains dynamic fields like timestamps, IDs, etc.) changes
+            structured_document_for_hash = crawler.format_to_structured_document(
+                crawl_result, exclude_metadata=True
+            )
+            content_hash = generate_content_hash(
+                structured_document_for_hash, search_space_id
+            )
+            return crawl_result, structured_document, content_hash
+
+        async def summarize(
+            url: str,
+            title: str,
+            description: str,
+            language: str,
+            crawler_type: str,
+            content: str,
+            structured_document: str,
+        ):
+            if user_llm:
+                document_metadata = {
+                    "url": url,
+                    "title": title,
+                    "description": description,
+                    "language": language,
+                    "document_type": "Crawled URL",
+                    "crawler_type": crawler_type,
+                }
+                return await generate_document_summary(
+                    structured_document, user_llm, document_metadata
                 )
 
-                # Generate content hash using a version WITHOUT metadata
-                # This ensures the hash only changes when actual content changes,
-                # not when metadata (which contains dynamic fields like timestamps, IDs, etc.) changes
-                structured_document_for_hash = crawler.format_to_structured_document(
-                    crawl_result, exclude_metadata=True
-                )
-                content_hash = generate_content_hash(
-                    structured_document_for_hash, search_space_id
-                )
+            # Fallback to simple summary if no LLM configured
+            summary_content = f"Crawled URL: {title}\n\n"
+            summary_content += f"URL: {url}\n"
+            if description:
+                summary_content += f"Description: {description}\n"
+            if language:
+                summary_content += f"Language: {language}\n"
+            summary_content += f"Crawler: {crawler_type}\n\n"
+
+            # Add content preview
+            content_preview = content[:1000]
+            if len(content) > 1000:
+                content_preview += "..."
+            summary_content += f"Content Preview:\n{content_preview}\n"
+
+            summary_embedding = (await embed_texts([summary_content]))[0]
+            return summary_content, summary_embedding
+
+        async def write(apply):
+            nonlocal pending_writes
+
+            async with session_lock, stage_stats["write"].measure():
+                result = await apply()
+                pending_writes += 1
+
+                # Batch commit every WEBCRAWLER_COMMIT_BATCH_SIZE documents
+                if pending_writes >= commit_batch_size:
+                    processed = documents_indexed + documents_updated
+                    logger.info(f"Committing batch: {processed} URLs processed so far")
+                    await session.commit()
+                    pending_writes = 0
+                    await task_logger.log_task_progress(
+                        log_entry,
+                        f"Processed {processed}/{len(urls)} URLs",
+                        {
+                            "stage": "crawling",
+                            "urls_processed": processed,
+                            "total_urls": len(urls),
+                        },
+                    )
+            return result
+
+        async def process_url(idx: int, url: str) -> None:
+            nonlocal documents_indexed, documents_updated, documents_skipped
+
+            async with in_flight_semaphore:
+                try:
+                    logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
+
+                    # Fetch stage: network-bound, politeness-limited per domain
+                    async with (
+                        fetch_semaphore,
+                        domain_limiter.slot(url),
+                        stage_stats["fetch"].measure(),
+                    ):
+                        fetched, error = await crawler.fetch_url(url)
+
+                    if error or not fetched:
+                        logger.warning(f"Failed to crawl URL {url}: {error}")
+                        failed_urls.append((url, error or "Unknown error"))
+                        return
+
+                    # Extract stage: CPU-bound, kept off the event loop
+                    async with extract_semaphore, stage_stats["extract"].measure():
+                        (
+                            crawl_result,
+                            structured_document,
+                            content_hash,
+                        ) = await asyncio.to_thread(extract, url, fetched)
+
+                    # Extract content and metadata
+                    content = crawl_result.get("content", "")
+                    metadata = crawl_result.get("metadata", {})
+                    crawler_type = crawl_result.get("crawler_type", "unknown")
+
+                    if not content.strip():
+                        logger.warning(f"Skipping URL with no content: {url}")
+                        failed_urls.append((url, "No content extracted"))
+                        documents_skipped += 1
+                        return
 
-                # Check if document with this unique identifier already exists
-                existing_document = await check_document_by_unique_identifier(
-                    session, unique_identifier_hash
-                )
+                    # Generate unique identifier hash for this URL
+                    unique_identifier_hash = generate_unique_identifier_hash(
+                        DocumentType.CRAWLED_URL, url, search_space_id
+                    )
 
-                # Extract useful metadata
-                title = metadata.get("title", url)
-                description = metadata.get("description", "")
-                language = metadata.get("language", "")
+                    # Check if document with this unique identifier already exists
+                    async with session_lock:
+                        existing_document = await check_document_by_unique_identifier(
+                            session, unique_identifier_hash
+                        )
 
-                if existing_document:
-                    # Document exists - check if content has changed
-                    if existing_document.content_hash == content_hash:
+                    if (
+                        existing_document
+                        and existing_document.content_hash == content_hash
+                    ):
                         logger.info(f"Document for URL {url} unchanged. Skipping.")
                         documents_skipped += 1
-                        continue
-                    else:
-                        # Content has changed - update the existing document
-                        logger.info(
-                            f"Content changed for URL {url}. Updating document."
+                        return
+
+                    # Extract useful metadata
+                    title = metadata.get("title", url)
+                    description = metadata.get("description", "")
+                    language = metadata.get("language", "")
+
+                    # Process stage: summary and chunk embeddings
+                    async with process_semaphore, stage_stats["process"].measure():
+                        summary_content, summary_embedding = await summarize(
+                            url,
+                            title,
+                            description,
+                            language,
+                            crawler_type,
+                            content,
+                            structured_document,
                         )
-
-                        # Generate summary with metadata
-                        user_llm = await get_user_long_context_llm(
-                            session, user_id, search_space_id
+                        # Reuse unchanged chunks and embeddings when updating
+                        chunks = await create_document_chunks(
+                            content,
+                            existing_document.chunks if existing_document else None,
                         )
 
-                        if user_llm:
-                            document_metadata = {
-                                "url": url,
-                                "title": title,
-                                "description": description,
-                                "language": language,
-                                "document_type": "Crawled URL",
+                    if existing_document:
+                        # Content has changed - update the existing document
+                        async def apply_update():
+                            existing_document.title = title
+                            existing_document.content = summary_content
+                            existing_document.content_hash = content_hash
+                            existing_document.embedding = summary_embedding
+                            existing_document.document_metadata = {
+                                **metadata,
                                 "crawler_type": crawler_type,
+                                "last_crawled_at": datetime.now().strftime(
+                                    "%Y-%m-%d %H:%M:%S"
+                                ),
                             }
-                            (
-                                summary_content,
-                                summary_embedding,
-                            ) = await generate_document_summary(
-                                structured_document, user_llm, document_metadata
-                            )
-                        else:
-                            # Fallback to simple summary if no LLM configured
-                            summary_content = f"Crawled URL: {title}\n\n"
-                            summary_content += f"URL: {url}\n"
-                            if description:
-                                summary_content += f"Description: {description}\n"
-                            if language:
-                                summary_content += f"Language: {language}\n"
-                            summary_content += f"Crawler: {crawler_type}\n\n"
-
-                            # Add content preview
-                            content_preview = content[:1000]
-                            if len(content) > 1000:
-                                content_preview += "..."
-                            summary_content += f"Content Preview:\n{content_preview}\n"
-
-                            summary_embedding = config.embedding_model_instance.embed(
-                                summary_content
-                            )
-
-                        # Process chunks
-                        chunks = await create_document_chunks(content)
-
-                        # Update existing document
-                        existing_document.title = title
-                        existing_document.content = summary_content
-                        existing_document.content_hash = content_hash
-                        existing_document.embedding = summary_embedding
-                        existing_document.document_metadata = {
-                            **metadata,
-                            "crawler_type": crawler_type,
-                            "last_crawled_at": datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
-                        }
-                        existing_document.chunks = chunks
-                        existing_document.updated_at = get_current_timestamp()
+                            existing_document.chunks = chunks
+                            existing_document.updated_at = get_current_timestamp()
 
                         documents_updated += 1
+                        await write(apply_update)
                         logger.info(f"Successfully updated URL {url}")
-                        continue
-
-                # Document doesn't exist - create new one
-                # Generate summary with metadata
-                user_llm = await get_user_long_context_llm(
-                    session, user_id, search_space_id
-                )
-
-                if user_llm:
-                    document_metadata = {
-                        "url": url,
-                        "title": title,
-                        "description": description,
-                        "language": language,
-                        "document_type": "Crawled URL",
-                        "crawler_type": crawler_type,
-                    }
-                    (
-                        summary_content,
-                        summary_embedding,
-                    ) = await generate_document_summary(
-                        structured_document, user_llm, document_metadata
-                    )
-                else:
-                    # Fallback to simple summary if no LLM configured
-                    summary_content = f"Crawled URL: {title}\n\n"
-                    summary_content += f"URL: {url}\n"
-                    if description:
-                        summary_content += f"Description: {description}\n"
-                    if language:
-                        summary_content += f"Language: {language}\n"
-                    summary_content += f"Crawler: {crawler_type}\n\n"
-
-                    # Add content preview
-                    content_preview = content[:1000]
-                    if len(content) > 1000:
-                        content_preview += "..."
-                    summary_content += f"Content Preview:\n{content_preview}\n"
-
-                    summary_embedding = config.embedding_model_instance.embed(
-                        summary_content
+                        return
+
+                    # Document doesn't exist - create new one
+                    document = Document(
+                        search_space_id=search_space_id,
+                        title=title,
+                        document_type=DocumentType.CRAWLED_URL,
+                        document_metadata={
+                            **metadata,
+                            "crawler_type": crawler_type,
+                            "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        },
+                        content=summary_content,
+                        content_hash=content_hash,
+                        unique_identifier_hash=unique_identifier_hash,
+                        embedding=summary_embedding,
+                        chunks=chunks,
+                        updated_at=get_current_timestamp(),
                     )
 
-                chunks = await create_document_chunks(content)
-
-                document = Document(
-                    search_space_id=search_space_id,
-                    title=title,
-                    document_type=DocumentType.CRAWLED_URL,
-                    document_metadata={
-                        **metadata,
-                        "crawler_type": crawler_type,
-                        "indexed_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    },
-                    content=summary_content,
-                    content_hash=content_hash,
-                    unique_identifier_hash=unique_identifier_hash,
-                    embedding=summary_embedding,
-                    chunks=chunks,
-                    updated_at=get_current_timestamp(),
-                )
-
-                session.add(document)
-                documents_indexed += 1
-                logger.info(f"Successfully indexed new URL {url}")
+                    # The writer drops duplicates of documents it still buffers
+                    if await write(lambda: document_writer.add(document)):
+                        documents_indexed += 1
+                        logger.info(f"Successfully indexed new URL {url}")
+                    else:
+                        documents_skipped += 1
 
-                # Batch commit every 10 documents
-                if (documents_indexed + documents_updated) % 10 == 0:
-                    logger.info(
-                        f"Committing batch: {documents_indexed + documents_updated} URLs processed so far"
+                except SQLAlchemyError:
+                    # Database errors abort the whole run
+                    raise
+                except Exception as e:
+                    logger.error(
+                        f"Error processing URL {url}: {e!s}",
+                        exc_info=True,
                     )
-                    await session.commit()
+                    failed_urls.append((url, str(e)))
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing URL {url}: {e!s}",
-                    exc_info=True,
-                )
-                failed_urls.append((url, str(e)))
-                continue
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for idx, url in enumerate(urls, 1):
+                    task_group.create_task(process_url(idx, url))
+        except* SQLAlchemyError as db_errors:
+            raise db_errors.exceptions[0] from None
+
+        stage_throughput = {
+            stage: stats.summary() for stage, stats in stage_stats.items()
+        }
+        logger.info(f"Web page indexing stage throughput: {stage_throughput}")
 
         total_processed = documents_indexed + documents_updated
 
         if total_processed > 0:
             await update_connector_last_indexed(session, connector, update_last_indexed)
 
+        # Write new documents still buffered by the bulk writer
+        await document_writer.flush()
+
         # Final commit for any remaining documents not yet committed in batches
         logger.info(
             f"Final commit: Total {documents_indexed} new, {documents_updated} updated URLs processed"
@@ -392,6 +513,7 @@ async def index_crawled_urls(
                 "documents_updated": documents_updated,
                 "documents_skipped": documents_skipped,
                 "failed_urls_count": len(failed_urls),
+                "stage_throughput": stage_throughput,
             },
         )
 
@@ -9,6 +9,7 @@ Available processors:
 - Extension processor: Handle documents from browser extension
 - Markdown processor: Process markdown files
 - File processors: Handle files using different ETL services (Unstructured, LlamaCloud, Docling)
+- PDF streaming processor: Process very large PDFs a slice of pages at a time
 - YouTube processor: Process YouTube videos and extract transcripts
 """
 
@@ -26,6 +27,9 @@ from .file_processors import (
 # Markdown processor
 from .markdown_processor import add_received_markdown_file_document
 
+# PDF streaming processor
+from .pdf_streaming_processor import add_received_pdf_document_in_page_slices
+
 # YouTube processor
 from .youtube_processor import add_youtube_video_document
 
@@ -38,6 +42,8 @@ __all__ = [
     "add_received_file_document_using_unstructured",
     # Markdown file processing
     "add_received_markdown_file_document",
+    # Large PDF processing in page slices
+    "add_received_pdf_document_in_page_slices",
     # YouTube video processing
     "add_youtube_video_document",
 ]
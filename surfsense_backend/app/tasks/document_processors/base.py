@@ -65,3 +65,26 @@ async def check_document_by_unique_identifier(
         .where(Document.unique_identifier_hash == unique_identifier_hash)
     )
     return existing_doc_result.scalars().first()
+
+
+async def check_document_by_file_hash(
+    session: AsyncSession, search_space_id: int, file_hash: str
+) -> Document | None:
+    """
+    Check if a document was already created from an identical file.
+
+    Args:
+        session: Database session
+        search_space_id: ID of the search space
+        file_hash: SHA-256 hash of the raw file bytes
+
+    Returns:
+        Existing document if found, None otherwise
+    """
+    existing_doc_result = await session.execute(
+        select(Document).where(
+            Document.search_space_id == search_space_id,
+            Document.file_hash == file_hash,
+        )
+    )
+    return existing_doc_result.scalars().first()
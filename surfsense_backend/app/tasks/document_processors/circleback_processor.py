@@ -105,8 +105,11 @@ async def add_circleback_meeting_document(
                 markdown_content, llm, document_metadata
             )
 
-        # Process chunks
-        chunks = await create_document_chunks(markdown_content)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            markdown_content,
+            existing_document.chunks if existing_document else None,
+        )
 
         # Convert to BlockNote JSON for editing capability
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
@@ -143,8 +143,11 @@ async def add_extension_received_document(
             combined_document_string, user_llm, document_metadata
         )
 
-        # Process chunks
-        chunks = await create_document_chunks(content.pageContent)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            content.pageContent,
+            existing_document.chunks if existing_document else None,
+        )
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -2,6 +2,7 @@
 File document processors for different ETL services (Unstructured, LlamaCloud, Docling).
 """
 
+import asyncio
 import contextlib
 import logging
 import warnings
@@ -22,14 +23,20 @@ from app.utils.document_converters import (
     create_document_chunks,
     generate_content_hash,
     generate_document_summary,
+    generate_file_hash,
     generate_unique_identifier_hash,
 )
 
 from .base import (
+    check_document_by_file_hash,
     check_document_by_unique_identifier,
     get_current_timestamp,
 )
 from .markdown_processor import add_received_markdown_file_document
+from .pdf_streaming_processor import (
+    add_received_pdf_document_in_page_slices,
+    get_streamable_pdf_page_count,
+)
 
 
 async def add_received_file_document_using_unstructured(
@@ -98,8 +105,11 @@ async def add_received_file_document_using_unstructured(
             file_in_markdown, user_llm, document_metadata
         )
 
-        # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_document.chunks if existing_document else None,
+        )
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -227,8 +237,11 @@ async def add_received_file_document_using_llamacloud(
             file_in_markdown, user_llm, document_metadata
         )
 
-        # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_document.chunks if existing_document else None,
+        )
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -381,8 +394,11 @@ async def add_received_file_document_using_docling(
             enhanced_summary_content
         )
 
-        # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_document.chunks if existing_document else None,
+        )
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
@@ -465,6 +481,15 @@ async def _update_document_from_connector(
         await session.commit()
 
 
+async def _record_file_hash(
+    document: Document | None, file_hash: str, session: AsyncSession
+) -> None:
+    """Helper to store the raw file hash on a document created from a file."""
+    if document and document.file_hash != file_hash:
+        document.file_hash = file_hash
+        await session.commit()
+
+
 async def process_file_in_background(
     file_path: str,
     filename: str,
@@ -477,6 +502,35 @@ async def process_file_in_background(
     | None = None,  # Optional: {"type": "GOOGLE_DRIVE_FILE", "metadata": {...}}
 ):
     try:
+        # Skip files identical to one already in the search space before any
+        # ETL, transcription or page usage is spent on them
+        file_hash = await asyncio.to_thread(generate_file_hash, file_path)
+        existing_document = await check_document_by_file_hash(
+            session, search_space_id, file_hash
+        )
+        if existing_document:
+            import os
+
+            with contextlib.suppress(Exception):
+                os.unlink(file_path)
+
+            if connector:
+                await _update_document_from_connector(
+                    existing_document, connector, session
+                )
+
+            await task_logger.log_task_success(
+                log_entry,
+                f"File already exists (duplicate): {filename}",
+                {
+                    "duplicate_detected": True,
+                    "document_id": existing_document.id,
+                    "file_hash": file_hash,
+                    "detected_before_etl": True,
+                },
+            )
+            return
+
         # Check if the file is a markdown or text file
         if filename.lower().endswith((".md", ".markdown", ".txt")):
             await task_logger.log_task_progress(
@@ -511,6 +565,7 @@ async def process_file_in_background(
             result = await add_received_markdown_file_document(
                 session, filename, markdown_content, search_space_id, user_id
             )
+            await _record_file_hash(result, file_hash, session)
 
             if connector:
                 await _update_document_from_connector(result, connector, session)
@@ -556,8 +611,26 @@ async def process_file_in_background(
                 from app.services.stt_service import stt_service
 
                 try:
-                    result = stt_service.transcribe_file(file_path)
-                    transcribed_text = result.get("text", "")
+                    # Stream windows of long recordings so progress shows in the log;
+                    # only the fraction is logged, so a failed transcription leaves
+                    # no partial transcript behind
+                    texts = []
+                    result = {}
+                    async for partial in stt_service.astream_transcription(file_path):
+                        if partial["text"]:
+                            texts.append(partial["text"])
+                        if not result:
+                            result = partial
+                        if partial["progress"] < 1.0:
+                            await task_logger.log_task_progress(
+                                log_entry,
+                                f"Transcribed {partial['end']:.0f}s of {partial['duration']:.0f}s: {filename}",
+                                {
+                                    "processing_stage": "local_transcription",
+                                    "progress": round(partial["progress"], 3),
+                                },
+                            )
+                    transcribed_text = " ".join(texts)
 
                     if not transcribed_text:
                         raise ValueError("Transcription returned empty text")
@@ -630,6 +703,7 @@ async def process_file_in_background(
             result = await add_received_markdown_file_document(
                 session, filename, transcribed_text, search_space_id, user_id
             )
+            await _record_file_hash(result, file_hash, session)
 
             if connector:
                 await _update_document_from_connector(result, connector, session)
@@ -715,7 +789,66 @@ async def process_file_in_background(
                     detail=str(e),
                 ) from e
 
-            if app_config.ETL_SERVICE == "UNSTRUCTURED":
+            streamed_page_count = await get_streamable_pdf_page_count(
+                file_path, filename
+            )
+            if streamed_page_count is not None:
+                await task_logger.log_task_progress(
+                    log_entry,
+                    f"Processing large PDF in page slices with {app_config.ETL_SERVICE} ETL: {filename}",
+                    {
+                        "file_type": "document",
+                        "etl_service": app_config.ETL_SERVICE,
+                        "processing_stage": "streaming",
+                        "pages_per_slice": app_config.ETL_STREAMING_PAGES_PER_SLICE,
+                    },
+                )
+
+                try:
+                    doc_result = await add_received_pdf_document_in_page_slices(
+                        session,
+                        file_path,
+                        filename,
+                        search_space_id,
+                        user_id,
+                        streamed_page_count,
+                        task_logger=task_logger,
+                        log_entry=log_entry,
+                    )
+                    await _record_file_hash(doc_result, file_hash, session)
+                finally:
+                    # Clean up the temp file
+                    import os
+
+                    with contextlib.suppress(Exception):
+                        os.unlink(file_path)
+
+                # Use the higher of the two counts for safety, as the other ETL paths do
+                final_page_count = max(estimated_pages_before, streamed_page_count)
+
+                await page_limit_service.update_page_usage(
+                    user_id, final_page_count, allow_exceed=True
+                )
+
+                if connector:
+                    await _update_document_from_connector(
+                        doc_result, connector, session
+                    )
+
+                await task_logger.log_task_success(
+                    log_entry,
+                    f"Successfully processed large PDF in page slices: {filename}",
+                    {
+                        "document_id": doc_result.id,
+                        "content_hash": doc_result.content_hash,
+                        "file_type": "document",
+                        "etl_service": app_config.ETL_SERVICE,
+                        "pages_processed": final_page_count,
+                        "page_streaming": True,
+                    },
+                )
+
+            elif app_config.ETL_SERVICE == "UNSTRUCTURED":
                 await task_logger.log_task_progress(
                     log_entry,
                     f"Processing file with Unstructured ETL: {filename}",
@@ -778,6 +911,7 @@ async def process_file_in_background(
                 result = await add_received_file_document_using_unstructured(
                     session, filename, docs, search_space_id, user_id
                 )
+                await _record_file_hash(result, file_hash, session)
 
                 if connector:
                     await _update_document_from_connector(result, connector, session)
@@ -912,6 +1046,8 @@ async def process_file_in_background(
                         user_id=user_id,
                     )
 
+                    await _record_file_hash(doc_result, file_hash, session)
+
                     # Track if this document was successfully created
                     if doc_result:
                         any_doc_created = True
@@ -1047,6 +1183,7 @@ async def process_file_in_background(
                     search_space_id=search_space_id,
                     user_id=user_id,
                 )
+                await _record_file_hash(doc_result, file_hash, session)
 
                 if doc_result:
                     # Update page usage after successful processing
@@ -108,8 +108,11 @@ async def add_received_markdown_file_document(
             file_in_markdown, user_llm, document_metadata
         )
 
-        # Process chunks
-        chunks = await create_document_chunks(file_in_markdown)
+        # Process chunks, reusing unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            file_in_markdown,
+            existing_document.chunks if existing_document else None,
+        )
 
         from app.utils.blocknote_converter import convert_markdown_to_blocknote
 
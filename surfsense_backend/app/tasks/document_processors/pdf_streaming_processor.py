@@ -0,0 +1,395 @@
+"""
+Page-streaming processor for very large PDF files.
+
+The regular file processors convert a whole file to one markdown string, then
+summarize, chunk and embed it, so memory grows with the size of the document.
+Here the PDF is split into slices of ETL_STREAMING_PAGES_PER_SLICE pages that
+are converted with the configured ETL service one at a time. Each slice is
+chunked, embedded and inserted as soon as it is converted, and only its summary
+is kept until the section summaries are combined into the document summary.
+
+Each slice's chunks are committed on their own, so no transaction stays open
+while slices are converted and summarized. They are told apart from the chunks
+of the previous upload by id, and the old chunks are only deleted, and the
+document updated, once every slice is written. A failed or unchanged upload
+deletes the chunks it wrote, leaving the existing document as it was. While a
+re-upload is processed, search may return chunks of both versions.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config as app_config
+from app.db import Chunk, Document, DocumentType, Log
+from app.services.docling_service import (
+    combine_section_summaries,
+    summarize_large_document,
+)
+from app.services.llm_service import get_user_long_context_llm
+from app.services.task_logging_service import TaskLoggingService
+from app.utils.document_converters import (
+    convert_document_to_markdown,
+    create_document_chunks,
+    embed_texts,
+    generate_unique_identifier_hash,
+)
+
+from .base import get_current_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Separator between the markdown of consecutive slices
+_SLICE_SEPARATOR = "\n\n"
+
+
+def get_pdf_page_count(file_path: str) -> int:
+    """Get the number of pages of a PDF file."""
+    import pypdf
+
+    with open(file_path, "rb") as f:
+        return len(pypdf.PdfReader(f).pages)
+
+
+async def get_streamable_pdf_page_count(file_path: str, filename: str) -> int | None:
+    """
+    Get the page count of a PDF large enough to be processed in page slices.
+
+    Returns:
+        The page count, or None if the file should be processed as a whole
+    """
+    threshold = app_config.ETL_STREAMING_PAGE_THRESHOLD
+    if threshold <= 0 or not filename.lower().endswith(".pdf"):
+        return None
+    if app_config.ETL_SERVICE not in ("UNSTRUCTURED", "LLAMACLOUD", "DOCLING"):
+        return None
+    try:
+        page_count = await asyncio.to_thread(get_pdf_page_count, file_path)
+    except Exception as e:
+        logger.warning(f"Could not count pages of {filename}, not streaming: {e}")
+        return None
+    return page_count if page_count >= threshold else None
+
+
+def _write_page_slice(file_path: str, start: int, end: int) -> str:
+    """
+    Write pages [start, end) of a PDF to a temporary PDF file.
+
+    The source is reopened for every slice so the parsed objects of earlier
+    slices are not kept alive.
+    """
+    import pypdf
+
+    writer = pypdf.PdfWriter()
+    with open(file_path, "rb") as f:
+        reader = pypdf.PdfReader(f)
+        for page_number in range(start, end):
+            writer.add_page(reader.pages[page_number])
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as slice_file:
+            writer.write(slice_file)
+    return slice_file.name
+
+
+async def _convert_slice_to_markdown(slice_path: str, label: str) -> str:
+    """Convert a PDF slice to markdown with the configured ETL service."""
+    if app_config.ETL_SERVICE == "UNSTRUCTURED":
+        from langchain_unstructured import UnstructuredLoader
+
+        loader = UnstructuredLoader(
+            slice_path,
+            mode="elements",
+            post_processors=[],
+            languages=["eng"],
+            include_orig_elements=False,
+            include_metadata=False,
+            strategy="auto",
+        )
+        return await convert_document_to_markdown(await loader.aload())
+
+    if app_config.ETL_SERVICE == "LLAMACLOUD":
+        from llama_cloud_services import LlamaParse
+        from llama_cloud_services.parse.utils import ResultType
+
+        parser = LlamaParse(
+            api_key=app_config.LLAMA_CLOUD_API_KEY,
+            num_workers=1,
+            verbose=True,
+            language="en",
+            result_type=ResultType.MD,
+        )
+        result = await parser.aparse(slice_path)
+        markdown_documents = await result.aget_markdown_documents(split_by_page=False)
+        return _SLICE_SEPARATOR.join(doc.text for doc in markdown_documents)
+
+    if app_config.ETL_SERVICE == "DOCLING":
+        from app.services.docling_service import create_docling_service
+
+        result = await create_docling_service().process_document(slice_path, label)
+        return result["content"]
+
+    raise ValueError(f"Unsupported ETL service: {app_config.ETL_SERVICE}")
+
+
+async def _delete_written_chunks(
+    session: AsyncSession,
+    search_space_id: int,
+    document_id: int,
+    last_old_chunk_id: int | None,
+    created_document: bool,
+) -> None:
+    """Delete what a failed or unchanged upload wrote, keeping the old document."""
+    if created_document:
+        await session.execute(delete(Document).where(Document.id == document_id))
+    else:
+        conditions = [Chunk.document_id == document_id]
+        if last_old_chunk_id is not None:
+            conditions.append(Chunk.id > last_old_chunk_id)
+        await session.execute(delete(Chunk).where(*conditions))
+    session.info.setdefault("written_search_space_ids", set()).add(search_space_id)
+    await session.commit()
+
+
+async def add_received_pdf_document_in_page_slices(
+    session: AsyncSession,
+    file_path: str,
+    file_name: str,
+    search_space_id: int,
+    user_id: str,
+    page_count: int,
+    task_logger: TaskLoggingService | None = None,
+    log_entry: Log | None = None,
+) -> Document:
+    """
+    Process and store a large PDF a slice of pages at a time.
+
+    Args:
+        session: Database session
+        file_path: Path to the PDF file
+        file_name: Name of the processed file
+        search_space_id: ID of the search space
+        user_id: ID of the user
+        page_count: Number of pages of the PDF
+        task_logger: Optional task logger for per-slice progress
+        log_entry: Log entry the progress is reported on
+
+    Returns:
+        The document. The existing document is returned unchanged if its
+        content did not change.
+    """
+    etl_service = app_config.ETL_SERVICE
+    pages_per_slice = max(1, app_config.ETL_STREAMING_PAGES_PER_SLICE)
+
+    document_id = None
+    last_old_chunk_id = None
+    created_document = False
+    try:
+        user_llm = await get_user_long_context_llm(session, user_id, search_space_id)
+        if not user_llm:
+            raise RuntimeError(
+                f"No long context LLM configured for user {user_id} in search space {search_space_id}"
+            )
+
+        unique_identifier_hash = generate_unique_identifier_hash(
+            DocumentType.FILE, file_name, search_space_id
+        )
+
+        # Chunks are not loaded; the old ones are deleted by id once the new
+        # ones are written
+        existing_document = (
+            (
+                await session.execute(
+                    select(Document).where(
+                        Document.unique_identifier_hash == unique_identifier_hash
+                    )
+                )
+            )
+            .scalars()
+            .first()
+        )
+
+        if existing_document:
+            document = existing_document
+            last_old_chunk_id = (
+                await session.execute(
+                    select(func.max(Chunk.id)).where(
+                        Chunk.document_id == existing_document.id
+                    )
+                )
+            ).scalar()
+        else:
+            # Committed up front so chunks can reference it; the real content
+            # hash is only known once every slice has been converted. A retry
+            # after a crash finds it as an existing document and replaces its
+            # chunks.
+            document = Document(
+                search_space_id=search_space_id,
+                title=file_name,
+                document_type=DocumentType.FILE,
+                content="",
+                content_hash=f"pending:{unique_identifier_hash}",
+                unique_identifier_hash=unique_identifier_hash,
+            )
+            session.add(document)
+            await session.commit()
+            created_document = True
+        document_id = document.id
+
+        # Same value as generate_content_hash() of the joined slices
+        content_hasher = hashlib.sha256(f"{search_space_id}:".encode())
+        section_summaries: list[str] = []
+        chunks_written = 0
+
+        for start in range(0, page_count, pages_per_slice):
+            end = min(start + pages_per_slice, page_count)
+            label = f"{file_name} (pages {start + 1}-{end})"
+
+            slice_path = await asyncio.to_thread(
+                _write_page_slice, file_path, start, end
+            )
+            try:
+                slice_markdown = await _convert_slice_to_markdown(slice_path, label)
+            finally:
+                with contextlib.suppress(Exception):
+                    os.unlink(slice_path)
+
+            if start:
+                content_hasher.update(_SLICE_SEPARATOR.encode())
+            content_hasher.update(slice_markdown.encode("utf-8"))
+
+            if slice_markdown.strip():
+                slice_summary = await summarize_large_document(
+                    content=slice_markdown, llm=user_llm, document_title=label
+                )
+                section_summaries.append(
+                    f"=== Pages {start + 1}-{end} ===\n{slice_summary}"
+                )
+
+                chunks = await create_document_chunks(slice_markdown)
+                if chunks:
+                    # Only the insert and its commit run in a transaction
+                    await session.execute(
+                        insert(Chunk),
+                        [
+                            {
+                                "content": chunk.content,
+                                "embedding": chunk.embedding,
+                                "document_id": document_id,
+                            }
+                            for chunk in chunks
+                        ],
+                    )
+                    # Core inserts bypass the session's after_flush tracking
+                    session.info.setdefault("written_search_space_ids", set()).add(
+                        search_space_id
+                    )
+                    await session.commit()
+                    chunks_written += len(chunks)
+
+            if task_logger and log_entry:
+                await task_logger.log_task_progress(
+                    log_entry,
+                    f"Processed pages {start + 1}-{end} of {page_count}: {file_name}",
+                    {
+                        "processing_stage": "streaming_slice",
+                        "pages_processed": end,
+                        "total_pages": page_count,
+                        "chunks_written": chunks_written,
+                    },
+                )
+
+        content_hash = content_hasher.hexdigest()
+        if existing_document and existing_document.content_hash == content_hash:
+            logger.info(f"Document for file {file_name} unchanged. Skipping.")
+            await _delete_written_chunks(
+                session,
+                search_space_id,
+                document_id,
+                last_old_chunk_id,
+                created_document,
+            )
+            await session.refresh(existing_document)
+            return existing_document
+
+        if not section_summaries:
+            raise ValueError(f"No content could be extracted from {file_name}")
+
+        summary_content = await combine_section_summaries(
+            section_summaries, user_llm, file_name
+        )
+
+        metadata_section = "\n".join(
+            [
+                "# DOCUMENT METADATA",
+                f"**File Name:** {file_name}",
+                f"**Etl Service:** {etl_service}",
+                "**Document Type:** File Document",
+                f"**Page Count:** {page_count}",
+            ]
+        )
+        enhanced_summary_content = (
+            f"{metadata_section}\n\n# DOCUMENT SUMMARY\n\n{summary_content}"
+        )
+        summary_embedding = (await embed_texts([enhanced_summary_content]))[0]
+
+        # Swap generations: drop the previous upload's chunks and update the
+        # document in one short transaction
+        if last_old_chunk_id is not None:
+            await session.execute(
+                delete(Chunk).where(
+                    Chunk.document_id == document_id, Chunk.id <= last_old_chunk_id
+                )
+            )
+
+        # The full markdown is never held in memory, so streamed documents have
+        # no BlockNote state; the editor refuses to rebuild it from the chunks
+        document.title = file_name
+        document.content = enhanced_summary_content
+        document.content_hash = content_hash
+        document.embedding = summary_embedding
+        document.document_metadata = {
+            "FILE_NAME": file_name,
+            "ETL_SERVICE": etl_service,
+            "PAGE_COUNT": page_count,
+            "PAGE_STREAMING": True,
+        }
+        document.blocknote_document = None
+        document.content_needs_reindexing = False
+        document.updated_at = get_current_timestamp()
+
+        await session.commit()
+        await session.refresh(document)
+
+        logger.info(
+            f"Streamed {page_count} pages of {file_name} in slices of "
+            f"{pages_per_slice} pages into {chunks_written} chunks"
+        )
+        return document
+    except Exception as e:
+        await session.rollback()
+        if document_id is not None:
+            try:
+                await _delete_written_chunks(
+                    session,
+                    search_space_id,
+                    document_id,
+                    last_old_chunk_id,
+                    created_document,
+                )
+            except Exception as cleanup_error:
+                await session.rollback()
+                logger.error(
+                    f"Could not remove partial upload of {file_name}: {cleanup_error}"
+                )
+        if isinstance(e, SQLAlchemyError):
+            raise
+        raise RuntimeError(
+            f"Failed to process file document in page slices: {e!s}"
+        ) from e
@@ -302,7 +302,11 @@ async def add_youtube_video_document(
                 "document will not be editable"
             )
 
-        chunks = await create_document_chunks(combined_document_string)
+        # Reuse unchanged chunks and embeddings when updating
+        chunks = await create_document_chunks(
+            combined_document_string,
+            existing_document.chunks if existing_document else None,
+        )
 
         # Update or create document
         if existing_document:
@@ -0,0 +1,176 @@
+"""
+Bulk writer for newly indexed documents and their chunks.
+
+Adding documents through the ORM unit of work makes SQLAlchemy emit one INSERT
+per chunk, each carrying its embedding. BulkDocumentWriter buffers new documents
+and writes each buffer with two multi-row INSERTs: one for the documents,
+returning their ids, and one for all of their chunks. Buffers are flushed once
+they hold `flush_size` documents or an estimated `max_buffer_bytes` of content
+and embeddings, whichever comes first.
+
+Only new documents go through the writer; updates of existing documents keep
+using the session as before. Buffered documents are not visible to existence
+checks until they are flushed, so the writer itself drops documents whose
+unique identifier or content hash is already buffered.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import config
+from app.db import Chunk, Document
+
+logger = logging.getLogger(__name__)
+
+# Bytes per float32 embedding dimension, used to estimate buffered memory
+_EMBEDDING_BYTES_PER_DIMENSION = 4
+
+
+class BulkDocumentWriter:
+    """Buffers new documents and writes them with multi-row inserts."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        flush_size: int | None = None,
+        max_buffer_bytes: int | None = None,
+        commit: bool = False,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session: Database session the inserts are executed in
+            flush_size: Flush after this many buffered documents
+            max_buffer_bytes: Flush once buffered content and embeddings reach
+                this estimated size
+            commit: Commit the session after every flush, instead of leaving
+                the inserts to the caller's next commit
+        """
+        self.session = session
+        self.flush_size = max(
+            1, flush_size if flush_size is not None else config.BULK_WRITE_FLUSH_SIZE
+        )
+        self.max_buffer_bytes = (
+            max_buffer_bytes
+            if max_buffer_bytes is not None
+            else config.BULK_WRITE_MAX_BUFFER_MB * 1024 * 1024
+        )
+        self.commit = commit
+        self.documents_written = 0
+        self._buffer: list[Document] = []
+        self._buffer_bytes = 0
+        self._buffered_hashes: set[str] = set()
+
+    @staticmethod
+    def _estimate_bytes(document: Document) -> int:
+        embedding_bytes = (
+            config.embedding_model_instance.dimension * _EMBEDDING_BYTES_PER_DIMENSION
+        )
+        chunks = document.chunks or []
+        return (
+            len(document.content or "")
+            + sum(len(chunk.content or "") for chunk in chunks)
+            + embedding_bytes * (1 + len(chunks))
+        )
+
+    async def add(self, document: Document) -> bool:
+        """
+        Buffer a new document, with its chunks, for insertion.
+
+        The document must not have been added to the session.
+
+        Returns:
+            False if a buffered document has the same unique identifier or
+            content hash, in which case the document is dropped
+        """
+        hashes = {
+            h for h in (document.unique_identifier_hash, document.content_hash) if h
+        }
+        if hashes & self._buffered_hashes:
+            logger.info(f"Skipping duplicate of a buffered document: {document.title}")
+            return False
+
+        self._buffered_hashes |= hashes
+        self._buffer.append(document)
+        self._buffer_bytes += self._estimate_bytes(document)
+        if (
+            len(self._buffer) >= self.flush_size
+            or self._buffer_bytes >= self.max_buffer_bytes
+        ):
+            await self.flush()
+        return True
+
+    @staticmethod
+    def _document_row(document: Document, now: datetime) -> dict:
+        return {
+            "title": document.title,
+            "document_type": document.document_type,
+            "document_metadata": document.document_metadata,
+            "content": document.content,
+            "content_hash": document.content_hash,
+            "unique_identifier_hash": document.unique_identifier_hash,
+            "embedding": document.embedding,
+            "blocknote_document": document.blocknote_document,
+            "content_needs_reindexing": bool(document.content_needs_reindexing),
+            "updated_at": document.updated_at,
+            "search_space_id": document.search_space_id,
+            "created_at": document.created_at or now,
+        }
+
+    async def flush(self) -> list[int]:
+        """
+        Insert the buffered documents and chunks.
+
+        The ids of the inserted documents are also set on the buffered Document
+        objects.
+
+        Returns:
+            Ids of the inserted documents, in the order they were added
+        """
+        if not self._buffer:
+            return []
+
+        documents, self._buffer = self._buffer, []
+        self._buffer_bytes = 0
+        self._buffered_hashes.clear()
+        now = datetime.now(UTC)
+
+        result = await self.session.execute(
+            insert(Document).returning(Document.id, sort_by_parameter_order=True),
+            [self._document_row(document, now) for document in documents],
+        )
+        document_ids = list(result.scalars().all())
+
+        chunk_rows = []
+        for document, document_id in zip(documents, document_ids, strict=True):
+            document.id = document_id
+            for chunk in document.chunks or []:
+                chunk_rows.append(
+                    {
+                        "content": chunk.content,
+                        "embedding": chunk.embedding,
+                        "document_id": document_id,
+                        "created_at": chunk.created_at or now,
+                    }
+                )
+        if chunk_rows:
+            await self.session.execute(insert(Chunk), chunk_rows)
+
+        # Core inserts bypass the session's after_flush tracking; record the search
+        # spaces so their retrieval cache is invalidated when the session commits
+        self.session.info.setdefault("written_search_space_ids", set()).update(
+            document.search_space_id for document in documents
+        )
+
+        if self.commit:
+            await self.session.commit()
+
+        self.documents_written += len(document_ids)
+        logger.info(
+            f"Bulk inserted {len(document_ids)} documents with {len(chunk_rows)} chunks"
+        )
+        return document_ids
@@ -1,10 +1,19 @@
+import asyncio
 import hashlib
+import logging
 
 from litellm import get_model_info, token_counter
 
 from app.config import config
 from app.db import Chunk, DocumentType
 from app.prompts import SUMMARY_PROMPT_TEMPLATE
+from app.services.embedding_cache_service import get_embedding_cache, hash_text
+from app.utils.token_truncation import truncate_to_token_budget
+
+logger = logging.getLogger(__name__)
+
+# Bytes read at a time when hashing uploaded files
+_FILE_HASH_BLOCK_SIZE = 1024 * 1024
 
 
 def get_model_context_window(model_name: str) -> int:
@@ -24,7 +33,10 @@ def optimize_content_for_context_window(
     content: str, document_metadata: dict | None, model_name: str
 ) -> str:
     """
-    Optimize content length to fit within model context window using binary search.
+    Optimize content length to fit within model context window.
+
+    The content is tokenized once with the model's tokenizer and cut at the exact
+    token budget left after the reserved prompt and metadata tokens.
 
     Args:
         content: Original document content
@@ -61,33 +73,24 @@ def optimize_content_for_context_window(
         print(f"Warning: Very limited tokens available for content: {available_tokens}")
         return content[:500]  # Fallback to first 500 chars
 
-    # Binary search to find optimal content length
-    left, right = 0, len(content)
-    optimal_length = 0
-
-    while left <= right:
-        mid = (left + right) // 2
-        test_content = content[:mid]
-
-        # Test token count for this content length
-        test_document = f"<DOCUMENT_CONTENT>\n\n{test_content}\n\n</DOCUMENT_CONTENT>"
-        test_tokens = token_counter(
-            messages=[{"role": "user", "content": test_document}], model=model_name
-        )
-
-        if test_tokens <= available_tokens:
-            optimal_length = mid
-            left = mid + 1
-        else:
-            right = mid - 1
+    # Tokens taken by the content wrapper itself
+    wrapper_tokens = token_counter(
+        messages=[
+            {"role": "user", "content": "<DOCUMENT_CONTENT>\n\n\n\n</DOCUMENT_CONTENT>"}
+        ],
+        model=model_name,
+    )
 
-    optimized_content = (
-        content[:optimal_length] if optimal_length > 0 else content[:500]
+    # Tokenize once and cut at the exact token budget
+    optimized_content = truncate_to_token_budget(
+        content, available_tokens - wrapper_tokens, model_name
     )
+    if not optimized_content:
+        optimized_content = content[:500]
 
-    if optimal_length < len(content):
+    if len(optimized_content) < len(content):
         print(
-            f"Content optimized: {len(content)} -> {optimal_length} chars "
+            f"Content optimized: {len(content)} -> {len(optimized_content)} chars "
             f"to fit in {available_tokens} available tokens"
         )
 
@@ -140,28 +143,161 @@ async def generate_document_summary(
     else:
         enhanced_summary_content = summary_content
 
-    summary_embedding = config.embedding_model_instance.embed(enhanced_summary_content)
+    summary_embedding = (await embed_texts([enhanced_summary_content]))[0]
 
     return enhanced_summary_content, summary_embedding
 
 
-async def create_document_chunks(content: str) -> list[Chunk]:
+def _iter_embedding_batches(texts: list[str]):
+    """
+    Split texts into batches bounded by EMBEDDING_BATCH_SIZE and
+    EMBEDDING_BATCH_MAX_CHARS.
+
+    A single text longer than the character budget still forms its own batch.
+    """
+    max_size = max(1, config.EMBEDDING_BATCH_SIZE)
+    max_chars = max(1, config.EMBEDDING_BATCH_MAX_CHARS)
+
+    batch: list[str] = []
+    batch_chars = 0
+    for text in texts:
+        if batch and (len(batch) >= max_size or batch_chars + len(text) > max_chars):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += len(text)
+
+    if batch:
+        yield batch
+
+
+async def embed_texts(texts: list[str]) -> list:
+    """
+    Embed texts in batches using the configured embedding model.
+
+    Texts are looked up in the embedding cache first, and each distinct text
+    that is not cached is embedded once. Each batch runs in a worker thread so
+    the event loop is not blocked while the model computes embeddings.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        List of embeddings in the same order as the input texts
+    """
+    if not texts:
+        return []
+
+    model_name = config.EMBEDDING_MODEL or ""
+    text_hashes = [hash_text(text) for text in texts]
+    embedding_cache = get_embedding_cache()
+
+    embeddings_by_hash = (
+        await embedding_cache.get_many(model_name, text_hashes)
+        if embedding_cache
+        else {}
+    )
+    missing = {
+        text_hash: text
+        for text_hash, text in zip(text_hashes, texts, strict=True)
+        if text_hash not in embeddings_by_hash
+    }
+
+    embedding_model = config.embedding_model_instance
+    computed = []
+    for batch in _iter_embedding_batches(list(missing.values())):
+        computed.extend(await asyncio.to_thread(embedding_model.embed_batch, batch))
+    new_embeddings = dict(zip(missing, computed, strict=True))
+
+    if embedding_cache and new_embeddings:
+        await embedding_cache.set_many(model_name, new_embeddings)
+        logger.debug(f"Embedding cache: {embedding_cache.stats()}")
+
+    embeddings_by_hash.update(new_embeddings)
+    return [embeddings_by_hash[text_hash] for text_hash in text_hashes]
+
+
+async def rechunk_document_content(
+    content: str, existing_chunks: list[Chunk] | None = None
+) -> tuple[list[Chunk], dict]:
+    """
+    Chunk document content, reusing what is unchanged from the previous chunks.
+
+    Chunk order is the order of chunk ids, so the existing rows of the longest
+    unchanged leading run of chunks are kept as they are. Every following chunk
+    is a new row, but chunks whose text is identical to a previous chunk reuse
+    its embedding; only new or changed texts are embedded.
+
+    Args:
+        content: Document content to chunk
+        existing_chunks: The document's current chunks, if it is being reindexed
+
+    Returns:
+        Tuple of (chunks for the document, stats) where stats has the number of
+        chunks, kept rows and re-embedded chunks and the re-embedded fraction
+    """
+    chunk_texts = [chunk.text for chunk in config.chunker_instance.chunk(content)]
+    existing_chunks = sorted(existing_chunks or [], key=lambda chunk: chunk.id or 0)
+
+    kept_chunks: list[Chunk] = []
+    for existing_chunk, text in zip(existing_chunks, chunk_texts, strict=False):
+        if existing_chunk.content != text or existing_chunk.embedding is None:
+            break
+        kept_chunks.append(existing_chunk)
+
+    embeddings_by_hash = {
+        hash_text(chunk.content): chunk.embedding
+        for chunk in existing_chunks
+        if chunk.embedding is not None
+    }
+    remaining_texts = chunk_texts[len(kept_chunks) :]
+    texts_to_embed: dict[str, str] = {}
+    for text in remaining_texts:
+        text_hash = hash_text(text)
+        if text_hash not in embeddings_by_hash:
+            texts_to_embed.setdefault(text_hash, text)
+
+    embeddings = await embed_texts(list(texts_to_embed.values()))
+    embeddings_by_hash.update(zip(texts_to_embed, embeddings, strict=True))
+
+    chunks = kept_chunks + [
+        Chunk(content=text, embedding=embeddings_by_hash[hash_text(text)])
+        for text in remaining_texts
+    ]
+    stats = {
+        "chunks_total": len(chunk_texts),
+        "chunks_kept": len(kept_chunks),
+        "chunks_reembedded": len(texts_to_embed),
+        "reembedded_fraction": (
+            round(len(texts_to_embed) / len(chunk_texts), 4) if chunk_texts else 0.0
+        ),
+    }
+    if existing_chunks:
+        logger.info(
+            f"Rechunked document: {stats['chunks_total']} chunks, "
+            f"{stats['chunks_kept']} kept, {stats['chunks_reembedded']} re-embedded "
+            f"({stats['reembedded_fraction']:.0%})"
+        )
+    return chunks, stats
+
+
+async def create_document_chunks(
+    content: str, existing_chunks: list[Chunk] | None = None
+) -> list[Chunk]:
     """
     Create chunks from document content.
 
     Args:
         content: Document content to chunk
+        existing_chunks: The document's current chunks when it is being updated;
+            unchanged chunks and embeddings are reused (see rechunk_document_content)
 
     Returns:
         List of Chunk objects with embeddings
     """
-    return [
-        Chunk(
-            content=chunk.text,
-            embedding=config.embedding_model_instance.embed(chunk.text),
-        )
-        for chunk in config.chunker_instance.chunk(content)
-    ]
+    chunks, _stats = await rechunk_document_content(content, existing_chunks)
+    return chunks
 
 
 async def convert_element_to_markdown(element) -> str:
@@ -228,6 +364,19 @@ def generate_content_hash(content: str, search_space_id: int) -> str:
     return hashlib.sha256(combined_data.encode("utf-8")).hexdigest()
 
 
+def generate_file_hash(file_path: str) -> str:
+    """
+    Generate SHA-256 hash of a file's raw bytes, read in blocks.
+
+    Blocking; call it off the event loop for large files.
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_FILE_HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
 def generate_unique_identifier_hash(
     document_type: DocumentType,
     unique_identifier: str | int | float,
@@ -0,0 +1,84 @@
+"""
+Slots bounding the jobs submitted to an executor from async code.
+
+The slots of a process are shared by every event loop in it (Celery tasks each
+run their own), so they cannot be an asyncio.Semaphore. Waiters are woken in
+order without polling, and a slot is released by the done callback of the
+executor's future, not when the awaiting task is cancelled: a timed-out or
+abandoned request keeps its slot until its job has actually left the executor,
+so the bound still holds under overload.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+
+
+class ExecutorSlots:
+    """A bounded number of executor jobs, running or queued, across event loops."""
+
+    def __init__(self, size: int):
+        self._lock = threading.Lock()
+        self._free = max(1, size)
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._free > 0 and not self._waiters:
+                self._free -= 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            if handed_over:
+                # The slot was passed to this waiter as it was cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Pass a slot to the next waiter, or free it. Safe from any thread."""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, waiter)
+                    return
+                except RuntimeError:
+                    # The waiter's event loop is closed
+                    continue
+            self._free += 1
+
+    async def submit(self, executor: Executor, fn: Callable, *args) -> Future:
+        """
+        Submit a job once a slot is free.
+
+        Returns:
+            The executor's future; the slot is released when it is done
+        """
+        await self.acquire()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self.release()
+            raise
+        future.add_done_callback(lambda _: self.release())
+        return future
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    # A waiter cancelled after being handed the slot releases it itself
+    if not waiter.done():
+        waiter.set_result(None)
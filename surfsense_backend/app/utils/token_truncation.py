@@ -0,0 +1,78 @@
+"""
+Token-exact text truncation.
+
+Texts are tokenized once with the model's tokenizer and cut at the character
+offset where the first token past the budget starts, so truncating a large
+document costs a single tokenization instead of one per binary-search step.
+Tokenizers are the ones litellm uses for token counting and are cached per model.
+"""
+
+from functools import lru_cache
+
+
+class _TiktokenOffsets:
+    """Token start offsets for tiktoken (OpenAI) encodings."""
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+
+    def token_starts(self, text: str) -> list[int]:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        _decoded, offsets = self.encoding.decode_with_offsets(tokens)
+        return offsets
+
+
+class _HuggingFaceOffsets:
+    """Token start offsets for Hugging Face `tokenizers` tokenizers."""
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+
+    def token_starts(self, text: str) -> list[int]:
+        encoding = self.tokenizer.encode(text, add_special_tokens=False)
+        return [start for start, _end in encoding.offsets]
+
+
+@lru_cache(maxsize=32)
+def get_tokenizer(model_name: str):
+    """
+    Get the tokenizer litellm counts tokens with for a model, cached per model.
+
+    Falls back to tiktoken's cl100k_base encoding (litellm's own default) if the
+    model's tokenizer cannot be selected.
+    """
+    try:
+        from litellm.utils import _select_tokenizer
+
+        selected = _select_tokenizer(model=model_name)
+        if selected["type"] == "huggingface_tokenizer":
+            return _HuggingFaceOffsets(selected["tokenizer"])
+        return _TiktokenOffsets(selected["tokenizer"])
+    except Exception as e:
+        print(
+            f"Warning: Could not load tokenizer for {model_name}, using cl100k_base. Error: {e}"
+        )
+        import tiktoken
+
+        return _TiktokenOffsets(tiktoken.get_encoding("cl100k_base"))
+
+
+def truncate_to_token_budget(text: str, max_tokens: int, model_name: str) -> str:
+    """
+    Truncate text to at most `max_tokens` tokens of the model's tokenizer.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        model_name: Model whose tokenizer defines the budget
+
+    Returns:
+        The longest prefix of text, cut at a token boundary, within the budget
+    """
+    if not text or max_tokens <= 0:
+        return ""
+
+    token_starts = get_tokenizer(model_name).token_starts(text)
+    if len(token_starts) <= max_tokens:
+        return text
+    return text[: token_starts[max_tokens]]
@@ -0,0 +1,143 @@
+"""
+Load test chat checkpoint throughput with a single connection and a pool.
+
+The LangGraph checkpointer used to hold one psycopg connection, so checkpoint
+reads and writes of concurrent chat streams serialized on it. It is now backed
+by an AsyncConnectionPool. For each concurrency level, this runs that many chat
+threads at once, each doing the checkpoint traffic of a chat turn (load the
+latest checkpoint, then write a checkpoint and its pending writes per agent
+step), against:
+
+- single: AsyncPostgresSaver.from_conn_string (the previous setup)
+- pooled: AsyncPostgresSaver on create_checkpointer_pool()
+
+and prints turns per second and median/p95 turn latency. Benchmark threads
+are deleted afterwards.
+
+Usage (from surfsense_backend/):
+    python -m scripts.benchmarks.checkpointer_concurrency \
+        --concurrency 1 4 16 64 --turns 200 --steps 4 --pool-max-size 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from app.agents.new_chat.checkpointer import (
+    create_checkpointer_pool,
+    get_postgres_connection_string,
+)
+
+
+async def _chat_turn(saver, thread_id: str, steps: int, message: str) -> float:
+    """One chat turn of checkpoint traffic, returning its latency in seconds."""
+    started = time.perf_counter()
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+    latest = await saver.aget_tuple(config)
+    checkpoint = latest.checkpoint if latest else empty_checkpoint()
+    if latest:
+        config = latest.config
+
+    for step in range(steps):
+        checkpoint = create_checkpoint(checkpoint, None, step)
+        version = saver.get_next_version(
+            checkpoint["channel_versions"].get("messages"), None
+        )
+        checkpoint["channel_values"] = {"messages": [message] * (step + 1)}
+        checkpoint["channel_versions"]["messages"] = version
+        config = await saver.aput(
+            config,
+            checkpoint,
+            {"source": "loop", "step": step, "parents": {}},
+            {"messages": version},
+        )
+        await saver.aput_writes(config, [("messages", message)], str(uuid.uuid4()))
+
+    return time.perf_counter() - started
+
+
+async def _run_level(
+    saver, concurrency: int, turns: int, steps: int, message: str
+) -> tuple[float, list[float], list[str]]:
+    thread_ids = [f"bench-{uuid.uuid4()}" for _ in range(concurrency)]
+    remaining = iter(range(turns))
+    latencies: list[float] = []
+
+    async def worker(thread_id: str) -> None:
+        for _ in remaining:
+            latencies.append(await _chat_turn(saver, thread_id, steps, message))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(thread_id) for thread_id in thread_ids))
+    return time.perf_counter() - started, latencies, thread_ids
+
+
+def _report(label: str, elapsed: float, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    print(
+        f"  {label:7s} {len(latencies) / elapsed:8.1f} turns/s  "
+        f"median {statistics.median(latencies) * 1000:7.1f} ms  "
+        f"p95 {p95 * 1000:7.1f} ms"
+    )
+
+
+async def run_benchmark(
+    concurrency_levels: list[int],
+    turns: int,
+    steps: int,
+    message_chars: int,
+    pool_max_size: int,
+):
+    message = "x" * message_chars
+    conn_string = get_postgres_connection_string()
+    pool = create_checkpointer_pool(max_size=pool_max_size)
+    await pool.open(wait=True)
+    pooled = AsyncPostgresSaver(pool)
+    await pooled.setup()
+
+    print(
+        f"{turns} turns per level, {steps} checkpoint steps per turn, "
+        f"{message_chars} chars per message, pool max size {pool_max_size}"
+    )
+    created_threads: list[str] = []
+    try:
+        async with AsyncPostgresSaver.from_conn_string(conn_string) as single:
+            for concurrency in concurrency_levels:
+                print(f"\n{concurrency} concurrent chat threads")
+                for label, saver in (("single", single), ("pooled", pooled)):
+                    elapsed, latencies, thread_ids = await _run_level(
+                        saver, concurrency, turns, steps, message
+                    )
+                    created_threads.extend(thread_ids)
+                    _report(label, elapsed, latencies)
+    finally:
+        for thread_id in created_threads:
+            await pooled.adelete_thread(thread_id)
+        await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--message-chars", type=int, default=2000)
+    parser.add_argument("--pool-max-size", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(
+            args.concurrency,
+            args.turns,
+            args.steps,
+            args.message_chars,
+            args.pool_max_size,
+        )
+    )
@@ -0,0 +1,126 @@
+"""
+Compare binary-search and single-pass truncation of large documents.
+
+`optimize_content_for_context_window` used to binary-search the content length,
+calling litellm `token_counter` on a fresh prefix at every step. It now
+tokenizes the content once and cuts at the token budget using token offsets.
+For synthetic documents of each size, this prints the latency of both
+approaches, the number of tokenizer passes and the token count of each result.
+
+Usage (from surfsense_backend/):
+    python -m scripts.benchmarks.context_window_truncation \
+        --model gpt-4o-mini --sizes 100000 500000 2000000 --budget 100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from litellm import token_counter
+
+from app.utils.token_truncation import get_tokenizer, truncate_to_token_budget
+
+_WORDS = [
+    "the",
+    "quarterly",
+    "roadmap",
+    "covers",
+    "retrieval",
+    "latency",
+    "indexing",
+    "connectors",
+    "embedding",
+    "throughput",
+    "summarization",
+    "2024",
+    "naïve",
+    "café",
+    "数据",
+    "✓",
+    "api_key=abc123",
+    "{json: [1, 2]}",
+]
+
+
+def _synthetic_document(size: int) -> str:
+    rng = random.Random(size)
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word + ("\n\n" if rng.random() < 0.02 else " "))
+        length += len(words[-1])
+    return "".join(words)[:size]
+
+
+def _count(text: str, model: str) -> int:
+    return token_counter(messages=[{"role": "user", "content": text}], model=model)
+
+
+def _binary_search_truncate(content: str, budget: int, model: str) -> tuple[str, int]:
+    """The previous implementation, returning (content, tokenizer passes)."""
+    passes = 0
+    left, right = 0, len(content)
+    optimal_length = 0
+    while left <= right:
+        mid = (left + right) // 2
+        passes += 1
+        if _count(content[:mid], model) <= budget:
+            optimal_length = mid
+            left = mid + 1
+        else:
+            right = mid - 1
+    return content[:optimal_length], passes
+
+
+def _time(fn, runs: int) -> tuple[float, object]:
+    latencies = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies), result
+
+
+def run_benchmark(model: str, sizes: list[int], budget: int, runs: int):
+    started = time.perf_counter()
+    get_tokenizer(model)
+    print(
+        f"model {model}, budget {budget} tokens, tokenizer loaded in "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms (cached afterwards)"
+    )
+
+    for size in sizes:
+        content = _synthetic_document(size)
+        search_s, (search_text, passes) = _time(
+            lambda content=content: _binary_search_truncate(content, budget, model),
+            runs,
+        )
+        single_s, single_text = _time(
+            lambda content=content: truncate_to_token_budget(content, budget, model),
+            runs,
+        )
+        print(f"\n{size:,} chars")
+        print(
+            f"  binary search  {search_s * 1000:10.1f} ms  {passes:3d} passes  "
+            f"{_count(search_text, model):,} tokens"
+        )
+        print(
+            f"  single pass    {single_s * 1000:10.1f} ms    1 pass    "
+            f"{_count(single_text, model):,} tokens"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 500_000, 2_000_000]
+    )
+    parser.add_argument("--budget", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.model, args.sizes, args.budget, args.runs)
@@ -0,0 +1,107 @@
+"""
+Compare per-connector and single-pass multi-connector knowledge base search.
+
+Runs `_combined_rrf_search` once per document type (the per-connector path) and
+`_combined_rrf_search_multi` once for all types (the single-pass path) against
+the configured database, checks that both return identical results and prints
+their latencies. The retrieval cache is disabled so both paths run their queries
+instead of reading each other's cached results.
+
+Usage (from surfsense_backend/):
+    python -m scripts.benchmarks.multi_connector_search \
+        --search-space-id 1 --query "quarterly roadmap" --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.agents.new_chat.tools.knowledge_base import (
+    _ALL_CONNECTORS,
+    _LIVE_SEARCH_CONNECTORS,
+)
+from app.agents.new_chat.utils import resolve_date_range
+from app.config import config
+from app.db import async_session_maker
+from app.services.connector_service import ConnectorService
+
+
+def _summarize(results: list[dict]) -> list[tuple]:
+    """Reduce results to the fields that must match between both paths."""
+    return [
+        (
+            item.get("document_id"),
+            round(item.get("score", 0.0), 12),
+            tuple(chunk.get("chunk_id") for chunk in item.get("chunks", [])),
+        )
+        for item in results
+    ]
+
+
+async def run_benchmark(search_space_id: int, query: str, top_k: int, runs: int):
+    # Read lazily by get_retrieval_cache, so it must be set before any search
+    config.RETRIEVAL_CACHE_ENABLED = False
+
+    document_types = [c for c in _ALL_CONNECTORS if c not in _LIVE_SEARCH_CONNECTORS]
+    start_date, end_date = resolve_date_range(start_date=None, end_date=None)
+
+    per_connector_times: list[float] = []
+    single_pass_times: list[float] = []
+    mismatches: set[str] = set()
+
+    for _ in range(runs):
+        async with async_session_maker() as session:
+            service = ConnectorService(session, search_space_id=search_space_id)
+
+            started = time.perf_counter()
+            per_connector = {
+                document_type: await service._combined_rrf_search(
+                    query_text=query,
+                    search_space_id=search_space_id,
+                    document_type=document_type,
+                    top_k=top_k,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                for document_type in document_types
+            }
+            per_connector_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            single_pass = await service._combined_rrf_search_multi(
+                query_text=query,
+                search_space_id=search_space_id,
+                document_types=document_types,
+                top_k=top_k,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            single_pass_times.append(time.perf_counter() - started)
+
+        for document_type in document_types:
+            if _summarize(per_connector[document_type]) != _summarize(
+                single_pass[document_type]
+            ):
+                mismatches.add(document_type)
+
+    print(f"Document types searched: {len(document_types)}")
+    print(
+        f"Per-connector: median {statistics.median(per_connector_times) * 1000:.1f} ms"
+    )
+    print(f"Single-pass:   median {statistics.median(single_pass_times) * 1000:.1f} ms")
+    if mismatches:
+        print(f"Result mismatches for: {', '.join(sorted(mismatches))}")
+    else:
+        print("Results identical for all document types")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--search-space-id", type=int, required=True)
+    parser.add_argument("--query", required=True)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.search_space_id, args.query, args.top_k, args.runs))
@@ -0,0 +1,166 @@
+"""
+Compare ORM entity loading and column projection for retrieval result rows.
+
+The hybrid search retrievers used to load their final result rows as ORM
+entities (`select(Chunk)` / `select(Document)` with joined documents and search
+spaces), which transfers every column of each document, including its full
+content, embedding and BlockNote JSON. They now select only the columns they
+serialize. For a sample of chunks and documents from one search space, this
+prints for both shapes:
+
+- bytes: server-side size of the rows the query returns (pg_column_size)
+- alloc: peak Python allocation while executing the query and reading rows
+- time:  median query latency
+
+Usage (from surfsense_backend/):
+    python -m scripts.benchmarks.retrieval_projection \
+        --search-space-id 1 --top-k 20 --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import joinedload
+
+from app.db import Chunk, Document, SearchSpace, async_session_maker
+
+
+def _loaded_columns(*models) -> list:
+    """Columns an entity load of the given models selects (deferred ones excluded)."""
+    columns = []
+    for model in models:
+        deferred = {prop.key for prop in model.__mapper__.column_attrs if prop.deferred}
+        columns.extend(c for c in model.__table__.columns if c.key not in deferred)
+    return columns
+
+
+def _shapes(chunk_ids: list[int], doc_ids: list[int]) -> dict[str, tuple]:
+    """(ORM statement, equivalent Core statement for sizing) per query shape."""
+    return {
+        "chunks/entity": (
+            select(Chunk)
+            .options(joinedload(Chunk.document).joinedload(Document.search_space))
+            .where(Chunk.id.in_(chunk_ids)),
+            select(*_loaded_columns(Chunk, Document, SearchSpace))
+            .select_from(Chunk)
+            .join(Document, Chunk.document_id == Document.id)
+            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
+            .where(Chunk.id.in_(chunk_ids)),
+        ),
+        "chunks/projected": (
+            select(
+                Chunk.id,
+                Chunk.document_id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
+            )
+            .join(Document, Chunk.document_id == Document.id)
+            .where(Chunk.id.in_(chunk_ids)),
+            None,
+        ),
+        "documents/entity": (
+            select(Document)
+            .options(joinedload(Document.search_space))
+            .where(Document.id.in_(doc_ids)),
+            select(*_loaded_columns(Document, SearchSpace))
+            .select_from(Document)
+            .join(SearchSpace, Document.search_space_id == SearchSpace.id)
+            .where(Document.id.in_(doc_ids)),
+        ),
+        "documents/projected": (
+            select(
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
+            ).where(Document.id.in_(doc_ids)),
+            None,
+        ),
+    }
+
+
+async def _result_bytes(session, statement) -> int:
+    rows = statement.subquery("q")
+    result = await session.execute(
+        select(
+            func.coalesce(func.sum(func.pg_column_size(literal_column("q"))), 0)
+        ).select_from(rows)
+    )
+    return int(result.scalar())
+
+
+async def _measure(statement, runs: int) -> tuple[float, int]:
+    latencies: list[float] = []
+    peaks: list[int] = []
+    for _ in range(runs):
+        # Fresh session so entities are not served from the identity map
+        async with async_session_maker() as session:
+            tracemalloc.start()
+            started = time.perf_counter()
+            result = await session.execute(statement)
+            rows = result.all()
+            latencies.append(time.perf_counter() - started)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            del rows
+    return statistics.median(latencies), statistics.median(peaks)
+
+
+async def run_benchmark(search_space_id: int, top_k: int, runs: int):
+    async with async_session_maker() as session:
+        chunk_ids = (
+            (
+                await session.execute(
+                    select(Chunk.id)
+                    .where(Chunk.search_space_id == search_space_id)
+                    .order_by(Chunk.id.desc())
+                    .limit(top_k)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        doc_ids = (
+            (
+                await session.execute(
+                    select(Document.id)
+                    .where(Document.search_space_id == search_space_id)
+                    .order_by(Document.id.desc())
+                    .limit(top_k)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    if not chunk_ids or not doc_ids:
+        print(f"Search space {search_space_id} has no indexed documents")
+        return
+
+    print(
+        f"search space {search_space_id}: {len(chunk_ids)} chunks, "
+        f"{len(doc_ids)} documents, {runs} runs"
+    )
+    for name, (statement, sizing_statement) in _shapes(chunk_ids, doc_ids).items():
+        async with async_session_maker() as session:
+            size = await _result_bytes(session, sizing_statement or statement)
+        latency, peak = await _measure(statement, runs)
+        print(
+            f"  {name:<20} bytes {size:>12,}  alloc {peak:>12,}  "
+            f"time {latency * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--search-space-id", type=int, required=True)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.search_space_id, args.top_k, args.runs))
@@ -0,0 +1,146 @@
+"""
+Measure filtered vector search recall and latency as the number of tenants grows.
+
+For each tenant count, builds a temporary table of random chunk embeddings
+spread evenly across search spaces, with the same HNSW index and
+(search_space_id) filter column layout as `chunks`. Each query asks for the
+top-k neighbours within one search space and is run:
+
+- exact:     sequential scan, used as ground truth
+- post-filter: HNSW scan with the search space filter applied afterwards
+- iterative: HNSW scan with hnsw.iterative_scan (pgvector >= 0.8)
+
+and recall@k against the exact results and median latency are printed.
+
+Usage (from surfsense_backend/):
+    python -m scripts.benchmarks.tenant_vector_search \
+        --rows 50000 --tenants 1 10 100 --dimension 384
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.db import engine
+
+
+def _random_vector(dimension: int) -> str:
+    return "[" + ",".join(f"{random.random():.5f}" for _ in range(dimension)) + "]"
+
+
+async def _build_table(conn, rows: int, tenants: int, dimension: int) -> None:
+    await conn.execute(text("DROP TABLE IF EXISTS bench_chunks"))
+    await conn.execute(
+        text(
+            f"CREATE TEMP TABLE bench_chunks ("
+            f"id serial PRIMARY KEY, search_space_id int NOT NULL, "
+            f"embedding vector({dimension}) NOT NULL)"
+        )
+    )
+    await conn.execute(
+        text(
+            f"""
+            INSERT INTO bench_chunks (search_space_id, embedding)
+            SELECT i % {tenants},
+                   (SELECT array_agg(random())::vector({dimension})
+                    FROM generate_series(1, {dimension}) WHERE i IS NOT NULL)
+            FROM generate_series(1, {rows}) AS i
+            """
+        )
+    )
+    await conn.execute(
+        text("CREATE INDEX ON bench_chunks USING hnsw (embedding vector_cosine_ops)")
+    )
+    await conn.execute(text("CREATE INDEX ON bench_chunks (search_space_id)"))
+    await conn.execute(text("ANALYZE bench_chunks"))
+
+
+async def _top_k(conn, embedding: str, tenant: int, top_k: int) -> tuple[set, float]:
+    started = time.perf_counter()
+    result = await conn.execute(
+        text(
+            "SELECT id FROM bench_chunks WHERE search_space_id = :tenant "
+            "ORDER BY embedding <=> CAST(:embedding AS vector) LIMIT :top_k"
+        ),
+        {"tenant": tenant, "embedding": embedding, "top_k": top_k},
+    )
+    ids = {row[0] for row in result}
+    return ids, time.perf_counter() - started
+
+
+async def _run_mode(conn, mode: str, queries, top_k: int, truth=None):
+    settings = {
+        "exact": ["SET LOCAL enable_indexscan = off"],
+        # Iterative scans are off by default
+        "post-filter": [],
+        "iterative": ["SET LOCAL hnsw.iterative_scan = strict_order"],
+    }[mode]
+
+    results, latencies = [], []
+    for embedding, tenant in queries:
+        async with conn.begin_nested():
+            for statement in settings:
+                await conn.execute(text(statement))
+            ids, latency = await _top_k(conn, embedding, tenant, top_k)
+        results.append(ids)
+        latencies.append(latency)
+
+    recall = None
+    if truth is not None:
+        recall = statistics.mean(
+            len(found & expected) / max(1, len(expected))
+            for found, expected in zip(results, truth, strict=True)
+        )
+    return results, statistics.median(latencies), recall
+
+
+async def run_benchmark(
+    rows: int, tenant_counts: list[int], dimension: int, queries: int, top_k: int
+):
+    async with engine.connect() as conn:
+        version = (
+            await conn.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            )
+        ).scalar()
+        print(f"pgvector {version}, {rows} rows, dimension {dimension}, k={top_k}")
+
+        for tenants in tenant_counts:
+            async with conn.begin():
+                await _build_table(conn, rows, tenants, dimension)
+                sample = [
+                    (_random_vector(dimension), random.randrange(tenants))
+                    for _ in range(queries)
+                ]
+
+                truth, exact_ms, _ = await _run_mode(conn, "exact", sample, top_k)
+                print(f"\ntenants={tenants}")
+                print(f"  exact        {exact_ms * 1000:8.2f} ms  recall 1.000")
+                for mode in ("post-filter", "iterative"):
+                    try:
+                        _, latency, recall = await _run_mode(
+                            conn, mode, sample, top_k, truth
+                        )
+                        print(
+                            f"  {mode:<12} {latency * 1000:8.2f} ms  recall {recall:.3f}"
+                        )
+                    except Exception as e:
+                        print(f"  {mode:<12} unavailable: {e.__class__.__name__}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--tenants", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(args.rows, args.tenants, args.dimension, args.queries, args.top_k)
+    )